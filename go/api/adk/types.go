@@ -381,8 +381,30 @@ func ModelToEmbeddingConfig(m Model) *EmbeddingConfig {
 
 // MemoryConfig groups all memory-related configuration.
 type MemoryConfig struct {
-	TTLDays   int              `json:"ttl_days,omitempty"`
-	Embedding *EmbeddingConfig `json:"embedding,omitempty"`
+	TTLDays         int              `json:"ttl_days,omitempty"`
+	Embedding       *EmbeddingConfig `json:"embedding,omitempty"`
+	SummarizerModel Model            `json:"summarizer_model,omitempty"`
+}
+
+func (m *MemoryConfig) UnmarshalJSON(data []byte) error {
+	var tmp struct {
+		TTLDays         int              `json:"ttl_days,omitempty"`
+		Embedding       *EmbeddingConfig `json:"embedding,omitempty"`
+		SummarizerModel json.RawMessage  `json:"summarizer_model,omitempty"`
+	}
+	if err := json.Unmarshal(data, &tmp); err != nil {
+		return err
+	}
+	m.TTLDays = tmp.TTLDays
+	m.Embedding = tmp.Embedding
+	if len(tmp.SummarizerModel) > 0 && string(tmp.SummarizerModel) != "null" {
+		model, err := ParseModel(tmp.SummarizerModel)
+		if err != nil {
+			return fmt.Errorf("failed to parse summarizer model: %w", err)
+		}
+		m.SummarizerModel = model
+	}
+	return nil
 }
 
 type NetworkConfig struct {
@@ -833,6 +833,41 @@ func TestAgentCompressionConfig_UnmarshalJSON_InvalidSummarizer(t *testing.T) {
 	}
 }
 
+func TestMemoryConfig_UnmarshalJSON_WithSummarizer(t *testing.T) {
+	data := []byte(`{
+		"ttl_days": 15,
+		"embedding": {"provider":"openai","model":"text-embedding-3-small"},
+		"summarizer_model": {"type":"openai","model":"gpt-4o-mini"}
+	}`)
+	var mem MemoryConfig
+	if err := json.Unmarshal(data, &mem); err != nil {
+		t.Fatalf("UnmarshalJSON() error = %v", err)
+	}
+	if mem.TTLDays != 15 {
+		t.Errorf("TTLDays = %d, want 15", mem.TTLDays)
+	}
+	if mem.Embedding == nil || mem.Embedding.Model != "text-embedding-3-small" {
+		t.Errorf("Embedding = %+v, want model text-embedding-3-small", mem.Embedding)
+	}
+	if mem.SummarizerModel == nil {
+		t.Fatal("SummarizerModel should not be nil")
+	}
+	if mem.SummarizerModel.GetType() != ModelTypeOpenAI {
+		t.Errorf("SummarizerModel.GetType() = %q, want %q", mem.SummarizerModel.GetType(), ModelTypeOpenAI)
+	}
+}
+
+func TestMemoryConfig_UnmarshalJSON_NoSummarizer(t *testing.T) {
+	data := []byte(`{"ttl_days": 15}`)
+	var mem MemoryConfig
+	if err := json.Unmarshal(data, &mem); err != nil {
+		t.Fatalf("UnmarshalJSON() error = %v", err)
+	}
+	if mem.SummarizerModel != nil {
+		t.Error("SummarizerModel should be nil when not provided")
+	}
+}
+
 func TestEmbeddingConfig_UnmarshalJSON_ProviderField(t *testing.T) {
 	data := []byte(`{"provider":"openai","model":"text-embedding-3-small","base_url":"https://api.openai.com"}`)
 	var cfg EmbeddingConfig
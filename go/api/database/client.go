@@ -11,8 +11,8 @@ import (
 
 type QueryOptions struct {
 	Limit    int
-	After    time.Time
-	OrderAsc bool // When true, order results by created_at ASC (chronological). Default is DESC (newest first).
+	After    time.Time // When set, only events created at or after this time are returned. Callers dedupe by ID.
+	OrderAsc bool      // When true, order results by created_at ASC (chronological). Default is DESC (newest first).
 }
 type LangGraphCheckpointTuple struct {
 	Checkpoint *LangGraphCheckpoint
@@ -29,6 +29,9 @@ type Client interface {
 	StoreToolServer(ctx context.Context, toolServer *ToolServer) (*ToolServer, error)
 	StoreEvents(ctx context.Context, messages ...*Event) error
 
+	// Update methods
+	UpdateTask(ctx context.Context, taskID string, update func(task *protocol.Task) error) error
+
 	// Delete methods
 	DeleteSession(ctx context.Context, sessionID string, userID string) error
 	DeleteAgent(ctx context.Context, agentID string) error
@@ -337,6 +337,12 @@ type MemorySpec struct {
 	// +kubebuilder:validation:Required
 	ModelConfig string `json:"modelConfig"`
 
+	// SummarizerModelConfig is the name of the ModelConfig object whose model
+	// summarizes sessions before they are saved to memory. Defaults to the
+	// agent's own model when unset.
+	// +optional
+	SummarizerModelConfig *string `json:"summarizerModelConfig,omitempty"`
+
 	// TTLDays controls how many days a stored memory entry remains valid before
 	// it is eligible for pruning. Defaults to 15 days when unset or zero.
 	// +optional
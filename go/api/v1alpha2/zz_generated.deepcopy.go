@@ -488,7 +488,7 @@ func (in *DeclarativeAgentSpec) DeepCopyInto(out *DeclarativeAgentSpec) {
 	if in.Memory != nil {
 		in, out := &in.Memory, &out.Memory
 		*out = new(MemorySpec)
-		**out = **in
+		(*in).DeepCopyInto(*out)
 	}
 	if in.Context != nil {
 		in, out := &in.Context, &out.Context
@@ -623,6 +623,11 @@ func (in *McpServerTool) DeepCopy() *McpServerTool {
 // DeepCopyInto is an autogenerated deepcopy function, copying the receiver, writing into out. in must be non-nil.
 func (in *MemorySpec) DeepCopyInto(out *MemorySpec) {
 	*out = *in
+	if in.SummarizerModelConfig != nil {
+		in, out := &in.SummarizerModelConfig, &out.SummarizerModelConfig
+		*out = new(string)
+		**out = **in
+	}
 }
 
 // DeepCopy is an autogenerated deepcopy function, copying the receiver, creating a new MemorySpec.
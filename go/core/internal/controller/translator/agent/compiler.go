@@ -249,6 +249,23 @@ func (a *adkApiTranslator) translateInlineAgent(ctx context.Context, agent v1alp
 		if spec.Declarative.Memory.ModelConfig != spec.Declarative.ModelConfig {
 			secretHashBytes = append(secretHashBytes, embHash...)
 		}
+
+		// Without a summarizer model the runtime summarizes with the agent's own model.
+		summarizerModelName := ""
+		if spec.Declarative.Memory.SummarizerModelConfig != nil {
+			summarizerModelName = *spec.Declarative.Memory.SummarizerModelConfig
+		}
+		if summarizerModelName != "" && summarizerModelName != spec.Declarative.ModelConfig {
+			summarizerModel, summarizerMdd, summarizerSecretHash, err := a.translateModel(ctx, agent.GetNamespace(), summarizerModelName)
+			if err != nil {
+				return nil, nil, nil, fmt.Errorf("failed to translate memory summarizer model config %q: %w", summarizerModelName, err)
+			}
+			cfg.Memory.SummarizerModel = summarizerModel
+			mergeDeploymentData(mdd, summarizerMdd)
+			if summarizerModelName != spec.Declarative.Memory.ModelConfig {
+				secretHashBytes = append(secretHashBytes, summarizerSecretHash...)
+			}
+		}
 	}
 
 	// Translate retry policy configuration
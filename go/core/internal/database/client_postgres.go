@@ -146,17 +146,23 @@ func (c *postgresClient) DeleteSession(ctx context.Context, sessionID, userID st
 // ── Events ────────────────────────────────────────────────────────────────────
 
 func (c *postgresClient) StoreEvents(ctx context.Context, events ...*dbpkg.Event) error {
-	for _, e := range events {
-		if err := c.q.InsertEvent(ctx, dbgen.InsertEventParams{
-			ID:        e.ID,
-			UserID:    e.UserID,
-			SessionID: strPtrIfNotEmpty(e.SessionID),
-			Data:      e.Data,
-		}); err != nil {
-			return fmt.Errorf("failed to store event %s: %w", e.ID, err)
+	// A batch is stored atomically so that a failed batch can be retried as a whole.
+	// Events already stored are skipped, so retrying a batch whose response was lost
+	// succeeds, and created_at comes from clock_timestamp() rather than the
+	// transaction start time so events of a batch keep their order.
+	return c.withTx(ctx, func(q *dbgen.Queries) error {
+		for _, e := range events {
+			if err := q.InsertEvent(ctx, dbgen.InsertEventParams{
+				ID:        e.ID,
+				UserID:    e.UserID,
+				SessionID: strPtrIfNotEmpty(e.SessionID),
+				Data:      e.Data,
+			}); err != nil {
+				return fmt.Errorf("failed to store event %s: %w", e.ID, err)
+			}
 		}
-	}
-	return nil
+		return nil
+	})
 }
 
 func (c *postgresClient) ListEventsForSession(ctx context.Context, sessionID, userID string, opts dbpkg.QueryOptions) ([]*dbpkg.Event, error) {
@@ -219,6 +225,35 @@ func (c *postgresClient) GetTask(ctx context.Context, taskID string) (*protocol.
 	return &task, nil
 }
 
+// UpdateTask applies update to the stored task and stores the result. The task
+// row is locked until the transaction ends, so concurrent updates of a task are
+// applied one after the other instead of overwriting each other. Errors returned
+// by update abort the update and are returned as is.
+func (c *postgresClient) UpdateTask(ctx context.Context, taskID string, update func(*protocol.Task) error) error {
+	return c.withTx(ctx, func(q *dbgen.Queries) error {
+		row, err := q.GetTaskForUpdate(ctx, taskID)
+		if err != nil {
+			return fmt.Errorf("failed to get task %s: %w", taskID, err)
+		}
+		var task protocol.Task
+		if err := json.Unmarshal([]byte(row.Data), &task); err != nil {
+			return fmt.Errorf("failed to deserialize task: %w", err)
+		}
+		if err := update(&task); err != nil {
+			return err
+		}
+		data, err := json.Marshal(&task)
+		if err != nil {
+			return fmt.Errorf("failed to serialize task: %w", err)
+		}
+		return q.UpsertTask(ctx, dbgen.UpsertTaskParams{
+			ID:        task.ID,
+			Data:      string(data),
+			SessionID: strPtrIfNotEmpty(task.ContextID),
+		})
+	})
+}
+
 func (c *postgresClient) ListTasksForSession(ctx context.Context, sessionID string) ([]*protocol.Task, error) {
 	rows, err := c.q.ListTasksForSession(ctx, &sessionID)
 	if err != nil {
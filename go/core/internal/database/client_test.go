@@ -272,6 +272,34 @@ func TestListEventsForSession(t *testing.T) {
 	}
 }
 
+func TestStoreEventsBatch(t *testing.T) {
+	db := setupTestDB(t)
+	client := NewClient(db)
+	ctx := context.Background()
+	userID := "test-user"
+	sessionID := "test-session"
+
+	events := make([]*dbpkg.Event, 5)
+	for i := range events {
+		events[i] = &dbpkg.Event{
+			ID:        fmt.Sprintf("event-%d", i),
+			SessionID: sessionID,
+			UserID:    userID,
+			Data:      "{}",
+		}
+	}
+	require.NoError(t, client.StoreEvents(ctx, events...))
+	// A retried batch, e.g. after a lost response, is accepted without duplicating events
+	require.NoError(t, client.StoreEvents(ctx, events...))
+
+	stored, err := client.ListEventsForSession(ctx, sessionID, userID, dbpkg.QueryOptions{OrderAsc: true})
+	require.NoError(t, err)
+	require.Len(t, stored, len(events))
+	for i, event := range stored {
+		assert.Equal(t, fmt.Sprintf("event-%d", i), event.ID)
+	}
+}
+
 func TestListEventsForSessionOrdering(t *testing.T) {
 	db := setupTestDB(t)
 	client := NewClient(db)
@@ -123,6 +123,9 @@ func (c *InMemoryFakeClient) StoreEvents(_ context.Context, events ...*database.
 	defer c.mu.Unlock()
 
 	for _, event := range events {
+		if _, exists := c.events[event.ID]; exists {
+			continue
+		}
 		c.events[event.ID] = event
 		c.eventsBySession[event.SessionID] = append(c.eventsBySession[event.SessionID], event)
 	}
@@ -534,12 +537,30 @@ func (c *InMemoryFakeClient) UpdateAgent(_ context.Context, agent *database.Agen
 	return nil
 }
 
-// UpdateTask updates a task record
-func (c *InMemoryFakeClient) UpdateTask(_ context.Context, task *database.Task) error {
+// UpdateTask applies update to a stored task while holding the client lock
+func (c *InMemoryFakeClient) UpdateTask(_ context.Context, taskID string, update func(*protocol.Task) error) error {
 	c.mu.Lock()
 	defer c.mu.Unlock()
 
-	c.tasks[task.ID] = task
+	stored, exists := c.tasks[taskID]
+	if !exists {
+		return pgx.ErrNoRows
+	}
+	task := &protocol.Task{}
+	if err := json.Unmarshal([]byte(stored.Data), task); err != nil {
+		return err
+	}
+	if err := update(task); err != nil {
+		return err
+	}
+	jsn, err := json.Marshal(task)
+	if err != nil {
+		return err
+	}
+	c.tasks[task.ID] = &database.Task{
+		ID:   task.ID,
+		Data: string(jsn),
+	}
 	return nil
 }
 
@@ -38,7 +38,8 @@ func (q *Queries) GetEvent(ctx context.Context, arg GetEventParams) (Event, erro
 
 const insertEvent = `-- name: InsertEvent :exec
 INSERT INTO event (id, user_id, session_id, data, created_at, updated_at)
-VALUES ($1, $2, $3, $4, NOW(), NOW())
+VALUES ($1, $2, $3, $4, clock_timestamp(), clock_timestamp())
+ON CONFLICT (id, user_id) DO NOTHING
 `
 
 type InsertEventParams struct {
@@ -135,7 +136,7 @@ func (q *Queries) ListEventsByContextIDLimit(ctx context.Context, arg ListEvents
 const listEventsForSessionAsc = `-- name: ListEventsForSessionAsc :many
 SELECT id, user_id, session_id, created_at, updated_at, deleted_at, data FROM event
 WHERE session_id = $1 AND user_id = $2 AND deleted_at IS NULL
-  AND ($3::timestamptz IS NULL OR created_at > $3)
+  AND ($3::timestamptz IS NULL OR created_at >= $3)
 ORDER BY created_at ASC
 `
 
@@ -176,7 +177,7 @@ func (q *Queries) ListEventsForSessionAsc(ctx context.Context, arg ListEventsFor
 const listEventsForSessionAscLimit = `-- name: ListEventsForSessionAscLimit :many
 SELECT id, user_id, session_id, created_at, updated_at, deleted_at, data FROM event
 WHERE session_id = $1 AND user_id = $2 AND deleted_at IS NULL
-  AND ($3::timestamptz IS NULL OR created_at > $3)
+  AND ($3::timestamptz IS NULL OR created_at >= $3)
 ORDER BY created_at ASC
 LIMIT $4
 `
@@ -224,7 +225,7 @@ func (q *Queries) ListEventsForSessionAscLimit(ctx context.Context, arg ListEven
 const listEventsForSessionDesc = `-- name: ListEventsForSessionDesc :many
 SELECT id, user_id, session_id, created_at, updated_at, deleted_at, data FROM event
 WHERE session_id = $1 AND user_id = $2 AND deleted_at IS NULL
-  AND ($3::timestamptz IS NULL OR created_at > $3)
+  AND ($3::timestamptz IS NULL OR created_at >= $3)
 ORDER BY created_at DESC
 `
 
@@ -265,7 +266,7 @@ func (q *Queries) ListEventsForSessionDesc(ctx context.Context, arg ListEventsFo
 const listEventsForSessionDescLimit = `-- name: ListEventsForSessionDescLimit :many
 SELECT id, user_id, session_id, created_at, updated_at, deleted_at, data FROM event
 WHERE session_id = $1 AND user_id = $2 AND deleted_at IS NULL
-  AND ($3::timestamptz IS NULL OR created_at > $3)
+  AND ($3::timestamptz IS NULL OR created_at >= $3)
 ORDER BY created_at DESC
 LIMIT $4
 `
@@ -29,6 +29,27 @@ func (q *Queries) GetTask(ctx context.Context, id string) (Task, error) {
 	return i, err
 }
 
+const getTaskForUpdate = `-- name: GetTaskForUpdate :one
+SELECT id, created_at, updated_at, deleted_at, data, session_id FROM task
+WHERE id = $1 AND deleted_at IS NULL
+LIMIT 1
+FOR UPDATE
+`
+
+func (q *Queries) GetTaskForUpdate(ctx context.Context, id string) (Task, error) {
+	row := q.db.QueryRow(ctx, getTaskForUpdate, id)
+	var i Task
+	err := row.Scan(
+		&i.ID,
+		&i.CreatedAt,
+		&i.UpdatedAt,
+		&i.DeletedAt,
+		&i.Data,
+		&i.SessionID,
+	)
+	return i, err
+}
+
 const listTasksForSession = `-- name: ListTasksForSession :many
 SELECT id, created_at, updated_at, deleted_at, data, session_id FROM task
 WHERE session_id = $1 AND deleted_at IS NULL
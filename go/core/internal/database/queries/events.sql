@@ -1,6 +1,7 @@
 -- name: InsertEvent :exec
 INSERT INTO event (id, user_id, session_id, data, created_at, updated_at)
-VALUES ($1, $2, $3, $4, NOW(), NOW());
+VALUES ($1, $2, $3, $4, clock_timestamp(), clock_timestamp())
+ON CONFLICT (id, user_id) DO NOTHING;
 
 -- name: GetEvent :one
 SELECT * FROM event
@@ -10,26 +11,26 @@ LIMIT 1;
 -- name: ListEventsForSessionAsc :many
 SELECT * FROM event
 WHERE session_id = $1 AND user_id = $2 AND deleted_at IS NULL
-  AND ($3::timestamptz IS NULL OR created_at > $3)
+  AND ($3::timestamptz IS NULL OR created_at >= $3)
 ORDER BY created_at ASC;
 
 -- name: ListEventsForSessionDesc :many
 SELECT * FROM event
 WHERE session_id = $1 AND user_id = $2 AND deleted_at IS NULL
-  AND ($3::timestamptz IS NULL OR created_at > $3)
+  AND ($3::timestamptz IS NULL OR created_at >= $3)
 ORDER BY created_at DESC;
 
 -- name: ListEventsForSessionAscLimit :many
 SELECT * FROM event
 WHERE session_id = $1 AND user_id = $2 AND deleted_at IS NULL
-  AND ($3::timestamptz IS NULL OR created_at > $3)
+  AND ($3::timestamptz IS NULL OR created_at >= $3)
 ORDER BY created_at ASC
 LIMIT $4;
 
 -- name: ListEventsForSessionDescLimit :many
 SELECT * FROM event
 WHERE session_id = $1 AND user_id = $2 AND deleted_at IS NULL
-  AND ($3::timestamptz IS NULL OR created_at > $3)
+  AND ($3::timestamptz IS NULL OR created_at >= $3)
 ORDER BY created_at DESC
 LIMIT $4;
 
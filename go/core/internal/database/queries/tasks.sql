@@ -3,6 +3,12 @@ SELECT * FROM task
 WHERE id = $1 AND deleted_at IS NULL
 LIMIT 1;
 
+-- name: GetTaskForUpdate :one
+SELECT * FROM task
+WHERE id = $1 AND deleted_at IS NULL
+LIMIT 1
+FOR UPDATE;
+
 -- name: TaskExists :one
 SELECT EXISTS (
     SELECT 1 FROM task WHERE id = $1 AND deleted_at IS NULL
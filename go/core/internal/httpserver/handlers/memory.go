@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"log"
 	"net/http"
+	"sort"
 	"time"
 
 	"github.com/kagent-dev/kagent/go/api/database"
@@ -60,11 +61,12 @@ type SearchSessionMemoryResponse struct {
 
 // ListMemoryResponse represents a single memory item for the list endpoint
 type ListMemoryResponse struct {
-	ID          string `json:"id"`
-	Content     string `json:"content"`
-	AccessCount int    `json:"access_count"`
-	CreatedAt   string `json:"created_at"`
-	ExpiresAt   string `json:"expires_at,omitempty"`
+	ID          string    `json:"id"`
+	Content     string    `json:"content"`
+	AccessCount int       `json:"access_count"`
+	CreatedAt   string    `json:"created_at"`
+	ExpiresAt   string    `json:"expires_at,omitempty"`
+	Vector      []float32 `json:"vector,omitempty"`
 }
 
 // AddSession handles POST /api/memories/sessions
@@ -215,10 +217,15 @@ func (h *MemoryHandler) Search(w ErrorResponseWriter, r *http.Request) {
 		return
 	}
 
+	RespondWithJSON(w, http.StatusOK, toSearchResponse(results, req.MinScore))
+}
+
+// toSearchResponse converts search results to response items, dropping results below minScore
+func toSearchResponse(results []database.AgentMemorySearchResult, minScore float64) []SearchSessionMemoryResponse {
 	response := make([]SearchSessionMemoryResponse, 0, len(results))
 	for _, res := range results {
 		// Filter by MinScore if provided
-		if req.MinScore > 0 && res.Score < req.MinScore {
+		if minScore > 0 && res.Score < minScore {
 			continue
 		}
 
@@ -236,14 +243,95 @@ func (h *MemoryHandler) Search(w ErrorResponseWriter, r *http.Request) {
 			CreatedAt: res.CreatedAt,
 		})
 	}
+	return response
+}
 
-	RespondWithJSON(w, http.StatusOK, response)
+// SearchSessionMemoryBatchRequest represents the request body for searching memory with several query vectors
+type SearchSessionMemoryBatchRequest struct {
+	AgentName string      `json:"agent_name"`
+	UserID    string      `json:"user_id"`
+	Vectors   [][]float32 `json:"vectors"`
+	Limit     int         `json:"limit"`     // Maximum number of results per query vector
+	MinScore  float64     `json:"min_score"` // Minimum similarity score (0-1)
+	PerQuery  bool        `json:"per_query"` // Return the results of each query vector instead of merging them
+}
+
+// SearchBatch handles POST /api/memories/search/batch. It searches memory once per
+// query vector and returns the merged results, deduplicated by ID with the best
+// score kept, ordered by descending score. With per_query set, it returns the
+// ranked results of each query vector instead, so that clients can fuse them.
+func (h *MemoryHandler) SearchBatch(w ErrorResponseWriter, r *http.Request) {
+	var req SearchSessionMemoryBatchRequest
+	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+		RespondWithError(w, http.StatusBadRequest, "Invalid request body")
+		return
+	}
+
+	if req.AgentName == "" || req.UserID == "" || len(req.Vectors) == 0 {
+		RespondWithError(w, http.StatusBadRequest, "Missing required fields (agent_name, user_id, vectors)")
+		return
+	}
+
+	if len(req.Vectors) > memoryMaxBatchSize {
+		RespondWithError(w, http.StatusBadRequest, fmt.Sprintf("batch size %d exceeds maximum of %d", len(req.Vectors), memoryMaxBatchSize))
+		return
+	}
+
+	for i, v := range req.Vectors {
+		if len(v) != memoryVectorDimension {
+			RespondWithError(w, http.StatusBadRequest, fmt.Sprintf("vector %d must have exactly %d dimensions, got %d", i, memoryVectorDimension, len(v)))
+			return
+		}
+	}
+
+	if req.Limit <= 0 {
+		req.Limit = 5
+	}
+
+	perQuery := make([][]SearchSessionMemoryResponse, 0, len(req.Vectors))
+	merged := make([]SearchSessionMemoryResponse, 0)
+	index := make(map[string]int)
+	for _, v := range req.Vectors {
+		results, err := h.DatabaseService.SearchAgentMemory(r.Context(), req.AgentName, req.UserID, pgvector.NewVector(v), req.Limit)
+		if err != nil {
+			RespondWithError(w, http.StatusInternalServerError, fmt.Sprintf("search failed: %v", err))
+			return
+		}
+		items := toSearchResponse(results, req.MinScore)
+		if req.PerQuery {
+			perQuery = append(perQuery, items)
+			continue
+		}
+		for _, item := range items {
+			if i, ok := index[item.ID]; ok {
+				if item.Score > merged[i].Score {
+					merged[i].Score = item.Score
+				}
+				continue
+			}
+			index[item.ID] = len(merged)
+			merged = append(merged, item)
+		}
+	}
+
+	if req.PerQuery {
+		RespondWithJSON(w, http.StatusOK, perQuery)
+		return
+	}
+
+	sort.SliceStable(merged, func(i, j int) bool {
+		return merged[i].Score > merged[j].Score
+	})
+
+	RespondWithJSON(w, http.StatusOK, merged)
 }
 
 // List handles GET /api/memories and returns all memories for an agent+user, ranked by access frequency
 func (h *MemoryHandler) List(w ErrorResponseWriter, r *http.Request) {
 	agentName := r.URL.Query().Get("agent_name")
 	userID := r.URL.Query().Get("user_id")
+	// Agents that keep a local memory index sync it with the embeddings.
+	includeVectors := r.URL.Query().Get("include_vectors") == "true"
 
 	if agentName == "" || userID == "" {
 		RespondWithError(w, http.StatusBadRequest, "Missing required query parameters (agent_name, user_id)")
@@ -268,6 +356,9 @@ func (h *MemoryHandler) List(w ErrorResponseWriter, r *http.Request) {
 		if m.ExpiresAt != nil {
 			item.ExpiresAt = m.ExpiresAt.Format(time.RFC3339)
 		}
+		if includeVectors {
+			item.Vector = m.Embedding.Slice()
+		}
 		response = append(response, item)
 	}
 
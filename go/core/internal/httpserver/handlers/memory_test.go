@@ -183,6 +183,94 @@ func TestMemoryHandler(t *testing.T) {
 		})
 	})
 
+	t.Run("SearchBatch", func(t *testing.T) {
+		t.Run("MergesResultsByID", func(t *testing.T) {
+			handler, responseRecorder := setupHandler()
+
+			mixed := makeVector(768, 0.1)
+			for i := 0; i < len(mixed)/2; i++ {
+				mixed[i] = -0.1
+			}
+			addBody, _ := json.Marshal(handlers.AddSessionMemoryBatchRequest{
+				Items: []handlers.AddSessionMemoryRequest{
+					{AgentName: "test-agent", UserID: "user123", Content: "First item", Vector: makeVector(768, 0.1)},
+					{AgentName: "test-agent", UserID: "user123", Content: "Second item", Vector: mixed},
+				},
+			})
+			addReq := httptest.NewRequest("POST", "/api/memories/sessions/batch", bytes.NewBuffer(addBody))
+			handler.AddSessionBatch(newMockErrorResponseWriter(), setUser(addReq, "test-user"))
+
+			reqBody := handlers.SearchSessionMemoryBatchRequest{
+				AgentName: "test-agent",
+				UserID:    "user123",
+				Vectors:   [][]float32{makeVector(768, 0.1), mixed},
+				Limit:     5,
+			}
+			jsonBody, _ := json.Marshal(reqBody)
+			req := httptest.NewRequest("POST", "/api/memories/search/batch", bytes.NewBuffer(jsonBody))
+			req = setUser(req, "test-user")
+
+			handler.SearchBatch(responseRecorder, req)
+
+			assert.Equal(t, http.StatusOK, responseRecorder.Code)
+			var response []handlers.SearchSessionMemoryResponse
+			require.NoError(t, json.Unmarshal(responseRecorder.Body.Bytes(), &response))
+			require.Len(t, response, 2)
+			assert.NotEqual(t, response[0].ID, response[1].ID)
+			// Each memory is an exact match for one of the query vectors
+			assert.InDelta(t, 1.0, response[0].Score, 1e-6)
+			assert.InDelta(t, 1.0, response[1].Score, 1e-6)
+		})
+
+		t.Run("PerQuery", func(t *testing.T) {
+			handler, responseRecorder := setupHandler()
+
+			addBody, _ := json.Marshal(handlers.AddSessionMemoryRequest{
+				AgentName: "test-agent", UserID: "user123", Content: "Only item", Vector: makeVector(768, 0.1),
+			})
+			addReq := httptest.NewRequest("POST", "/api/memories/sessions", bytes.NewBuffer(addBody))
+			handler.AddSession(newMockErrorResponseWriter(), setUser(addReq, "test-user"))
+
+			reqBody := handlers.SearchSessionMemoryBatchRequest{
+				AgentName: "test-agent",
+				UserID:    "user123",
+				Vectors:   [][]float32{makeVector(768, 0.1), makeVector(768, 0.1)},
+				Limit:     5,
+				PerQuery:  true,
+			}
+			jsonBody, _ := json.Marshal(reqBody)
+			req := httptest.NewRequest("POST", "/api/memories/search/batch", bytes.NewBuffer(jsonBody))
+			req = setUser(req, "test-user")
+
+			handler.SearchBatch(responseRecorder, req)
+
+			assert.Equal(t, http.StatusOK, responseRecorder.Code)
+			var response [][]handlers.SearchSessionMemoryResponse
+			require.NoError(t, json.Unmarshal(responseRecorder.Body.Bytes(), &response))
+			require.Len(t, response, 2)
+			require.Len(t, response[0], 1)
+			require.Len(t, response[1], 1)
+			assert.Equal(t, response[0][0].ID, response[1][0].ID)
+		})
+
+		t.Run("WrongVectorDimension", func(t *testing.T) {
+			handler, responseRecorder := setupHandler()
+
+			reqBody := handlers.SearchSessionMemoryBatchRequest{
+				AgentName: "test-agent",
+				UserID:    "user123",
+				Vectors:   [][]float32{makeVector(768, 0.1), makeVector(16, 0.1)},
+			}
+			jsonBody, _ := json.Marshal(reqBody)
+			req := httptest.NewRequest("POST", "/api/memories/search/batch", bytes.NewBuffer(jsonBody))
+			req = setUser(req, "test-user")
+
+			handler.SearchBatch(responseRecorder, req)
+
+			assert.Equal(t, http.StatusBadRequest, responseRecorder.Code)
+		})
+	})
+
 	t.Run("List", func(t *testing.T) {
 		t.Run("Success", func(t *testing.T) {
 			handler, responseRecorder := setupHandler()
@@ -197,6 +285,33 @@ func TestMemoryHandler(t *testing.T) {
 			require.NoError(t, json.Unmarshal(responseRecorder.Body.Bytes(), &response))
 		})
 
+		t.Run("IncludeVectors", func(t *testing.T) {
+			handler, responseRecorder := setupHandler()
+
+			addBody, _ := json.Marshal(handlers.AddSessionMemoryRequest{
+				AgentName: "test-agent", UserID: "user123", Content: "First item", Vector: makeVector(768, 0.1),
+			})
+			addReq := httptest.NewRequest("POST", "/api/memories/sessions", bytes.NewBuffer(addBody))
+			handler.AddSession(newMockErrorResponseWriter(), setUser(addReq, "test-user"))
+
+			withoutVectors := newMockErrorResponseWriter()
+			req := httptest.NewRequest("GET", "/api/memories?agent_name=test-agent&user_id=user123", nil)
+			handler.List(withoutVectors, setUser(req, "test-user"))
+			var plain []handlers.ListMemoryResponse
+			require.NoError(t, json.Unmarshal(withoutVectors.Body.Bytes(), &plain))
+			require.Len(t, plain, 1)
+			assert.Nil(t, plain[0].Vector)
+
+			req = httptest.NewRequest("GET", "/api/memories?agent_name=test-agent&user_id=user123&include_vectors=true", nil)
+			handler.List(responseRecorder, setUser(req, "test-user"))
+
+			assert.Equal(t, http.StatusOK, responseRecorder.Code)
+			var response []handlers.ListMemoryResponse
+			require.NoError(t, json.Unmarshal(responseRecorder.Body.Bytes(), &response))
+			require.Len(t, response, 1)
+			assert.Len(t, response[0].Vector, 768)
+		})
+
 		t.Run("MissingFields", func(t *testing.T) {
 			handler, responseRecorder := setupHandler()
 
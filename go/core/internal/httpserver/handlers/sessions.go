@@ -409,6 +409,71 @@ func (h *SessionsHandler) HandleAddEventToSession(w ErrorResponseWriter, r *http
 	RespondWithJSON(w, http.StatusCreated, data)
 }
 
+// HandleAddEventsToSession handles POST /api/sessions/{session_id}/events/batch requests,
+// storing several events of a session in a single request
+func (h *SessionsHandler) HandleAddEventsToSession(w ErrorResponseWriter, r *http.Request) {
+	log := ctrllog.FromContext(r.Context()).WithName("sessions-handler").WithValues("operation", "add-events")
+	sessionID, err := GetPathParam(r, "session_id")
+	if err != nil {
+		w.RespondWithError(errors.NewBadRequestError("Failed to get session ID from path", err))
+		return
+	}
+	log = log.WithValues("session_id", sessionID)
+
+	principal, err := GetPrincipal(r)
+	if err != nil {
+		w.RespondWithError(errors.NewBadRequestError("Failed to get user ID", err))
+		return
+	}
+	userID, err := getUserID(r)
+	if err != nil {
+		w.RespondWithError(errors.NewBadRequestError("Failed to get user ID", err))
+		return
+	}
+	log = log.WithValues("userID", userID)
+
+	var batch struct {
+		Events []struct {
+			ID   string `json:"id"`
+			Data string `json:"data"`
+		} `json:"events"`
+	}
+	if err := DecodeJSONBody(r, &batch); err != nil {
+		w.RespondWithError(errors.NewBadRequestError("Invalid request body", err))
+		return
+	}
+	log = log.WithValues("count", len(batch.Events))
+
+	// Get session to verify it exists
+	session, err := h.DatabaseService.GetSession(r.Context(), sessionID, userID)
+	if err != nil {
+		w.RespondWithError(errors.NewNotFoundError("Session not found", err))
+		return
+	}
+
+	if session.AgentID != nil && *session.AgentID != utils.ConvertToPythonIdentifier(principal.Agent.ID) {
+		w.RespondWithError(errors.NewForbiddenError("Session does not belong to this agent", nil))
+		return
+	}
+	events := make([]*database.Event, 0, len(batch.Events))
+	for _, eventData := range batch.Events {
+		events = append(events, &database.Event{
+			ID:        eventData.ID,
+			SessionID: sessionID,
+			Data:      eventData.Data,
+			UserID:    userID,
+		})
+	}
+	if err := h.DatabaseService.StoreEvents(r.Context(), events...); err != nil {
+		w.RespondWithError(errors.NewInternalServerError("Failed to store events", err))
+		return
+	}
+
+	log.Info("Successfully added events to session")
+	data := api.NewResponse(events, "Events added to session successfully", false)
+	RespondWithJSON(w, http.StatusCreated, data)
+}
+
 func getUserID(r *http.Request) (string, error) {
 	log := ctrllog.Log.WithName("http-helpers")
 
@@ -506,6 +506,91 @@ func TestSessionsHandler(t *testing.T) {
 		})
 	})
 
+	t.Run("HandleAddEventsToSession", func(t *testing.T) {
+		agentID := "test_agent"
+		newBatchRequest := func(sessionID, userID string, ids ...string) *http.Request {
+			type eventData struct {
+				ID   string `json:"id"`
+				Data string `json:"data"`
+			}
+			batch := struct {
+				Events []eventData `json:"events"`
+			}{}
+			for _, id := range ids {
+				batch.Events = append(batch.Events, eventData{ID: id, Data: "{}"})
+			}
+			jsonBody, _ := json.Marshal(batch)
+			req := httptest.NewRequest("POST", "/api/sessions/"+sessionID+"/events/batch", bytes.NewBuffer(jsonBody))
+			req.Header.Set("Content-Type", "application/json")
+			req.Header.Set("X-User-ID", userID)
+			req = mux.SetURLVars(req, map[string]string{"session_id": sessionID})
+			ctx := auth.AuthSessionTo(req.Context(), &authimpl.SimpleSession{
+				P: auth.Principal{
+					User:  auth.User{ID: userID},
+					Agent: auth.Agent{ID: agentID},
+				},
+			})
+			return req.WithContext(ctx)
+		}
+
+		t.Run("Success", func(t *testing.T) {
+			handler, dbClient, responseRecorder := setupHandler()
+			userID := "test-user"
+			sessionID := "test-session"
+			createTestSession(dbClient, sessionID, userID, agentID)
+
+			handler.HandleAddEventsToSession(responseRecorder, newBatchRequest(sessionID, userID, "event-1", "event-2", "event-3"))
+
+			assert.Equal(t, http.StatusCreated, responseRecorder.Code)
+			events, err := dbClient.ListEventsForSession(context.Background(), sessionID, userID, database.QueryOptions{OrderAsc: true})
+			require.NoError(t, err)
+			require.Len(t, events, 3)
+			assert.Equal(t, "event-1", events[0].ID)
+			assert.Equal(t, "event-3", events[2].ID)
+		})
+
+		t.Run("RetriedBatchIsIdempotent", func(t *testing.T) {
+			handler, dbClient, _ := setupHandler()
+			userID := "test-user"
+			sessionID := "test-session"
+			createTestSession(dbClient, sessionID, userID, agentID)
+
+			first := newMockErrorResponseWriter()
+			handler.HandleAddEventsToSession(first, newBatchRequest(sessionID, userID, "event-1", "event-2"))
+			retry := newMockErrorResponseWriter()
+			handler.HandleAddEventsToSession(retry, newBatchRequest(sessionID, userID, "event-1", "event-2"))
+
+			assert.Equal(t, http.StatusCreated, first.Code)
+			assert.Equal(t, http.StatusCreated, retry.Code)
+			events, err := dbClient.ListEventsForSession(context.Background(), sessionID, userID, database.QueryOptions{})
+			require.NoError(t, err)
+			assert.Len(t, events, 2)
+		})
+
+		t.Run("SessionNotFound", func(t *testing.T) {
+			handler, _, responseRecorder := setupHandler()
+
+			handler.HandleAddEventsToSession(responseRecorder, newBatchRequest("missing", "test-user", "event-1"))
+
+			assert.Equal(t, http.StatusNotFound, responseRecorder.Code)
+			assert.NotNil(t, responseRecorder.errorReceived)
+		})
+
+		t.Run("OtherAgentsSession", func(t *testing.T) {
+			handler, dbClient, responseRecorder := setupHandler()
+			userID := "test-user"
+			sessionID := "test-session"
+			createTestSession(dbClient, sessionID, userID, "other_agent")
+
+			handler.HandleAddEventsToSession(responseRecorder, newBatchRequest(sessionID, userID, "event-1"))
+
+			assert.Equal(t, http.StatusForbidden, responseRecorder.Code)
+			events, err := dbClient.ListEventsForSession(context.Background(), sessionID, userID, database.QueryOptions{})
+			require.NoError(t, err)
+			assert.Empty(t, events)
+		})
+	})
+
 	t.Run("HandleListTasksForSession", func(t *testing.T) {
 		t.Run("Success", func(t *testing.T) {
 			handler, dbClient, responseRecorder := setupHandler()
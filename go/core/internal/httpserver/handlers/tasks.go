@@ -63,6 +63,87 @@ func (h *TasksHandler) HandleCreateTask(w ErrorResponseWriter, r *http.Request)
 	RespondWithJSON(w, http.StatusCreated, data)
 }
 
+// taskDelta is the body of PATCH /api/tasks/{task_id}. Task carries the current
+// status and metadata of the task, but only the history entries appended after
+// the first HistoryLength stored ones and only the artifacts that were added or
+// changed.
+type taskDelta struct {
+	Task          protocol.Task `json:"task"`
+	HistoryLength int           `json:"historyLength"`
+}
+
+// HandleUpdateTask handles PATCH /api/tasks/{task_id} requests, applying a delta
+// to a stored task so that clients do not have to upload the full history on
+// every save. It responds with 409 Conflict when the stored history does not
+// have the length the client expects, in which case the client uploads the full task.
+func (h *TasksHandler) HandleUpdateTask(w ErrorResponseWriter, r *http.Request) {
+	log := ctrllog.FromContext(r.Context()).WithName("tasks-handler").WithValues("operation", "update-task")
+
+	taskID, err := GetPathParam(r, "task_id")
+	if err != nil {
+		w.RespondWithError(errors.NewBadRequestError("Failed to get task ID from path", err))
+		return
+	}
+	log = log.WithValues("task_id", taskID)
+
+	delta := taskDelta{}
+	if err := DecodeJSONBody(r, &delta); err != nil {
+		w.RespondWithError(errors.NewBadRequestError("Invalid request body", err))
+		return
+	}
+	if delta.Task.ID != "" && delta.Task.ID != taskID {
+		w.RespondWithError(errors.NewBadRequestError("Task ID in body does not match path", nil))
+		return
+	}
+
+	// The stored task is read, merged and written under a row lock, so
+	// concurrent deltas of one task cannot overwrite each other.
+	var task protocol.Task
+	found, conflict := false, false
+	err = h.DatabaseService.UpdateTask(r.Context(), taskID, func(stored *protocol.Task) error {
+		found = true
+		if len(stored.History) != delta.HistoryLength {
+			conflict = true
+			return errors.NewConflictError("Stored task history does not match", nil)
+		}
+
+		task = delta.Task
+		task.ID = taskID
+		task.History = append(stored.History, delta.Task.History...)
+		task.Artifacts = stored.Artifacts
+		for _, artifact := range delta.Task.Artifacts {
+			replaced := false
+			for i := range task.Artifacts {
+				if task.Artifacts[i].ArtifactID == artifact.ArtifactID {
+					task.Artifacts[i] = artifact
+					replaced = true
+					break
+				}
+			}
+			if !replaced {
+				task.Artifacts = append(task.Artifacts, artifact)
+			}
+		}
+		*stored = task
+		return nil
+	})
+	switch {
+	case !found:
+		w.RespondWithError(errors.NewNotFoundError("Task not found", err))
+		return
+	case conflict:
+		w.RespondWithError(err)
+		return
+	case err != nil:
+		w.RespondWithError(errors.NewInternalServerError("Failed to update task", err))
+		return
+	}
+
+	log.Info("Successfully updated task", "appendedHistory", len(delta.Task.History), "artifacts", len(delta.Task.Artifacts))
+	data := api.NewResponse(task, "Successfully updated task", false)
+	RespondWithJSON(w, http.StatusOK, data)
+}
+
 func (h *TasksHandler) HandleDeleteTask(w ErrorResponseWriter, r *http.Request) {
 	log := ctrllog.FromContext(r.Context()).WithName("tasks-handler").WithValues("operation", "delete-task")
 
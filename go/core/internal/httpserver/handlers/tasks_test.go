@@ -0,0 +1,161 @@
+package handlers_test
+
+import (
+	"bytes"
+	"context"
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"sync"
+	"testing"
+
+	"github.com/gorilla/mux"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	"trpc.group/trpc-go/trpc-a2a-go/protocol"
+
+	database_fake "github.com/kagent-dev/kagent/go/core/internal/database/fake"
+	"github.com/kagent-dev/kagent/go/core/internal/httpserver/handlers"
+)
+
+func TestTasksHandler(t *testing.T) {
+	setupHandler := func() (*handlers.TasksHandler, *database_fake.InMemoryFakeClient) {
+		dbClient := database_fake.NewClient()
+		base := &handlers.Base{
+			DatabaseService: dbClient,
+		}
+		return handlers.NewTasksHandler(base), dbClient.(*database_fake.InMemoryFakeClient)
+	}
+
+	newMessage := func(id, text string) protocol.Message {
+		return protocol.Message{
+			Kind:      protocol.KindMessage,
+			MessageID: id,
+			Role:      protocol.MessageRoleUser,
+			Parts:     []protocol.Part{protocol.NewTextPart(text)},
+		}
+	}
+
+	newArtifact := func(id, text string) protocol.Artifact {
+		return protocol.Artifact{
+			ArtifactID: id,
+			Parts:      []protocol.Part{protocol.NewTextPart(text)},
+		}
+	}
+
+	storeTask := func(t *testing.T, dbClient *database_fake.InMemoryFakeClient, task *protocol.Task) {
+		require.NoError(t, dbClient.StoreTask(context.Background(), task))
+	}
+
+	newUpdateRequest := func(taskID string, historyLength int, task protocol.Task) *http.Request {
+		body, _ := json.Marshal(map[string]any{"task": task, "historyLength": historyLength})
+		req := httptest.NewRequest("PATCH", "/api/tasks/"+taskID, bytes.NewBuffer(body))
+		req.Header.Set("Content-Type", "application/json")
+		return mux.SetURLVars(req, map[string]string{"task_id": taskID})
+	}
+
+	t.Run("HandleUpdateTask", func(t *testing.T) {
+		t.Run("AppendsHistoryAndMergesArtifacts", func(t *testing.T) {
+			handler, dbClient := setupHandler()
+			storeTask(t, dbClient, &protocol.Task{
+				ID:        "task-1",
+				ContextID: "session-1",
+				History:   []protocol.Message{newMessage("m1", "hello")},
+				Artifacts: []protocol.Artifact{newArtifact("a1", "old"), newArtifact("a2", "kept")},
+			})
+			responseRecorder := newMockErrorResponseWriter()
+
+			handler.HandleUpdateTask(responseRecorder, newUpdateRequest("task-1", 1, protocol.Task{
+				ContextID: "session-1",
+				Status:    protocol.TaskStatus{State: protocol.TaskStateCompleted},
+				History:   []protocol.Message{newMessage("m2", "world")},
+				Artifacts: []protocol.Artifact{newArtifact("a1", "new"), newArtifact("a3", "added")},
+			}))
+
+			require.Equal(t, http.StatusOK, responseRecorder.Code)
+			stored, err := dbClient.GetTask(context.Background(), "task-1")
+			require.NoError(t, err)
+			assert.Equal(t, protocol.TaskStateCompleted, stored.Status.State)
+			require.Len(t, stored.History, 2)
+			assert.Equal(t, "m1", stored.History[0].MessageID)
+			assert.Equal(t, "m2", stored.History[1].MessageID)
+			require.Len(t, stored.Artifacts, 3)
+			assert.Equal(t, []string{"a1", "a2", "a3"}, []string{
+				stored.Artifacts[0].ArtifactID, stored.Artifacts[1].ArtifactID, stored.Artifacts[2].ArtifactID,
+			})
+			assert.Equal(t, "new", stored.Artifacts[0].Parts[0].(*protocol.TextPart).Text)
+		})
+
+		t.Run("HistoryLengthMismatchConflicts", func(t *testing.T) {
+			handler, dbClient := setupHandler()
+			storeTask(t, dbClient, &protocol.Task{
+				ID:      "task-1",
+				History: []protocol.Message{newMessage("m1", "hello")},
+			})
+			responseRecorder := newMockErrorResponseWriter()
+
+			handler.HandleUpdateTask(responseRecorder, newUpdateRequest("task-1", 0, protocol.Task{
+				History: []protocol.Message{newMessage("m2", "world")},
+			}))
+
+			assert.Equal(t, http.StatusConflict, responseRecorder.Code)
+			stored, err := dbClient.GetTask(context.Background(), "task-1")
+			require.NoError(t, err)
+			assert.Len(t, stored.History, 1)
+		})
+
+		t.Run("TaskNotFound", func(t *testing.T) {
+			handler, _ := setupHandler()
+			responseRecorder := newMockErrorResponseWriter()
+
+			handler.HandleUpdateTask(responseRecorder, newUpdateRequest("missing", 0, protocol.Task{}))
+
+			assert.Equal(t, http.StatusNotFound, responseRecorder.Code)
+		})
+
+		t.Run("MismatchedTaskID", func(t *testing.T) {
+			handler, dbClient := setupHandler()
+			storeTask(t, dbClient, &protocol.Task{ID: "task-1"})
+			responseRecorder := newMockErrorResponseWriter()
+
+			handler.HandleUpdateTask(responseRecorder, newUpdateRequest("task-1", 0, protocol.Task{ID: "task-2"}))
+
+			assert.Equal(t, http.StatusBadRequest, responseRecorder.Code)
+		})
+
+		t.Run("ConcurrentDeltasAreNotLost", func(t *testing.T) {
+			handler, dbClient := setupHandler()
+			storeTask(t, dbClient, &protocol.Task{ID: "task-1"})
+
+			// Every delta expects an empty history, so exactly one of them may apply
+			const updates = 10
+			codes := make([]int, updates)
+			var wg sync.WaitGroup
+			for i := range updates {
+				wg.Add(1)
+				go func() {
+					defer wg.Done()
+					responseRecorder := newMockErrorResponseWriter()
+					handler.HandleUpdateTask(responseRecorder, newUpdateRequest("task-1", 0, protocol.Task{
+						History: []protocol.Message{newMessage("m", "hello")},
+					}))
+					codes[i] = responseRecorder.Code
+				}()
+			}
+			wg.Wait()
+
+			succeeded := 0
+			for _, code := range codes {
+				if code == http.StatusOK {
+					succeeded++
+				} else {
+					assert.Equal(t, http.StatusConflict, code)
+				}
+			}
+			assert.Equal(t, 1, succeeded)
+			stored, err := dbClient.GetTask(context.Background(), "task-1")
+			require.NoError(t, err)
+			assert.Len(t, stored.History, 1)
+		})
+	})
+}
@@ -0,0 +1,89 @@
+"""Benchmark the per-call overhead of embedding clients in KagentMemoryService.
+
+The provider APIs are stubbed out, so the numbers only reflect the work done
+on the client side of each call: constructing the SDK client (credential and
+config resolution, connection pool setup) versus reusing a cached one. The
+"uncached" mode drops the cached clients before every call, which is what
+every call did before clients were cached.
+
+Usage:
+    python benchmarks/bench_embedding_clients.py [--calls 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from unittest import mock
+
+from kagent.adk._memory_service import KagentMemoryService
+from kagent.adk.types import EmbeddingConfig
+
+_VECTOR = [0.1] * 768
+
+
+def _openai_response():
+    item = mock.MagicMock()
+    item.embedding = _VECTOR
+    response = mock.MagicMock()
+    response.data = [item]
+    return response
+
+
+async def _fake_openai_create(self, **kwargs):
+    return _openai_response()
+
+
+def _fake_bedrock_call(self, operation_name, api_params):
+    body = mock.MagicMock()
+    body.read.return_value = json.dumps({"embedding": _VECTOR}).encode()
+    return {"body": body}
+
+
+async def _run(provider: str, model: str, calls: int, cached: bool) -> float:
+    service = KagentMemoryService(
+        agent_name="bench",
+        http_client=mock.AsyncMock(),
+        embedding_config=EmbeddingConfig(provider=provider, model=model),
+    )
+    # Warm up imports and, in cached mode, the client
+    await service._generate_embedding_async("warm up")
+    start = time.perf_counter()
+    for i in range(calls):
+        if not cached:
+            await service.aclose()
+        await service._generate_embedding_async(f"query {i}")
+    elapsed = time.perf_counter() - start
+    await service.aclose()
+    return elapsed / calls
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    os.environ.setdefault("OPENAI_API_KEY", "bench")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "bench")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "bench")
+
+    cases = [("openai", "text-embedding-3-small"), ("bedrock", "amazon.titan-embed-text-v2:0")]
+    with (
+        mock.patch("openai.resources.embeddings.AsyncEmbeddings.create", _fake_openai_create),
+        mock.patch("botocore.client.BaseClient._make_api_call", _fake_bedrock_call),
+    ):
+        sys.stdout.write(f"{'provider':>10} {'uncached us/call':>17} {'cached us/call':>15} {'speedup':>8}\n")
+        for provider, model in cases:
+            uncached = await _run(provider, model, args.calls, cached=False)
+            cached = await _run(provider, model, args.calls, cached=True)
+            sys.stdout.write(
+                f"{provider:>10} {uncached * 1e6:>17.1f} {cached * 1e6:>15.1f} {uncached / cached:>7.1f}x\n"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,57 @@
+"""Benchmark post-processing of embedding batches in KagentMemoryService.
+
+Compares the former per-vector loop (slice to 768, normalize each vector
+with its own NumPy allocation, ``tolist()`` each one) with handling the
+batch as one 2-D float32 array, for provider embeddings of 1536 dimensions.
+
+Usage:
+    python benchmarks/bench_embedding_normalize.py [--sizes 1 32 256] [--dim 1536]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from unittest import mock
+
+import numpy as np
+
+from kagent.adk._memory_service import KagentMemoryService
+
+
+def _per_vector(raw_embeddings: list[list[float]]) -> list[list[float]]:
+    """The per-vector post-processing used before batches were vectorized."""
+    embeddings = []
+    for embedding in raw_embeddings:
+        if len(embedding) > 768:
+            x = np.array(embedding[:768])
+            embedding = (x / np.linalg.norm(x)).tolist()
+        embeddings.append(embedding)
+    return embeddings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 32, 256])
+    parser.add_argument("--dim", type=int, default=1536)
+    args = parser.parse_args()
+
+    service = KagentMemoryService(agent_name="bench", http_client=mock.AsyncMock())
+    rng = np.random.default_rng(0)
+
+    sys.stdout.write(f"{'vectors':>8} {'per-vector us':>14} {'batched us':>11} {'speedup':>8}\n")
+    for size in args.sizes:
+        # Providers return JSON-decoded lists of Python floats
+        raw = rng.standard_normal((size, args.dim)).tolist()
+        number = max(1, 2000 // size)
+        before = min(timeit.repeat(lambda raw=raw: _per_vector(raw), number=number, repeat=5)) / number
+        after = (
+            min(timeit.repeat(lambda raw=raw: service._prepare_embeddings(raw).tolist(), number=number, repeat=5))
+            / number
+        )
+        sys.stdout.write(f"{size:>8} {before * 1e6:>14.1f} {after * 1e6:>11.1f} {before / after:>7.1f}x\n")
+
+
+if __name__ == "__main__":
+    main()
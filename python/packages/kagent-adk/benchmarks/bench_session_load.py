@@ -0,0 +1,160 @@
+"""Benchmark loading large sessions through KAgentSessionService on the Runner path.
+
+Runs two turns of an agent through ``google.adk.runners.Runner``, which loads
+the whole session with ``get_session`` (no config) before every turn and reads
+every event to build the LLM request. The model is a stub that answers right
+away, so the turn time is dominated by loading the session. Sessions have 1k
+and 10k stored events, every other one carrying a large function response.
+
+With the session cache disabled every turn fetches and validates the whole
+history. With it enabled the first turn does the same, and the second one only
+fetches and validates the events stored since. Each case runs in a fresh
+subprocess so RSS numbers are not polluted by earlier cases.
+
+Usage:
+    python benchmarks/bench_session_load.py [--events 1000 10000] [--payload-bytes 8192]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import multiprocessing
+import resource
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import AsyncGenerator
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlparse
+
+
+_EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _created_at(i: int) -> str:
+    return (_EPOCH + timedelta(seconds=i)).isoformat(timespec="microseconds")
+
+
+def _rss_mb() -> float:
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / 1024 / 1024
+    except ImportError:
+        # ru_maxrss is in KiB on Linux; it is a peak, not the current size
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _stored_events(count: int, payload_bytes: int) -> list[dict]:
+    from google.adk.events.event import Event
+    from google.genai import types
+
+    rows = []
+    for i in range(count):
+        if i % 2:
+            content = types.Content(
+                role="user",
+                parts=[
+                    types.Part(
+                        function_response=types.FunctionResponse(
+                            id=f"call-{i}",
+                            name="read_file",
+                            response={"lines": ["x" * 64] * (payload_bytes // 64)},
+                        )
+                    )
+                ],
+            )
+        else:
+            content = types.Content(role="model", parts=[types.Part(text=f"step {i}")])
+        event = Event(author="assistant", invocation_id="inv", content=content, timestamp=float(i))
+        rows.append({"id": event.id, "data": event.model_dump_json(), "created_at": _created_at(i)})
+    return rows
+
+
+class _FakeKagentApi:
+    """Serves one stored session the way the kagent sessions API does."""
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+
+    def _response(self, body: dict):
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = body
+        return response
+
+    async def get(self, url: str, headers=None):
+        after = parse_qs(urlparse(url).query).get("after", [None])[0]
+        rows = [row for row in self.rows if after is None or row["created_at"] >= after]
+        return self._response({"data": {"session": {"id": "s1", "user_id": "u1"}, "events": rows}})
+
+    async def post(self, url: str, json=None, headers=None):
+        events = json["events"] if url.split("?")[0].endswith("/batch") else [json]
+        for event in events:
+            self.rows.append({**event, "created_at": _created_at(len(self.rows))})
+        return self._response({"data": {}})
+
+
+def _run_case(count: int, payload_bytes: int, cache_size: int, queue) -> None:
+    from google.adk.agents import Agent
+    from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+    from google.adk.runners import Runner
+    from google.genai import types
+
+    from kagent.adk._session_service import KAgentSessionService
+
+    class _StubLlm(BaseLlm):
+        async def generate_content_async(
+            self, llm_request: LlmRequest, stream: bool = False
+        ) -> AsyncGenerator[LlmResponse, None]:
+            yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text="ok")]))
+
+    service = KAgentSessionService(
+        _FakeKagentApi(_stored_events(count, payload_bytes)), cache_size=cache_size, batch_events=False
+    )
+    runner = Runner(
+        app_name="app", agent=Agent(name="assistant", model=_StubLlm(model="stub")), session_service=service
+    )
+
+    async def turn(text: str) -> float:
+        start = time.perf_counter()
+        message = types.Content(role="user", parts=[types.Part(text=text)])
+        async for _ in runner.run_async(user_id="u1", session_id="s1", new_message=message):
+            pass
+        return time.perf_counter() - start
+
+    async def run() -> tuple[float, float, float]:
+        gc.collect()
+        rss_before = _rss_mb()
+        first = await turn("first")
+        gc.collect()
+        rss_delta = _rss_mb() - rss_before
+        second = await turn("second")
+        return first, second, rss_delta
+
+    queue.put(asyncio.run(run()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--payload-bytes", type=int, default=8192)
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    sys.stdout.write(f"{'events':>8} {'cache':>6} {'turn 1 ms':>10} {'turn 2 ms':>10} {'RSS delta MB':>13}\n")
+    for count in args.events:
+        for cache_size in (0, 128):
+            queue = ctx.Queue()
+            proc = ctx.Process(target=_run_case, args=(count, args.payload_bytes, cache_size, queue))
+            proc.start()
+            first, second, rss_delta = queue.get()
+            proc.join()
+            mode = "on" if cache_size else "off"
+            sys.stdout.write(f"{count:>8} {mode:>6} {first * 1000:>10.1f} {second * 1000:>10.1f} {rss_delta:>13.1f}\n")
+
+
+if __name__ == "__main__":
+    main()
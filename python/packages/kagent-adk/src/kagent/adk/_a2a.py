@@ -29,9 +29,12 @@ from kagent.core.a2a import (
 
 from ._agent_executor import A2aAgentExecutor, A2aAgentExecutorConfig
 from ._lifespan import LifespanManager
+from ._mcp_toolset import get_mcp_session_registry
 from ._memory_service import KagentMemoryService
+from ._runner_pool import get_runner_pool_config
 from ._session_service import KAgentSessionService
 from ._token import KAgentTokenService
+from .models._client_registry import get_llm_client_registry
 from .types import AgentConfig
 
 logger = logging.getLogger(__name__)
@@ -107,6 +110,8 @@ class KAgentApp:
                     http_client=http_client,
                     embedding_config=self.agent_config.memory.embedding,
                     ttl_days=self.agent_config.memory.ttl_days,
+                    search_limit=self.agent_config.memory.search_limit,
+                    search_min_score=self.agent_config.memory.search_min_score,
                 )
 
         def create_runner() -> Runner:
@@ -141,7 +146,11 @@ class KAgentApp:
         retry_policy = self.agent_config.retry_policy if self.agent_config else None
         agent_executor = A2aAgentExecutor(
             runner=create_runner,
-            config=A2aAgentExecutorConfig(stream=self.stream, retry_policy=retry_policy),
+            config=A2aAgentExecutorConfig(
+                stream=self.stream,
+                retry_policy=retry_policy,
+                runner_pool=get_runner_pool_config(),
+            ),
             task_store=task_store,
         )
 
@@ -163,6 +172,18 @@ class KAgentApp:
 
         lifespan_manager = LifespanManager()
         lifespan_manager.add(self._lifespan)
+        if isinstance(session_service, KAgentSessionService):
+            # Added before the executor so buffered events are flushed after in-flight runners are closed
+            lifespan_manager.add(session_service.lifespan())
+        if isinstance(task_store, KAgentTaskStore):
+            # Persists coalesced task saves on shutdown
+            lifespan_manager.add(task_store.lifespan())
+        if memory_service is not None:
+            # Closes embedding clients once in-flight runners are done with them
+            lifespan_manager.add(memory_service.lifespan())
+        lifespan_manager.add(agent_executor.lifespan())
+        lifespan_manager.add(get_mcp_session_registry().lifespan())
+        lifespan_manager.add(get_llm_client_registry().lifespan())
         if not local:
             lifespan_manager.add(token_service.lifespan())
 
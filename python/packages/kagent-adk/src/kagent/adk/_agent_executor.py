@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import inspect
+import json
 import logging
 import uuid
-from contextlib import suppress
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime, timezone
 from typing import Any, Awaitable, Callable, Optional
 
@@ -53,8 +55,11 @@ from kagent.core.tracing._span_processor import (
 )
 
 from ._mcp_toolset import is_anyio_cross_task_cancel_scope_error
-from .types import RetryPolicyConfig
+from ._memory_service import KagentMemoryService
+from .types import HEADERS_HASH_STATE_KEY, HEADERS_STATE_KEY, RetryPolicyConfig
 from ._remote_a2a_tool import SubagentSessionProvider
+from ._runner_pool import RunnerPool, RunnerPoolConfig, runner_mcp_sessions_healthy
+from ._session_service import KAgentSessionService
 from .converters.event_converter import convert_event_to_a2a_events, serialize_metadata_value
 from .converters.part_converter import convert_a2a_part_to_genai_part, convert_genai_part_to_a2a_part
 from .converters.request_converter import convert_a2a_request_to_adk_run_args
@@ -67,6 +72,7 @@ class A2aAgentExecutorConfig(BaseModel):
 
     stream: bool = False
     retry_policy: Optional["RetryPolicyConfig"] = None
+    runner_pool: Optional[RunnerPoolConfig] = None  # Reuse warm runners across requests when set
 
 
 def _compute_retry_delay(attempt: int, policy: "RetryPolicyConfig") -> float:
@@ -77,6 +83,47 @@ def _compute_retry_delay(attempt: int, policy: "RetryPolicyConfig") -> float:
     return delay
 
 
+# Headers that differ between requests of the same client: body-dependent, hop-by-hop,
+# tracing and per-request proxy headers. They are left out of the headers hash.
+_VOLATILE_HEADERS = frozenset(
+    {
+        "content-length",
+        "content-md5",
+        "digest",
+        "connection",
+        "keep-alive",
+        "proxy-connection",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+        "date",
+        "traceparent",
+        "tracestate",
+        "baggage",
+        "b3",
+        "uber-trace-id",
+        "sentry-trace",
+        "x-request-id",
+        "x-correlation-id",
+        "x-amzn-trace-id",
+        "x-cloud-trace-context",
+        "x-request-start",
+    }
+)
+_VOLATILE_HEADER_PREFIXES = ("x-b3-", "x-datadog-", "x-envoy-", "ot-tracer-")
+
+
+def _hash_headers(headers: dict[str, Any]) -> str:
+    """Stable hash of request headers, independent of their order and of volatile headers."""
+    stable = {
+        name.lower(): value
+        for name, value in headers.items()
+        if name.lower() not in _VOLATILE_HEADERS and not name.lower().startswith(_VOLATILE_HEADER_PREFIXES)
+    }
+    return hashlib.sha256(json.dumps(stable, sort_keys=True, default=str).encode()).hexdigest()
+
+
 def _kagent_request_converter(request, _part_converter=None):
     """Adapter to match the upstream A2ARequestToAgentRunRequestConverter signature.
 
@@ -108,7 +155,8 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
     """KAgent's A2A agent executor.
 
     Extends the upstream google-adk A2aAgentExecutor with:
-    - Per-request runner lifecycle (created fresh and closed after each request)
+    - Per-request runner lifecycle (created fresh and closed after each request),
+      or an opt-in pool of warm runners reused across requests
     - OpenTelemetry span attribute management
     - Enhanced error handling (Ollama-specific JSON parse errors, CancelledError)
     - Partial event filtering to avoid duplicate aggregation during streaming
@@ -134,15 +182,37 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
         super().__init__(runner=runner, config=upstream_config)
         self._kagent_config = config
         self._task_store = task_store
+        self._runner_pool: Optional[RunnerPool] = None
+        if config is not None and config.runner_pool is not None:
+            self._runner_pool = RunnerPool(
+                factory=self._resolve_runner,
+                close_runner=self._safe_close_runner,
+                config=config.runner_pool,
+                health_check=runner_mcp_sessions_healthy,
+            )
+
+    def lifespan(self):
+        """Returns an async context manager that closes pooled runners on shutdown."""
+
+        @asynccontextmanager
+        async def _lifespan(app: Any):
+            try:
+                yield
+            finally:
+                if self._runner_pool is not None:
+                    await self._runner_pool.close()
+
+        return _lifespan
 
     @override
     async def _resolve_runner(self) -> Runner:
         """Resolve the runner from the callable.
 
         Unlike the upstream executor which caches a single Runner instance,
-        kagent always creates a fresh Runner per request. This is necessary
-        because MCP toolset connections are not shared between requests and
-        must be cleaned up after each execution.
+        kagent creates a fresh Runner here. Without a runner pool this happens
+        for every request, because MCP toolset connections are not shared
+        between requests and must be cleaned up after each execution. With a
+        pool, this is only called when no warm runner is available.
         """
         if callable(self._runner):
             result = self._runner()
@@ -253,6 +323,8 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
         # Set kagent span attributes for all spans in context.
         context_token = set_kagent_span_attributes(span_attributes)
         runner: Optional[Runner] = None
+        # A pooled runner is only reused if its request completed without error
+        runner_reusable = False
         try:
             # for new task, create a task submitted event
             if not context.current_task:
@@ -270,9 +342,10 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
                 )
 
             # Handle the request and publish updates to the event queue
-            runner = await self._resolve_runner()
+            runner = await self._acquire_runner()
             try:
                 await self._handle_request(context, event_queue, runner, run_args)
+                runner_reusable = True
             except asyncio.CancelledError as e:
                 logger.error("A2A request execution was cancelled", exc_info=True)
                 error_message = str(e) or "A2A request execution was cancelled."
@@ -303,9 +376,21 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
             # close the runner which cleans up the mcptoolsets
             # since the runner is created for each a2a request
             # and the mcptoolsets are not shared between requests
-            # this is necessary to gracefully handle mcp toolset connections
+            # this is necessary to gracefully handle mcp toolset connections.
+            # Pooled runners are returned to the pool instead, and closed there.
             if runner is not None:
-                await self._safe_close_runner(runner)
+                await self._release_runner(runner, reusable=runner_reusable)
+
+    async def _acquire_runner(self) -> Runner:
+        if self._runner_pool is not None:
+            return await self._runner_pool.acquire()
+        return await self._resolve_runner()
+
+    async def _release_runner(self, runner: Runner, *, reusable: bool) -> None:
+        if self._runner_pool is not None:
+            await self._runner_pool.release(runner, reusable=reusable)
+        else:
+            await self._safe_close_runner(runner)
 
     async def _safe_close_runner(self, runner: Runner):
         """Close the runner in an isolated task to prevent cancel scope
@@ -550,6 +635,37 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
                 )
             return parts
 
+    async def _update_header_state(
+        self,
+        runner: Runner,
+        session: Session,
+        headers: dict[str, Any],
+        state_delta: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Make the request headers available in session state.
+
+        A ``header_update`` event is only persisted when the headers differ
+        from the last persisted ones, compared by hash, or when ``state_delta``
+        holds other state to persist at the start of the turn. Otherwise they
+        are set on the in-memory session state only, so repeated requests with
+        the same headers do not add a write and an event to the session.
+        Headers that change on every request, such as ``content-length`` and
+        ``traceparent``, are not part of the hash.
+        """
+        headers_hash = _hash_headers(headers)
+        if session.state.get(HEADERS_HASH_STATE_KEY) == headers_hash and not state_delta:
+            session.state[HEADERS_STATE_KEY] = headers
+            return
+
+        system_event = Event(
+            invocation_id="header_update",
+            author="system",
+            actions=EventActions(
+                state_delta={**(state_delta or {}), HEADERS_STATE_KEY: headers, HEADERS_HASH_STATE_KEY: headers_hash}
+            ),
+        )
+        await runner.session_service.append_event(session, system_event)
+
     async def _handle_request(
         self,
         context: RequestContext,
@@ -570,18 +686,11 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
         else:
             # Normal flow: set request headers to session state
             headers = context.call_context.state.get("headers", {})
-            state_changes = {
-                "headers": headers,
-            }
-
-            actions_with_update = EventActions(state_delta=state_changes)
-            system_event = Event(
-                invocation_id="header_update",
-                author="system",
-                actions=actions_with_update,
-            )
-
-            await runner.session_service.append_event(session, system_event)
+            # Memory watermarks advanced by background saves since the last turn
+            memory_state_delta = None
+            if isinstance(runner.memory_service, KagentMemoryService):
+                memory_state_delta = runner.memory_service.watermark_state_delta(session)
+            await self._update_header_state(runner, session, headers, state_delta=memory_state_delta)
 
         # create invocation context
         invocation_context = runner._new_invocation_context(
@@ -656,6 +765,11 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
                 if getattr(adk_event, "long_running_tool_ids", None):
                     break
 
+        # Persist buffered session events before the final status is published,
+        # both at the end of the turn and when pausing for a HITL confirmation
+        if isinstance(runner.session_service, KAgentSessionService):
+            await runner.session_service.flush_session_events(session)
+
         # Attach the last LLM usage to run_metadata so the A2A task_manager
         # merges it into task.metadata on the completed Task object.
         if last_usage_metadata is not None:
@@ -0,0 +1,151 @@
+"""Bedrock embedding requests with native batching, bounded concurrency and throttling retries."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import random
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Literal
+
+logger = logging.getLogger(__name__)
+
+BEDROCK_EMBED_CONCURRENCY_ENV_VAR = "KAGENT_BEDROCK_EMBED_CONCURRENCY"
+DEFAULT_BEDROCK_EMBED_CONCURRENCY = 4
+
+# Cohere embedding models accept up to 96 texts per request, Titan models a single one
+_COHERE_MAX_BATCH_SIZE = 96
+_THROTTLING_ERROR_CODES = frozenset({"ThrottlingException", "TooManyRequestsException", "ServiceUnavailableException"})
+_MAX_ATTEMPTS = 5
+_BACKOFF_BASE_SECONDS = 0.25
+_BACKOFF_MAX_SECONDS = 8.0
+
+# Whether texts are embedded to be stored or to search the stored ones. Cohere
+# models embed the two differently; other models ignore it.
+EmbeddingInputType = Literal["search_document", "search_query"]
+
+
+def get_bedrock_embed_concurrency() -> int:
+    """Maximum concurrent Bedrock embedding requests (KAGENT_BEDROCK_EMBED_CONCURRENCY)."""
+    value = os.getenv(BEDROCK_EMBED_CONCURRENCY_ENV_VAR)
+    if not value:
+        return DEFAULT_BEDROCK_EMBED_CONCURRENCY
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(
+            f"Invalid {BEDROCK_EMBED_CONCURRENCY_ENV_VAR} value: {value}, "
+            f"using default {DEFAULT_BEDROCK_EMBED_CONCURRENCY}"
+        )
+        return DEFAULT_BEDROCK_EMBED_CONCURRENCY
+
+
+class AdaptiveConcurrencyLimiter:
+    """Bounds concurrent requests, adapting the bound to throttling.
+
+    The bound is halved whenever a request is throttled and grows back by
+    about one request per round of successful requests (AIMD), never
+    exceeding ``max_concurrency``.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.limit = float(max_concurrency)
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def on_success(self) -> None:
+        self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+
+    def on_throttle(self) -> None:
+        self.limit = max(1.0, self.limit / 2)
+
+
+def _is_throttling_error(error: Exception) -> bool:
+    response = getattr(error, "response", None)
+    if not isinstance(response, dict):
+        return False
+    return response.get("Error", {}).get("Code") in _THROTTLING_ERROR_CODES
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter before retry number ``attempt``."""
+    return random.uniform(0, min(_BACKOFF_MAX_SECONDS, _BACKOFF_BASE_SECONDS * 2 ** (attempt - 1)))
+
+
+def _is_cohere(model_id: str) -> bool:
+    # Also matches cross-region inference profiles such as "us.cohere.embed-v4:0"
+    return "cohere.embed" in model_id
+
+
+def _request_body(model_id: str, texts: List[str], input_type: EmbeddingInputType) -> str:
+    if _is_cohere(model_id):
+        return json.dumps({"texts": texts, "input_type": input_type, "embedding_types": ["float"]})
+    return json.dumps({"inputText": texts[0]})
+
+
+def _parse_embeddings(model_id: str, payload: dict) -> List[List[float]]:
+    if _is_cohere(model_id):
+        embeddings = payload["embeddings"]
+        # Responses are keyed by embedding type when embedding_types is requested
+        return embeddings["float"] if isinstance(embeddings, dict) else embeddings
+    return [payload["embedding"]]
+
+
+async def embed_bedrock(
+    client: Any,
+    model_id: str,
+    texts: List[str],
+    limiter: AdaptiveConcurrencyLimiter,
+    input_type: EmbeddingInputType = "search_document",
+) -> List[List[float]]:
+    """Embed ``texts`` with a Bedrock ``bedrock-runtime`` client.
+
+    Cohere models embed up to 96 texts per request, other models one. Requests
+    run in threads, at most as many at a time as ``limiter`` allows, and are
+    retried with jittered exponential backoff when Bedrock throttles them.
+    ``input_type`` tells Cohere models whether the texts are stored or searched.
+    """
+    batch_size = _COHERE_MAX_BATCH_SIZE if _is_cohere(model_id) else 1
+
+    async def _invoke(batch: List[str]) -> List[List[float]]:
+        attempt = 0
+        while True:
+            async with limiter.slot():
+                try:
+                    response = await asyncio.to_thread(
+                        client.invoke_model,
+                        modelId=model_id,
+                        body=_request_body(model_id, batch, input_type),
+                        contentType="application/json",
+                        accept="application/json",
+                    )
+                except Exception as e:
+                    attempt += 1
+                    if attempt >= _MAX_ATTEMPTS or not _is_throttling_error(e):
+                        raise
+                    limiter.on_throttle()
+                else:
+                    limiter.on_success()
+                    return _parse_embeddings(model_id, json.loads(response["body"].read()))
+            delay = _backoff_delay(attempt)
+            logger.debug("Bedrock embedding request throttled, retrying in %.2fs (attempt %d)", delay, attempt)
+            await asyncio.sleep(delay)
+
+    batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+    results = await asyncio.gather(*[_invoke(batch) for batch in batches])
+    return [embedding for result in results for embedding in result]
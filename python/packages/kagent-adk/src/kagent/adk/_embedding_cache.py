@@ -0,0 +1,114 @@
+"""LRU cache of embedding vectors keyed by a hash of provider, model, input type and text."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_SIZE_ENV_VAR = "KAGENT_EMBEDDING_CACHE_SIZE"
+EMBEDDING_CACHE_PATH_ENV_VAR = "KAGENT_EMBEDDING_CACHE_PATH"
+DEFAULT_EMBEDDING_CACHE_SIZE = 2048
+
+
+def get_embedding_cache_size() -> int:
+    """Number of embeddings cached in-process (KAGENT_EMBEDDING_CACHE_SIZE, 0 disables)."""
+    value = os.getenv(EMBEDDING_CACHE_SIZE_ENV_VAR)
+    if not value:
+        return DEFAULT_EMBEDDING_CACHE_SIZE
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(
+            f"Invalid {EMBEDDING_CACHE_SIZE_ENV_VAR} value: {value}, using default {DEFAULT_EMBEDDING_CACHE_SIZE}"
+        )
+        return DEFAULT_EMBEDDING_CACHE_SIZE
+
+
+class EmbeddingCache:
+    """Caches embedding vectors as float32 arrays with LRU eviction.
+
+    Entries are keyed by the SHA-256 of provider, model, input type and text, so the cache
+    never holds the embedded text itself. When ``path`` is set, the cache is
+    loaded from that file on creation and written back by ``save``.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_EMBEDDING_CACHE_SIZE, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.path = path
+        self._entries: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if path and max_entries > 0:
+            self._load(path)
+
+    @classmethod
+    def from_env(cls) -> EmbeddingCache:
+        return cls(max_entries=get_embedding_cache_size(), path=os.getenv(EMBEDDING_CACHE_PATH_ENV_VAR) or None)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    @staticmethod
+    def key(provider: str, model: str, text: str, input_type: str = "search_document") -> bytes:
+        return hashlib.sha256(f"{provider}\0{model}\0{input_type}\0{text}".encode()).digest()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        vector = self._entries.get(key)
+        if vector is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return vector
+
+    def put(self, key: bytes, vector) -> None:
+        if not self.enabled:
+            return
+        self._entries[key] = np.asarray(vector, dtype=np.float32)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def save(self) -> None:
+        """Write the cache to ``path``, replacing the previous file atomically."""
+        if not self.path or not self._entries:
+            return
+        keys = np.frombuffer(b"".join(self._entries), dtype=np.uint8).reshape(len(self._entries), -1)
+        vectors = np.stack(list(self._entries.values()))
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, keys=keys, vectors=vectors)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        logger.debug("Saved %d cached embeddings to %s", len(self._entries), self.path)
+
+    def _load(self, path: str) -> None:
+        if not os.path.exists(path):
+            return
+        try:
+            with np.load(path) as data:
+                keys, vectors = data["keys"], data["vectors"].astype(np.float32, copy=False)
+        except Exception as e:
+            logger.warning("Ignoring unreadable embedding cache %s: %s", path, e)
+            return
+        # Entries are saved least recently used first, keep the most recent ones
+        for key, vector in zip(keys[-self.max_entries :], vectors[-self.max_entries :], strict=True):
+            self._entries[key.tobytes()] = vector
+        logger.debug("Loaded %d cached embeddings from %s", len(self._entries), path)
@@ -0,0 +1,195 @@
+"""Process-wide cache of MCP tool catalogs and their function declarations."""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from google.genai import types as genai_types
+from mcp import ClientSession
+from mcp import types as mcp_types
+from mcp.types import Tool as McpBaseTool
+from opentelemetry import metrics
+
+logger = logging.getLogger("kagent_adk." + __name__)
+
+MCP_TOOL_CACHE_TTL_ENV_VAR = "KAGENT_MCP_TOOL_CACHE_TTL_SECONDS"
+DEFAULT_MCP_TOOL_CACHE_TTL_SECONDS = 300.0
+MCP_TOOL_CACHE_SIZE_ENV_VAR = "KAGENT_MCP_TOOL_CACHE_SIZE"
+DEFAULT_MCP_TOOL_CACHE_SIZE = 1024
+
+_meter = metrics.get_meter("kagent.adk")
+_catalog_lookups = _meter.create_counter(
+    "kagent.mcp.tool_catalog.lookups",
+    description="MCP tool catalog lookups, labelled with result=hit|miss",
+)
+_schema_conversion_duration = _meter.create_histogram(
+    "kagent.mcp.tool_catalog.schema_conversion.duration",
+    unit="s",
+    description="Time spent converting an MCP tool schema into a function declaration",
+)
+
+
+def get_mcp_tool_cache_ttl() -> float:
+    """Get the MCP tool catalog TTL from KAGENT_MCP_TOOL_CACHE_TTL_SECONDS.
+
+    A value of 0 disables caching, so every ``get_tools`` call lists the tools again.
+    """
+    value = os.getenv(MCP_TOOL_CACHE_TTL_ENV_VAR)
+    if not value:
+        return DEFAULT_MCP_TOOL_CACHE_TTL_SECONDS
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(
+            f"Invalid {MCP_TOOL_CACHE_TTL_ENV_VAR} value: {value}, using default {DEFAULT_MCP_TOOL_CACHE_TTL_SECONDS}"
+        )
+        return DEFAULT_MCP_TOOL_CACHE_TTL_SECONDS
+
+
+def get_mcp_tool_cache_size() -> int:
+    """Get the maximum number of cached MCP tool catalogs from KAGENT_MCP_TOOL_CACHE_SIZE."""
+    value = os.getenv(MCP_TOOL_CACHE_SIZE_ENV_VAR)
+    if not value:
+        return DEFAULT_MCP_TOOL_CACHE_SIZE
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(
+            f"Invalid {MCP_TOOL_CACHE_SIZE_ENV_VAR} value: {value}, using default {DEFAULT_MCP_TOOL_CACHE_SIZE}"
+        )
+        return DEFAULT_MCP_TOOL_CACHE_SIZE
+
+
+@dataclass
+class McpToolCatalogEntry:
+    """Tools listed by one MCP server for one set of request headers."""
+
+    tools: list[McpBaseTool]
+    fetched_at: float
+    _declarations: dict[str, genai_types.FunctionDeclaration] = field(default_factory=dict)
+
+    def get_declaration(
+        self,
+        tool_name: str,
+        build: Callable[[], genai_types.FunctionDeclaration],
+    ) -> genai_types.FunctionDeclaration:
+        """Return the declaration for a tool, converting its schema only once.
+
+        A shallow copy is returned because callers such as tool name prefixing
+        modify the declaration they receive.
+        """
+        declaration = self._declarations.get(tool_name)
+        if declaration is None:
+            start = time.perf_counter()
+            declaration = build()
+            _schema_conversion_duration.record(time.perf_counter() - start)
+            self._declarations[tool_name] = declaration
+        return declaration.model_copy()
+
+
+class McpToolCatalog:
+    """Caches the tools listed by MCP servers.
+
+    Entries are keyed by server identity and by the session key of the request
+    headers, since servers may expose different tools to different callers.
+    Entries expire after ``ttl_seconds`` and are dropped as soon as a server
+    sends ``notifications/tools/list_changed``. Since request headers may carry
+    per-user or rotating tokens, expired entries are swept whenever a catalog
+    is added and at most ``max_entries`` are kept, least recently used first.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_MCP_TOOL_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_MCP_TOOL_CACHE_SIZE,
+    ):
+        self._ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # Keyed by (server key, session key), least recently used first
+        self._entries: OrderedDict[tuple[str, str], McpToolCatalogEntry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0
+
+    def get(self, server_key: str, session_key: str) -> Optional[McpToolCatalogEntry]:
+        key = (server_key, session_key)
+        entry = self._entries.get(key)
+        if entry is not None and self._expired(entry, time.monotonic()):
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            _catalog_lookups.add(1, {"result": "miss"})
+        else:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            _catalog_lookups.add(1, {"result": "hit"})
+        return entry
+
+    def put(self, server_key: str, session_key: str, tools: list[McpBaseTool]) -> McpToolCatalogEntry:
+        now = time.monotonic()
+        for key, cached in list(self._entries.items()):
+            if self._expired(cached, now):
+                del self._entries[key]
+        entry = McpToolCatalogEntry(tools=list(tools), fetched_at=now)
+        self._entries[(server_key, session_key)] = entry
+        self._entries.move_to_end((server_key, session_key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, server_key: str) -> None:
+        """Drop every cached catalog of a server."""
+        keys = [key for key in self._entries if key[0] == server_key]
+        for key in keys:
+            del self._entries[key]
+        if keys:
+            logger.debug("Invalidated MCP tool catalog for %s", server_key)
+
+    def _expired(self, entry: McpToolCatalogEntry, now: float) -> bool:
+        return now - entry.fetched_at > self._ttl_seconds
+
+    def watch(self, session: ClientSession, server_key: str) -> None:
+        """Invalidate the server's catalog when the session reports a tool list change.
+
+        ADK creates the ``ClientSession`` itself, so the notification handler is
+        installed by wrapping the session's message handler. Installing it more
+        than once on the same session is a no-op.
+        """
+        if getattr(session, "_kagent_tool_catalog_watched", False):
+            return
+        original_handler = session._message_handler
+
+        async def _message_handler(message):
+            if isinstance(message, mcp_types.ServerNotification) and isinstance(
+                message.root, mcp_types.ToolListChangedNotification
+            ):
+                self.invalidate(server_key)
+            await original_handler(message)
+
+        session._message_handler = _message_handler
+        session._kagent_tool_catalog_watched = True
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+_mcp_tool_catalog: McpToolCatalog | None = None
+
+
+def get_mcp_tool_catalog() -> McpToolCatalog:
+    """Return the process-wide MCP tool catalog."""
+    global _mcp_tool_catalog
+    if _mcp_tool_catalog is None:
+        _mcp_tool_catalog = McpToolCatalog(ttl_seconds=get_mcp_tool_cache_ttl(), max_entries=get_mcp_tool_cache_size())
+    return _mcp_tool_catalog
@@ -1,14 +1,38 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from typing import Optional
+import os
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
 from google.adk.tools import BaseTool
+from google.adk.tools.load_mcp_resource_tool import LoadMcpResourceTool
+from google.adk.tools.mcp_tool import SseConnectionParams, StreamableHTTPConnectionParams
+from google.adk.tools.mcp_tool.mcp_session_manager import MCPSessionManager, retry_on_errors
+from google.adk.tools.mcp_tool.mcp_tool import MCPTool
 from google.adk.tools.mcp_tool.mcp_toolset import McpToolset, ReadonlyContext
+from google.genai import types as genai_types
+from mcp import ClientSession
+
+from ._mcp_tool_catalog import McpToolCatalogEntry, get_mcp_tool_catalog
 
 logger = logging.getLogger("kagent_adk." + __name__)
 
+T = TypeVar("T")
+
+MCP_SHARED_SESSIONS_ENV_VAR = "KAGENT_MCP_SHARED_SESSIONS"
+MCP_SESSION_IDLE_TIMEOUT_ENV_VAR = "KAGENT_MCP_SESSION_IDLE_TIMEOUT_SECONDS"
+DEFAULT_MCP_SESSION_IDLE_TIMEOUT_SECONDS = 600.0
+# How often the app lifespan sweeps idle sessions
+_IDLE_SWEEP_INTERVAL_SECONDS = 60.0
+
+# Keys of the shared sessions used by the current task, see SharedMcpSessionManager.track_calls
+_tracked_session_keys: ContextVar[Optional[list[str]]] = ContextVar("kagent_mcp_tracked_session_keys", default=None)
+
 
 def _enrich_cancelled_error(error: BaseException) -> asyncio.CancelledError:
     message = "Failed to create MCP session: operation cancelled"
@@ -17,28 +41,336 @@ def _enrich_cancelled_error(error: BaseException) -> asyncio.CancelledError:
     return asyncio.CancelledError(message)
 
 
+def mcp_shared_sessions_enabled() -> bool:
+    """Whether MCP sessions are shared across requests (KAGENT_MCP_SHARED_SESSIONS, default true)."""
+    return os.getenv(MCP_SHARED_SESSIONS_ENV_VAR, "true").lower() != "false"
+
+
+def get_mcp_session_idle_timeout() -> float:
+    """Idle time after which a shared MCP session is closed (KAGENT_MCP_SESSION_IDLE_TIMEOUT_SECONDS)."""
+    value = os.getenv(MCP_SESSION_IDLE_TIMEOUT_ENV_VAR)
+    if not value:
+        return DEFAULT_MCP_SESSION_IDLE_TIMEOUT_SECONDS
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(
+            f"Invalid {MCP_SESSION_IDLE_TIMEOUT_ENV_VAR} value: {value}, "
+            f"using default {DEFAULT_MCP_SESSION_IDLE_TIMEOUT_SECONDS}"
+        )
+        return DEFAULT_MCP_SESSION_IDLE_TIMEOUT_SECONDS
+
+
+class SharedMcpSessionManager(MCPSessionManager):
+    """MCPSessionManager shared by every toolset that connects to the same server.
+
+    The base manager already keeps one initialized ``ClientSession`` per header
+    set, replaces disconnected sessions and runs each session in a dedicated
+    task, so concurrent tool calls from different requests are multiplexed over
+    the same session. This subclass adds idle eviction and explicit discarding
+    of sessions that disconnected, so they are reconnected on next use.
+    Sessions used by calls running within ``track_calls`` are never evicted.
+
+    Every session it hands out invalidates the server's cached tool catalog
+    when the server reports that its tool list changed, including sessions
+    created by a reconnect and sessions that never listed the tools.
+    """
+
+    def __init__(self, connection_params: Any, idle_timeout_seconds: float):
+        super().__init__(connection_params=connection_params)
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._server_key = _connection_key(connection_params)
+        self._last_used: dict[str, float] = {}
+        self._in_flight: dict[str, int] = {}
+
+    async def create_session(self, headers: Optional[dict[str, str]] = None) -> ClientSession:
+        session_key = self._generate_session_key(self._merge_headers(headers))
+        session = await super().create_session(headers=headers)
+        get_mcp_tool_catalog().watch(session, self._server_key)
+        self._last_used[session_key] = time.monotonic()
+        tracked = _tracked_session_keys.get()
+        if tracked is not None:
+            tracked.append(session_key)
+            self._in_flight[session_key] = self._in_flight.get(session_key, 0) + 1
+        return session
+
+    @asynccontextmanager
+    async def track_calls(self):
+        """Mark the sessions used within the block in flight until it exits, then as just used."""
+        tracked: list[str] = []
+        token = _tracked_session_keys.set(tracked)
+        try:
+            yield
+        finally:
+            _tracked_session_keys.reset(token)
+            now = time.monotonic()
+            for session_key in tracked:
+                self._last_used[session_key] = now
+                remaining = self._in_flight.get(session_key, 0) - 1
+                if remaining > 0:
+                    self._in_flight[session_key] = remaining
+                else:
+                    self._in_flight.pop(session_key, None)
+
+    async def discard_session(self, session: ClientSession) -> None:
+        """Close a session that disconnected so that the next call reconnects."""
+        async with self._session_lock:
+            for session_key, (pooled_session, exit_stack, stored_loop) in list(self._sessions.items()):
+                if pooled_session is session:
+                    logger.info("Discarding disconnected MCP session %s", session_key)
+                    self._last_used.pop(session_key, None)
+                    await _cleanup_quietly(self._cleanup_session(session_key, exit_stack, stored_loop))
+
+    async def evict_idle_sessions(self) -> None:
+        """Close sessions that have not been used within the idle timeout."""
+        # Never evict while a call could still be waiting on a streamed response
+        idle_timeout = max(self._idle_timeout_seconds, getattr(self._connection_params, "sse_read_timeout", 0) or 0)
+        now = time.monotonic()
+        async with self._session_lock:
+            for session_key, (_, exit_stack, stored_loop) in list(self._sessions.items()):
+                if self._in_flight.get(session_key) or now - self._last_used.get(session_key, now) <= idle_timeout:
+                    continue
+                logger.debug("Evicting idle MCP session %s", session_key)
+                self._last_used.pop(session_key, None)
+                await _cleanup_quietly(self._cleanup_session(session_key, exit_stack, stored_loop))
+
+    @property
+    def session_count(self) -> int:
+        return len(self._sessions)
+
+
+def _connection_key(connection_params: SseConnectionParams | StreamableHTTPConnectionParams) -> str:
+    """Identify an MCP server by URL, static headers and transport settings."""
+    key: dict[str, Any] = {
+        "type": type(connection_params).__name__,
+        "url": connection_params.url,
+        "headers": connection_params.headers or {},
+        "timeout": connection_params.timeout,
+        "sse_read_timeout": connection_params.sse_read_timeout,
+    }
+    if isinstance(connection_params, StreamableHTTPConnectionParams):
+        key["terminate_on_close"] = connection_params.terminate_on_close
+        # Custom client factories may carry TLS or auth settings, so never share across them
+        key["httpx_client_factory"] = id(connection_params.httpx_client_factory)
+    return json.dumps(key, sort_keys=True, default=str)
+
+
+class McpSessionRegistry:
+    """Process-wide registry of shared MCP session managers keyed by server identity."""
+
+    def __init__(self, idle_timeout_seconds: float = DEFAULT_MCP_SESSION_IDLE_TIMEOUT_SECONDS):
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._managers: dict[str, SharedMcpSessionManager] = {}
+
+    def get_session_manager(
+        self, connection_params: SseConnectionParams | StreamableHTTPConnectionParams
+    ) -> SharedMcpSessionManager:
+        key = _connection_key(connection_params)
+        manager = self._managers.get(key)
+        if manager is None:
+            manager = SharedMcpSessionManager(connection_params, self._idle_timeout_seconds)
+            self._managers[key] = manager
+        return manager
+
+    async def evict_idle_sessions(self) -> None:
+        for manager in list(self._managers.values()):
+            await manager.evict_idle_sessions()
+
+    async def close(self) -> None:
+        """Close every shared session."""
+        managers = list(self._managers.values())
+        self._managers.clear()
+        for manager in managers:
+            await _cleanup_quietly(manager.close())
+
+    def lifespan(self):
+        """Returns an async context manager that sweeps idle sessions and closes all sessions on shutdown."""
+
+        @asynccontextmanager
+        async def _lifespan(app: Any):
+            sweep_task = asyncio.create_task(self._sweep_idle_sessions())
+            try:
+                yield
+            finally:
+                sweep_task.cancel()
+                try:
+                    await sweep_task
+                except asyncio.CancelledError:
+                    pass
+                await self.close()
+
+        return _lifespan
+
+    async def _sweep_idle_sessions(self) -> None:
+        while True:
+            await asyncio.sleep(_IDLE_SWEEP_INTERVAL_SECONDS)
+            try:
+                await self.evict_idle_sessions()
+            except Exception as e:
+                logger.warning("Failed to evict idle MCP sessions: %s", e)
+
+
+_mcp_session_registry: McpSessionRegistry | None = None
+
+
+def get_mcp_session_registry() -> McpSessionRegistry:
+    """Return the process-wide MCP session registry."""
+    global _mcp_session_registry
+    if _mcp_session_registry is None:
+        _mcp_session_registry = McpSessionRegistry(idle_timeout_seconds=get_mcp_session_idle_timeout())
+    return _mcp_session_registry
+
+
+class _CatalogMcpTool(MCPTool):
+    """MCPTool whose function declaration is converted once per catalog entry.
+
+    Calls on a shared session are tracked, so the session is not evicted as
+    idle while a call that outlasts the idle timeout is still running.
+    """
+
+    def __init__(self, *, catalog_entry: Optional[McpToolCatalogEntry], **kwargs: Any):
+        super().__init__(**kwargs)
+        self._catalog_entry = catalog_entry
+
+    def _get_declaration(self) -> genai_types.FunctionDeclaration:
+        if self._catalog_entry is None:
+            return super()._get_declaration()
+        return self._catalog_entry.get_declaration(self._mcp_tool.name, super()._get_declaration)
+
+    async def _run_async_impl(self, *, args, tool_context, credential) -> dict[str, Any]:
+        if not isinstance(self._mcp_session_manager, SharedMcpSessionManager):
+            return await super()._run_async_impl(args=args, tool_context=tool_context, credential=credential)
+        async with self._mcp_session_manager.track_calls():
+            return await super()._run_async_impl(args=args, tool_context=tool_context, credential=credential)
+
+
 class KAgentMcpToolset(McpToolset):
     """McpToolset variant that catches and enriches errors during MCP session setup
     and handles cancel scope issues during cleanup.
 
     This is particularly useful for explicitly catching and enriching failures that the base
     implementation may not catch and propagate without enough context.
+
+    HTTP and SSE toolsets share their MCP sessions through the process-wide
+    ``McpSessionRegistry``, so toolsets rebuilt for every request reuse already
+    initialized sessions instead of reconnecting. Closing such a toolset leaves
+    the shared sessions open; they are evicted when idle and closed on shutdown.
+
+    The tools listed by HTTP and SSE servers are cached in the process-wide
+    ``McpToolCatalog`` together with their converted function declarations,
+    until the TTL expires or the server notifies that its tool list changed.
     """
 
+    def __init__(self, *, share_sessions: Optional[bool] = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        if share_sessions is None:
+            share_sessions = mcp_shared_sessions_enabled()
+        self._shares_sessions = share_sessions and isinstance(
+            self._connection_params, (SseConnectionParams, StreamableHTTPConnectionParams)
+        )
+        if self._shares_sessions:
+            self._mcp_session_manager = get_mcp_session_registry().get_session_manager(self._connection_params)
+        self._server_key: Optional[str] = None
+        if isinstance(self._connection_params, (SseConnectionParams, StreamableHTTPConnectionParams)):
+            self._server_key = _connection_key(self._connection_params)
+
     async def get_tools(self, readonly_context: Optional[ReadonlyContext] = None) -> list[BaseTool]:
         try:
-            return await super().get_tools(readonly_context)
+            if self._server_key is None:
+                return await super().get_tools(readonly_context)
+            return await self._get_cached_tools(readonly_context)
         except asyncio.CancelledError as error:
             raise _enrich_cancelled_error(error) from error
 
+    @retry_on_errors
+    async def _get_cached_tools(self, readonly_context: Optional[ReadonlyContext] = None) -> list[BaseTool]:
+        catalog = get_mcp_tool_catalog()
+        entry: Optional[McpToolCatalogEntry] = None
+        if catalog.enabled:
+            session_key = self._mcp_session_manager._generate_session_key(
+                self._mcp_session_manager._merge_headers(self._request_headers(readonly_context))
+            )
+            entry = catalog.get(self._server_key, session_key)
+        if entry is not None:
+            mcp_tools = entry.tools
+        else:
+            tools_response = await self._execute_with_session(
+                lambda session: session.list_tools(),
+                "Failed to get tools from MCP server",
+                readonly_context,
+            )
+            mcp_tools = tools_response.tools
+            if catalog.enabled:
+                entry = catalog.put(self._server_key, session_key, mcp_tools)
+
+        # The filter may depend on the context, so it is applied on every call
+        tools: list[BaseTool] = []
+        for tool in mcp_tools:
+            mcp_tool = _CatalogMcpTool(
+                catalog_entry=entry,
+                mcp_tool=tool,
+                mcp_session_manager=self._mcp_session_manager,
+                auth_scheme=self._auth_scheme,
+                auth_credential=self._auth_credential,
+                require_confirmation=self._require_confirmation,
+                header_provider=self._header_provider,
+                progress_callback=self._progress_callback,
+            )
+            if self._is_tool_selected(mcp_tool, readonly_context):
+                tools.append(mcp_tool)
+
+        if self._use_mcp_resources:
+            tools.append(LoadMcpResourceTool(mcp_toolset=self))
+        return tools
+
+    def _request_headers(self, readonly_context: Optional[ReadonlyContext]) -> Optional[dict[str, str]]:
+        """Headers a session is created with, mirroring McpToolset._execute_with_session."""
+        headers: dict[str, str] = {}
+        if self._header_provider and readonly_context:
+            headers.update(self._header_provider(readonly_context) or {})
+        headers.update(self._get_auth_headers() or {})
+        return headers or None
+
+    async def _execute_with_session(
+        self,
+        coroutine_func: Callable[[Any], Awaitable[T]],
+        error_message: str,
+        readonly_context: Optional[ReadonlyContext] = None,
+    ) -> T:
+        used_session: list[ClientSession] = []
+
+        manager = self._mcp_session_manager
+
+        async def _tracked(session: ClientSession) -> T:
+            used_session.append(session)
+            # Shared managers watch every session they create
+            if self._server_key is not None and not isinstance(manager, SharedMcpSessionManager):
+                get_mcp_tool_catalog().watch(session, self._server_key)
+            return await coroutine_func(session)
+
+        if not isinstance(manager, SharedMcpSessionManager):
+            return await super()._execute_with_session(_tracked, error_message, readonly_context)
+        try:
+            async with manager.track_calls():
+                return await super()._execute_with_session(_tracked, error_message, readonly_context)
+        except ConnectionError:
+            # Every error of the call is wrapped in ConnectionError, including ordinary tool errors
+            # and timeouts. Other requests' calls share the session, so it is only dropped, and
+            # reconnected by the base retry, when it actually disconnected.
+            if used_session and manager._is_session_disconnected(used_session[0]):
+                await manager.discard_session(used_session[0])
+            raise
+
     async def close(self) -> None:
         """Close MCP sessions and suppress known anyio cancel scope cleanup errors.
 
         We intentionally do not suppress arbitrary exceptions to avoid hiding
-        unrelated cleanup failures.
+        unrelated cleanup failures. Shared sessions are not closed here.
 
         See: https://github.com/kagent-dev/kagent/issues/1276
         """
+        if getattr(self, "_shares_sessions", False):
+            return
         try:
             await super().close()
         except BaseException as e:
@@ -56,6 +388,21 @@ class KAgentMcpToolset(McpToolset):
             raise
 
 
+async def _cleanup_quietly(cleanup: Awaitable[None]) -> None:
+    """Await an MCP session cleanup, suppressing only the known anyio cancel scope error."""
+    try:
+        await cleanup
+    except BaseException as e:
+        if is_anyio_cross_task_cancel_scope_error(e):
+            logger.warning(
+                "Non-fatal anyio cancel scope error during MCP cleanup: %s: %s",
+                type(e).__name__,
+                e,
+            )
+            return
+        raise
+
+
 def is_anyio_cross_task_cancel_scope_error(error: BaseException) -> bool:
     current: BaseException | None = error
     seen: set[int] = set()
@@ -0,0 +1,206 @@
+"""In-process vector index of memories, searched before the Kagent backend."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MEMORY_LOCAL_INDEX_ENV_VAR = "KAGENT_MEMORY_LOCAL_INDEX"
+MEMORY_LOCAL_INDEX_PATH_ENV_VAR = "KAGENT_MEMORY_LOCAL_INDEX_PATH"
+MEMORY_LOCAL_INDEX_SYNC_ENV_VAR = "KAGENT_MEMORY_LOCAL_INDEX_SYNC_SECONDS"
+DEFAULT_MEMORY_LOCAL_INDEX_SYNC_SECONDS = 300.0
+
+_VECTORS_FILE = "vectors.npy"
+_ENTRIES_FILE = "entries.json"
+
+
+def get_memory_local_index_sync_seconds() -> float:
+    """Seconds a user's index stays authoritative after a sync (KAGENT_MEMORY_LOCAL_INDEX_SYNC_SECONDS)."""
+    value = os.getenv(MEMORY_LOCAL_INDEX_SYNC_ENV_VAR)
+    if not value:
+        return DEFAULT_MEMORY_LOCAL_INDEX_SYNC_SECONDS
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(
+            f"Invalid {MEMORY_LOCAL_INDEX_SYNC_ENV_VAR} value: {value}, "
+            f"using default {DEFAULT_MEMORY_LOCAL_INDEX_SYNC_SECONDS}"
+        )
+        return DEFAULT_MEMORY_LOCAL_INDEX_SYNC_SECONDS
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms != 0)
+
+
+@dataclass
+class _Partition:
+    """Memories of one user. ``vectors`` may be a read-only view of the memory-mapped index file."""
+
+    ids: List[str] = field(default_factory=list)
+    contents: List[str] = field(default_factory=list)
+    vectors: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=np.float32))
+    synced_at: Optional[float] = None
+
+
+class LocalMemoryIndex:
+    """Cosine-similarity index of memory vectors, partitioned by user.
+
+    Searches are a brute-force matrix product over the user's L2-normalized
+    float32 vectors, which is exact and fast for the few thousand memories a
+    user typically has. A partition replaced from the backend by ``replace``
+    is fresh for ``sync_seconds``; callers use the backend while it is not.
+    When ``path`` is set, the index is loaded from that directory, with the
+    vectors memory-mapped, and written back by ``save``.
+    """
+
+    def __init__(self, path: Optional[str] = None, sync_seconds: Optional[float] = None):
+        self.path = path
+        self.sync_seconds = get_memory_local_index_sync_seconds() if sync_seconds is None else sync_seconds
+        self._partitions: Dict[str, _Partition] = {}
+        if path:
+            self._load(path)
+
+    @classmethod
+    def from_env(cls) -> Optional[LocalMemoryIndex]:
+        """Index configured by KAGENT_MEMORY_LOCAL_INDEX and KAGENT_MEMORY_LOCAL_INDEX_PATH, None if disabled."""
+        if os.getenv(MEMORY_LOCAL_INDEX_ENV_VAR, "false").lower() != "true":
+            return None
+        return cls(path=os.getenv(MEMORY_LOCAL_INDEX_PATH_ENV_VAR) or None)
+
+    @staticmethod
+    def local_id(user_id: str, content: str) -> str:
+        """ID for a memory that has not been read back from the backend yet."""
+        return "local-" + hashlib.sha256(f"{user_id}\0{content}".encode()).hexdigest()[:32]
+
+    def __len__(self) -> int:
+        return sum(len(p.ids) for p in self._partitions.values())
+
+    def is_fresh(self, user_id: str) -> bool:
+        partition = self._partitions.get(user_id)
+        return (
+            partition is not None
+            and partition.synced_at is not None
+            and time.time() - partition.synced_at < self.sync_seconds
+        )
+
+    def add(self, user_id: str, entries: Sequence[Tuple[str, str, Sequence[float]]]) -> None:
+        """Add ``(id, content, vector)`` entries to a user's partition, skipping known IDs."""
+        partition = self._partitions.setdefault(user_id, _Partition())
+        known = set(partition.ids)
+        new = [(id_, content, vector) for id_, content, vector in entries if id_ not in known]
+        if not new:
+            return
+        vectors = _normalize_rows(np.array([vector for _, _, vector in new], dtype=np.float32))
+        if partition.ids and partition.vectors.shape[1] != vectors.shape[1]:
+            logger.warning("Ignoring memories with a different embedding dimension for user %s", user_id)
+            return
+        partition.vectors = np.concatenate([partition.vectors, vectors]) if partition.ids else vectors
+        partition.ids.extend(id_ for id_, _, _ in new)
+        partition.contents.extend(content for _, content, _ in new)
+
+    def replace(self, user_id: str, entries: Sequence[Tuple[str, str, Sequence[float]]]) -> None:
+        """Replace a user's partition with the memories stored in the backend and mark it fresh."""
+        self._partitions.pop(user_id, None)
+        self.add(user_id, entries)
+        self._partitions.setdefault(user_id, _Partition()).synced_at = time.time()
+
+    def search(
+        self, user_id: str, vectors: Sequence[Sequence[float]], limit: int, min_score: float
+    ) -> List[List[Dict[str, Any]]]:
+        """Best matches of each query vector, in the same shape as backend search results."""
+        partition = self._partitions.get(user_id)
+        if partition is None or not partition.ids:
+            return [[] for _ in vectors]
+        queries = _normalize_rows(np.array(vectors, dtype=np.float32))
+        if queries.shape[1] != partition.vectors.shape[1]:
+            return [[] for _ in vectors]
+        count = min(limit, len(partition.ids))
+        results = []
+        for scores in queries @ partition.vectors.T:
+            top = np.argpartition(-scores, count - 1)[:count]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            results.append(
+                [
+                    {"id": partition.ids[i], "content": partition.contents[i], "score": float(scores[i])}
+                    for i in top
+                    if scores[i] >= min_score
+                ]
+            )
+        return results
+
+    def save(self) -> None:
+        """Write the index to ``path``; partitions are stored contiguously so loading can map them."""
+        if not self.path or not self._partitions:
+            return
+        partitions = [(user_id, p) for user_id, p in self._partitions.items() if p.ids]
+        entries = []
+        offset = 0
+        for user_id, partition in partitions:
+            entries.append(
+                {
+                    "user_id": user_id,
+                    "ids": partition.ids,
+                    "contents": partition.contents,
+                    "synced_at": partition.synced_at,
+                    "offset": offset,
+                }
+            )
+            offset += len(partition.ids)
+        dims = {p.vectors.shape[1] for _, p in partitions}
+        if len(dims) > 1:
+            logger.warning("Not saving memory index with mixed embedding dimensions %s", sorted(dims))
+            return
+        vectors = (
+            np.concatenate([p.vectors for _, p in partitions]) if partitions else np.empty((0, 0), dtype=np.float32)
+        )
+        os.makedirs(self.path, exist_ok=True)
+        self._write_atomic(_VECTORS_FILE, lambda f: np.save(f, vectors))
+        self._write_atomic(_ENTRIES_FILE, lambda f: f.write(json.dumps({"rows": offset, "users": entries}).encode()))
+        logger.debug("Saved %d memories to local index %s", offset, self.path)
+
+    def _write_atomic(self, name: str, write) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, os.path.join(self.path, name))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _load(self, path: str) -> None:
+        entries_path = os.path.join(path, _ENTRIES_FILE)
+        if not os.path.exists(entries_path):
+            return
+        try:
+            with open(entries_path) as f:
+                data = json.load(f)
+            vectors = np.load(os.path.join(path, _VECTORS_FILE), mmap_mode="r")
+            if len(vectors) != data["rows"]:
+                raise ValueError(f"expected {data['rows']} vectors, found {len(vectors)}")
+            partitions = {}
+            for entry in data["users"]:
+                start, count = entry["offset"], len(entry["ids"])
+                partitions[entry["user_id"]] = _Partition(
+                    ids=list(entry["ids"]),
+                    contents=list(entry["contents"]),
+                    vectors=vectors[start : start + count],
+                    synced_at=entry["synced_at"],
+                )
+        except Exception as e:
+            logger.warning("Ignoring unreadable memory index %s: %s", path, e)
+            return
+        self._partitions = partitions
+        logger.debug("Loaded %d memories from local index %s", len(self), path)
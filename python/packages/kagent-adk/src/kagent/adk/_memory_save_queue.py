@@ -0,0 +1,273 @@
+"""Bounded background queue for saving sessions to long-term memory."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from google.adk.sessions import Session
+from opentelemetry import metrics
+
+from kagent.adk.models._client_registry import get_request_passthrough_key, use_passthrough_key
+
+logger = logging.getLogger(__name__)
+
+MEMORY_SAVE_CONCURRENCY_ENV_VAR = "KAGENT_MEMORY_SAVE_CONCURRENCY"
+MEMORY_SAVE_QUEUE_SIZE_ENV_VAR = "KAGENT_MEMORY_SAVE_QUEUE_SIZE"
+MEMORY_SAVE_DRAIN_TIMEOUT_ENV_VAR = "KAGENT_MEMORY_SAVE_DRAIN_TIMEOUT_SECONDS"
+MEMORY_SAVE_BATCH_SIZE_ENV_VAR = "KAGENT_MEMORY_SAVE_BATCH_SIZE"
+DEFAULT_MEMORY_SAVE_CONCURRENCY = 2
+DEFAULT_MEMORY_SAVE_QUEUE_SIZE = 100
+DEFAULT_MEMORY_SAVE_DRAIN_TIMEOUT_SECONDS = 30.0
+DEFAULT_MEMORY_SAVE_BATCH_SIZE = 4
+
+_meter = metrics.get_meter("kagent.adk")
+_queue_depth = _meter.create_up_down_counter(
+    "kagent.memory.save_queue.depth",
+    description="Sessions waiting to be saved to memory",
+)
+_saves = _meter.create_counter(
+    "kagent.memory.save_queue.submissions",
+    description="Memory save submissions, labelled with result=queued|merged|dropped",
+)
+_queue_wait = _meter.create_histogram(
+    "kagent.memory.save_queue.wait",
+    unit="s",
+    description="Time a session waited in the queue before being saved",
+)
+_save_duration = _meter.create_histogram(
+    "kagent.memory.save_queue.save.duration",
+    unit="s",
+    description="Time spent saving one batch of sessions to memory",
+)
+_batch_size = _meter.create_histogram(
+    "kagent.memory.save_queue.batch_size",
+    description="Sessions saved to memory together in one batch",
+)
+
+
+def get_memory_save_concurrency() -> int:
+    """Number of sessions saved to memory concurrently (KAGENT_MEMORY_SAVE_CONCURRENCY)."""
+    value = os.getenv(MEMORY_SAVE_CONCURRENCY_ENV_VAR)
+    if not value:
+        return DEFAULT_MEMORY_SAVE_CONCURRENCY
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(
+            f"Invalid {MEMORY_SAVE_CONCURRENCY_ENV_VAR} value: {value}, using default {DEFAULT_MEMORY_SAVE_CONCURRENCY}"
+        )
+        return DEFAULT_MEMORY_SAVE_CONCURRENCY
+
+
+def get_memory_save_queue_size() -> int:
+    """Maximum number of sessions waiting to be saved (KAGENT_MEMORY_SAVE_QUEUE_SIZE)."""
+    value = os.getenv(MEMORY_SAVE_QUEUE_SIZE_ENV_VAR)
+    if not value:
+        return DEFAULT_MEMORY_SAVE_QUEUE_SIZE
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(
+            f"Invalid {MEMORY_SAVE_QUEUE_SIZE_ENV_VAR} value: {value}, using default {DEFAULT_MEMORY_SAVE_QUEUE_SIZE}"
+        )
+        return DEFAULT_MEMORY_SAVE_QUEUE_SIZE
+
+
+def get_memory_save_drain_timeout() -> float:
+    """Seconds to wait on shutdown for queued saves (KAGENT_MEMORY_SAVE_DRAIN_TIMEOUT_SECONDS)."""
+    value = os.getenv(MEMORY_SAVE_DRAIN_TIMEOUT_ENV_VAR)
+    if not value:
+        return DEFAULT_MEMORY_SAVE_DRAIN_TIMEOUT_SECONDS
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(
+            f"Invalid {MEMORY_SAVE_DRAIN_TIMEOUT_ENV_VAR} value: {value}, "
+            f"using default {DEFAULT_MEMORY_SAVE_DRAIN_TIMEOUT_SECONDS}"
+        )
+        return DEFAULT_MEMORY_SAVE_DRAIN_TIMEOUT_SECONDS
+
+
+def get_memory_save_batch_size() -> int:
+    """Maximum number of one user's sessions saved together (KAGENT_MEMORY_SAVE_BATCH_SIZE)."""
+    value = os.getenv(MEMORY_SAVE_BATCH_SIZE_ENV_VAR)
+    if not value:
+        return DEFAULT_MEMORY_SAVE_BATCH_SIZE
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(
+            f"Invalid {MEMORY_SAVE_BATCH_SIZE_ENV_VAR} value: {value}, using default {DEFAULT_MEMORY_SAVE_BATCH_SIZE}"
+        )
+        return DEFAULT_MEMORY_SAVE_BATCH_SIZE
+
+
+def _model_key(model: Optional[Any]) -> Optional[str]:
+    """Identify a model by its configuration: provider class, model name, base URL and settings.
+
+    Models are rebuilt for every request, so sessions queued by different
+    requests only share a model by configuration, not by identity.
+    """
+    if model is None:
+        return None
+    dump = getattr(model, "model_dump", None)
+    if dump is None:
+        return f"{type(model).__name__}:{id(model)}"
+    try:
+        settings = dump(mode="json", exclude_none=True)
+    except Exception:
+        return f"{type(model).__name__}:{id(model)}"
+    return json.dumps({"provider": type(model).__name__, **settings}, sort_keys=True, default=str)
+
+
+@dataclass
+class _PendingSave:
+    session: Session
+    model: Optional[Any]
+    enqueued_at: float
+    model_key: Optional[str] = None
+    # Passthrough API key of the request that submitted the session, used to summarize it
+    passthrough_key: Optional[str] = None
+
+
+class MemorySaveQueue:
+    """Saves sessions to memory on a fixed number of worker tasks.
+
+    At most ``max_size`` sessions wait in the queue. Submitting a session that
+    is already waiting replaces the queued copy with the newer one, since it
+    holds a superset of the events; a new session submitted to a full queue is
+    dropped with a warning. A worker takes up to ``max_batch_size`` queued
+    sessions of the same user, model configuration and passthrough API key at
+    once, so they can be summarized together. ``drain`` waits for queued saves
+    on shutdown.
+
+    Workers run in an empty context rather than that of the request that
+    started them, and each save runs with the passthrough API key of the
+    request that submitted it.
+    """
+
+    def __init__(
+        self,
+        save: Callable[[List[Session], Optional[Any]], Awaitable[None]],
+        concurrency: Optional[int] = None,
+        max_size: Optional[int] = None,
+        drain_timeout: Optional[float] = None,
+        max_batch_size: Optional[int] = None,
+    ):
+        self._save = save
+        self.concurrency = get_memory_save_concurrency() if concurrency is None else concurrency
+        self.max_size = get_memory_save_queue_size() if max_size is None else max_size
+        self.drain_timeout = get_memory_save_drain_timeout() if drain_timeout is None else drain_timeout
+        self.max_batch_size = get_memory_save_batch_size() if max_batch_size is None else max_batch_size
+        self._pending: Dict[Tuple[str, str, str], _PendingSave] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._closed = False
+        self.dropped = 0
+
+    @property
+    def depth(self) -> int:
+        """Number of sessions waiting to be saved."""
+        return len(self._pending)
+
+    def submit(self, session: Session, model: Optional[Any] = None) -> bool:
+        """Queue ``session`` to be saved. Returns False if it was dropped."""
+        if self._closed:
+            logger.warning("Memory save queue is closed, dropping session %s", session.id)
+            self._drop()
+            return False
+        key = (session.app_name, session.user_id, session.id)
+        passthrough_key = get_request_passthrough_key()
+        pending = self._pending.get(key)
+        if pending is not None:
+            pending.session = session
+            pending.model = model
+            pending.model_key = _model_key(model)
+            pending.passthrough_key = passthrough_key
+            _saves.add(1, {"result": "merged"})
+            return True
+        if len(self._pending) >= self.max_size:
+            logger.warning("Memory save queue is full (%d sessions), dropping session %s", self.max_size, session.id)
+            self._drop()
+            return False
+        self._ensure_workers()
+        self._pending[key] = _PendingSave(session, model, time.monotonic(), _model_key(model), passthrough_key)
+        self._queue.put_nowait(key)
+        _queue_depth.add(1)
+        _saves.add(1, {"result": "queued"})
+        return True
+
+    async def drain(self) -> None:
+        """Stop accepting saves, wait up to ``drain_timeout`` for queued ones, then stop the workers."""
+        self._closed = True
+        if self._queue is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=self.drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Timed out draining memory save queue, %d sessions not saved", self.depth)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        if self._pending:
+            _queue_depth.add(-len(self._pending))
+            self._pending.clear()
+
+    def _drop(self) -> None:
+        self.dropped += 1
+        _saves.add(1, {"result": "dropped"})
+
+    def _ensure_workers(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if not self._workers:
+            # Tasks copy the current context, which here is the submitting request's
+            self._workers = [
+                contextvars.Context().run(asyncio.create_task, self._work()) for _ in range(self.concurrency)
+            ]
+
+    def _take_batch(self, key: Tuple[str, str, str], first: _PendingSave) -> List[_PendingSave]:
+        """Remove and return other queued saves of the same user, model configuration and passthrough key."""
+        batch = []
+        for other_key, pending in list(self._pending.items()):
+            if len(batch) >= self.max_batch_size - 1:
+                break
+            if (
+                other_key[:2] == key[:2]
+                and pending.model_key == first.model_key
+                and pending.passthrough_key == first.passthrough_key
+            ):
+                batch.append(self._pending.pop(other_key))
+        return batch
+
+    async def _work(self) -> None:
+        while True:
+            key = await self._queue.get()
+            try:
+                pending = self._pending.pop(key, None)
+                if pending is None:
+                    # Already saved as part of an earlier batch
+                    continue
+                batch = [pending, *self._take_batch(key, pending)]
+                _queue_depth.add(-len(batch))
+                _batch_size.record(len(batch))
+                start = time.monotonic()
+                for item in batch:
+                    _queue_wait.record(start - item.enqueued_at)
+                sessions = [item.session for item in batch]
+                try:
+                    with use_passthrough_key(pending.passthrough_key):
+                        await self._save(sessions, pending.model)
+                except Exception as e:
+                    logger.error("Failed to save sessions %s to memory: %s", ", ".join(s.id for s in sessions), e)
+                _save_duration.record(time.monotonic() - start)
+            finally:
+                self._queue.task_done()
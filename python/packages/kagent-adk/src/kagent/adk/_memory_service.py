@@ -1,12 +1,17 @@
 """Kagent Memory Service implementation conforming to ADK BaseMemoryService interface."""
 
 import asyncio
+import inspect
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, TypeVar, Union
 
 import httpx
 import numpy as np
+from google.adk.events import Event
 from google.adk.memory import BaseMemoryService
 from google.adk.memory.base_memory_service import SearchMemoryResponse
 from google.adk.memory.memory_entry import MemoryEntry
@@ -14,10 +19,94 @@ from google.adk.models import BaseLlm
 from google.adk.sessions import Session
 from google.genai import types
 
-from kagent.adk.types import EmbeddingConfig
+from kagent.adk._bedrock_embedding import (
+    AdaptiveConcurrencyLimiter,
+    EmbeddingInputType,
+    embed_bedrock,
+    get_bedrock_embed_concurrency,
+)
+from kagent.adk._embedding_cache import EmbeddingCache
+from kagent.adk._memory_index import LocalMemoryIndex
+from kagent.adk._memory_save_queue import MemorySaveQueue
+from kagent.adk.types import MEMORY_WATERMARK_STATE_KEY, EmbeddingConfig
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Default number of memories returned by a search and the minimum similarity score they need
+DEFAULT_SEARCH_LIMIT = 5
+DEFAULT_SEARCH_MIN_SCORE = 0.3
+# Rank constant of reciprocal rank fusion; larger values flatten the weight of the top ranks
+_RRF_K = 60
+# Most query vectors the Kagent server accepts in one batch search request
+_SEARCH_BATCH_MAX_VECTORS = 50
+# Dimension of the vectors stored by the Kagent memory backend
+EMBEDDING_DIMENSION = 768
+# Most session watermarks kept in-process until their session's next turn persists them
+_MAX_PENDING_WATERMARKS = 4096
+
+
+def _is_string_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+def reciprocal_rank_fusion(ranked_lists: Sequence[Sequence[T]], key: Callable[[T], Hashable]) -> List[Tuple[T, float]]:
+    """Fuse ranked result lists with reciprocal rank fusion.
+
+    Each item scores ``1 / (k + rank)`` summed over the lists it appears in,
+    so items ranked highly by several queries come first. Items are
+    deduplicated by ``key``, keeping their first occurrence.
+
+    Returns:
+        ``(item, fused score)`` pairs ordered by descending fused score
+    """
+    fused: Dict[Hashable, List[Any]] = {}
+    for ranked in ranked_lists:
+        for rank, item in enumerate(ranked, start=1):
+            entry = fused.setdefault(key(item), [item, 0.0])
+            entry[1] += 1.0 / (_RRF_K + rank)
+    return sorted(((item, score) for item, score in fused.values()), key=lambda pair: pair[1], reverse=True)
+
+
+_SUMMARY_PROMPT = """Extract and summarize the key information from this conversation that would be useful for the agent to remember in future interactions.
+
+Focus on:
+- User preferences, decisions, and explicit requests
+- Important facts mentioned (names, dates, project names, etc.)
+- Contextual information that provides background
+- Lessons learned from the conversation
+
+You MUST output a JSON list of strings, where each string is a distinct fact or memory.
+Example: ["User prefers dark mode", "Meeting scheduled for Friday", "Always use the save_memory tool to store memory"]
+
+Do not include any preamble or markdown formatting like ```json.
+Output ONLY the JSON list.
+
+Conversation:
+{content}
+
+Summary (JSON List):"""
+
+_BATCH_SUMMARY_PROMPT = """Extract and summarize the key information from each of the following {count} conversations that would be useful for the agent to remember in future interactions.
+
+Focus on:
+- User preferences, decisions, and explicit requests
+- Important facts mentioned (names, dates, project names, etc.)
+- Contextual information that provides background
+- Lessons learned from the conversation
+
+You MUST output a JSON list with exactly {count} elements, one per conversation in order.
+Each element is a JSON list of strings, where each string is a distinct fact or memory from that conversation.
+Example for 2 conversations: [["User prefers dark mode", "Meeting scheduled for Friday"], ["User works on project Apollo"]]
+
+Do not include any preamble or markdown formatting like ```json.
+Output ONLY the JSON list.
+
+{conversations}
+
+Summaries (JSON List of Lists):"""
+
 
 class KagentMemoryService(BaseMemoryService):
     """Memory service that stores and retrieves memories via Kagent backend.
@@ -26,6 +115,25 @@ class KagentMemoryService(BaseMemoryService):
     1. Extracts text content from Session events
     2. Generates embeddings using provider-specific SDK clients
     3. Stores/searches via Kagent API backed by pgvector
+
+    Embedding SDK clients are created once per provider configuration and
+    reused, so calls share credentials and connection pools. They are closed
+    by ``aclose``, which the app lifespan calls on shutdown.
+
+    Embeddings are cached by a hash of provider, model and text (see
+    ``EmbeddingCache``), so repeated queries are not embedded again.
+
+    Sessions are saved to memory by a bounded pool of background workers (see
+    ``MemorySaveQueue``), which ``aclose`` drains before closing the clients.
+    Only events newer than the session's memory watermark are summarized. The
+    watermark advances in this service after each successful save; the agent
+    executor persists it in session state on the session's next turn (see
+    ``watermark_state_delta``), so background saves never write to a live session.
+
+    With a ``LocalMemoryIndex``, saved memories are also indexed in-process.
+    Searches for a user whose index was recently synced from the backend are
+    answered locally; otherwise the backend answers and a sync is started. If
+    the backend cannot be reached, searches fall back to the local index.
     """
 
     def __init__(
@@ -34,6 +142,11 @@ class KagentMemoryService(BaseMemoryService):
         http_client: httpx.AsyncClient,
         embedding_config: Optional[EmbeddingConfig] = None,
         ttl_days: int = 0,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        save_queue: Optional[MemorySaveQueue] = None,
+        local_index: Optional[LocalMemoryIndex] = None,
+        search_limit: int = DEFAULT_SEARCH_LIMIT,
+        search_min_score: float = DEFAULT_SEARCH_MIN_SCORE,
     ):
         """Initialize KagentMemoryService.
 
@@ -42,59 +155,158 @@ class KagentMemoryService(BaseMemoryService):
             http_client: Async HTTP client configured with base_url for Kagent API
             embedding_config: Configuration for embedding model (EmbeddingConfig only).
             ttl_days: TTL for memory entries in days. 0 means use the server default.
+            embedding_cache: Cache of computed embeddings. Defaults to one configured by
+                KAGENT_EMBEDDING_CACHE_SIZE and KAGENT_EMBEDDING_CACHE_PATH.
+            save_queue: Queue that runs session saves in the background. Defaults to one
+                configured by the KAGENT_MEMORY_SAVE_* environment variables.
+            local_index: In-process memory index searched before the backend. Defaults to one
+                configured by the KAGENT_MEMORY_LOCAL_INDEX* environment variables, if enabled.
+            search_limit: Maximum number of memories returned by a search.
+            search_min_score: Minimum similarity score of returned memories.
         """
         self.agent_name = agent_name
         self.client = http_client
         self.embedding_config = embedding_config
         self.ttl_days = ttl_days
+        self.search_limit = search_limit
+        self.search_min_score = search_min_score
+        self._embedding_clients: Dict[tuple, Any] = {}
+        self._bedrock_limiter = AdaptiveConcurrencyLimiter(get_bedrock_embed_concurrency())
+        self.embedding_cache = EmbeddingCache.from_env() if embedding_cache is None else embedding_cache
+        self.save_queue = save_queue or MemorySaveQueue(self._add_sessions_to_memory_background)
+        # Watermarks of sessions saved by this process, ahead of the session state until
+        # the executor persists them; least recently advanced first
+        self._watermarks: OrderedDict[tuple, float] = OrderedDict()
+        self.local_index = LocalMemoryIndex.from_env() if local_index is None else local_index
+        self._index_syncs: Dict[str, asyncio.Task] = {}
+        self._index_sync_attempts: Dict[str, float] = {}
+        # Cleared if the server predates the batch search endpoint
+        self._batch_search_supported = True
+        # Cleared if the server cannot list memories with their vectors
+        self._vector_list_supported = True
+
+    def lifespan(self):
+        """Returns an async context manager that drains queued saves and closes the clients on shutdown."""
+
+        @asynccontextmanager
+        async def _lifespan(app: Any):
+            try:
+                yield
+            finally:
+                await self.aclose()
+
+        return _lifespan
+
+    async def aclose(self) -> None:
+        """Drain queued saves, close the cached embedding clients and persist the caches."""
+        await self.save_queue.drain()
+        for task in self._index_syncs.values():
+            task.cancel()
+        await asyncio.gather(*self._index_syncs.values(), return_exceptions=True)
+        self._index_syncs.clear()
+        if self.local_index is not None:
+            try:
+                self.local_index.save()
+            except Exception as e:
+                logger.warning("Failed to save local memory index: %s", e)
+        try:
+            self.embedding_cache.save()
+        except Exception as e:
+            logger.warning("Failed to save embedding cache: %s", e)
+        clients = list(self._embedding_clients.values())
+        self._embedding_clients.clear()
+        for client in clients:
+            try:
+                result = client.close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning("Failed to close embedding client %s: %s", type(client).__name__, e)
+
+    def _embedding_client(self, key: tuple, factory: Callable[[], Any]) -> Any:
+        """Return the cached embedding client for ``key``, creating it on first use."""
+        client = self._embedding_clients.get(key)
+        if client is None:
+            client = factory()
+            self._embedding_clients[key] = client
+        return client
 
     async def add_session_to_memory(self, session: Session, model: Optional[Any] = None) -> None:
         """Add a session's content to long-term memory (non-blocking).
 
-        Schedules the actual work as a background task so the caller returns
+        Queues the actual work on the background save queue so the caller returns
         immediately. Memory saving (summarization, embedding, storage) happens
         asynchronously and does not block the agent from handling the next request.
+        If the session is already queued, the queued copy is replaced by this one.
 
         Args:
             session: The session to add to memory
             model: Optional ADK model object (e.g., OpenAI, KAgentAnthropicLlm) to use for summarization.
         """
-        asyncio.create_task(self._add_session_to_memory_background(session, model))
+        self.save_queue.submit(session, model)
 
     async def _add_session_to_memory_background(self, session: Session, model: Optional[Any] = None) -> None:
+        """Background implementation of add_session_to_memory for a single session."""
+        await self._add_sessions_to_memory_background([session], model)
+
+    async def _add_sessions_to_memory_background(self, sessions: List[Session], model: Optional[Any] = None) -> None:
         """Background implementation of add_session_to_memory.
 
-        Extracts text from session events, summarizes it using LLM, generates
-        an embedding, and stores it in the Kagent backend with TTL support.
+        Extracts text from the events each session added since its last
+        successful save, summarizes it using LLM (in a single call for all
+        sessions), generates embeddings, and stores them in the Kagent backend
+        with TTL support. The save queue only batches sessions of one user.
 
         Args:
-            session: The session to add to memory
+            sessions: The sessions to add to memory
             model: Optional ADK model object (e.g., OpenAI, KAgentAnthropicLlm) to use for summarization.
         """
+        session_ids = ", ".join(session.id for session in sessions)
         try:
-            # Extract content from session events
-            raw_content = self._extract_session_content(session)
-            if not raw_content:
-                logger.debug("No content to add to memory from session %s", session.id)
+            # Extract content from the events not yet saved to memory
+            pending = []
+            for session in sessions:
+                watermark = self._get_watermark(session)
+                new_events = [e for e in session.events or [] if e.timestamp > watermark]
+                if not new_events:
+                    logger.debug("No new events to add to memory from session %s", session.id)
+                    continue
+                saved_until = max(e.timestamp for e in new_events)
+                raw_content = self._extract_session_content(session, events=new_events)
+                if not raw_content:
+                    logger.debug("No content to add to memory from session %s", session.id)
+                    self._advance_watermark(session, saved_until)
+                    continue
+                logger.debug("Adding session %s to memory for user %s", session.id, session.user_id)
+                pending.append((session, saved_until, raw_content))
+            if not pending:
                 return
 
-            logger.debug("Adding session %s to memory for user %s", session.id, session.user_id)
-
             # Summarize content before embedding
-            # Returns a list of strings (individual facts/memories)
-            contents = await self._summarize_session_content_async(raw_content, model=model)
+            # Returns a list of strings (individual facts/memories) per session
+            if len(pending) == 1:
+                summaries = [await self._summarize_session_content_async(pending[0][2], model=model)]
+            else:
+                summaries = await self._summarize_sessions_content_async([c for _, _, c in pending], model=model)
 
             # Filter out empty content items
-            valid_contents = [c for c in contents if c]
-            if not valid_contents:
+            valid_items = [
+                (session, content)
+                for (session, _, _), contents in zip(pending, summaries, strict=True)
+                for content in contents
+                if content
+            ]
+            if not valid_items:
+                for session, saved_until, _ in pending:
+                    self._advance_watermark(session, saved_until)
                 return
 
-            logger.debug("Generating embeddings for %d content items", len(valid_contents))
+            logger.debug("Generating embeddings for %d content items", len(valid_items))
 
             # Batch generate embeddings
-            vectors = await self._generate_embedding_async(valid_contents)
+            vectors = await self._generate_embedding_async([content for _, content in valid_items])
             if not vectors:
-                logger.warning("Failed to generate embeddings for session %s", session.id)
+                logger.warning("Failed to generate embeddings for sessions %s", session_ids)
                 return
 
             if not isinstance(vectors[0], (list, np.ndarray)):
@@ -105,7 +317,7 @@ class KagentMemoryService(BaseMemoryService):
             batch_items = []
 
             # Iterate over synced content and vectors
-            for content_item, vector in zip(valid_contents, vectors, strict=True):
+            for (session, content_item), vector in zip(valid_items, vectors, strict=True):
                 if not vector:
                     continue
 
@@ -122,13 +334,16 @@ class KagentMemoryService(BaseMemoryService):
             if not batch_items:
                 return
 
+            self._index_memories(batch_items)
             response = await self.client.post("/api/memories/sessions/batch", json={"items": batch_items})
             if response.status_code >= 400:
                 logger.error("Response body: %s", response.text)
             response.raise_for_status()
             logger.info("Successfully saved %d memory items via batch API", len(batch_items))
+            for session, saved_until, _ in pending:
+                self._advance_watermark(session, saved_until)
         except Exception as e:
-            logger.error("Failed to save session %s to memory in background: %s", session.id, e)
+            logger.error("Failed to save sessions %s to memory in background: %s", session_ids, e)
 
     async def add_memory(
         self,
@@ -167,6 +382,7 @@ class KagentMemoryService(BaseMemoryService):
         if self.ttl_days > 0:
             payload["ttl_days"] = self.ttl_days
 
+        self._index_memories([payload])
         try:
             response = await self.client.post("/api/memories/sessions", json=payload)
             if response.status_code >= 400:
@@ -195,7 +411,7 @@ class KagentMemoryService(BaseMemoryService):
             SearchMemoryResponse containing matching MemoryEntry objects
         """
         # Generate embedding for the query
-        vector = await self._generate_embedding_async(query)
+        vector = await self._generate_embedding_async(query, input_type="search_query")
         if not vector:
             logger.warning("Failed to generate embedding for search query")
             return SearchMemoryResponse(memories=[])
@@ -204,25 +420,20 @@ class KagentMemoryService(BaseMemoryService):
             "agent_name": self.agent_name,
             "user_id": user_id,
             "vector": vector,
-            "limit": 5,
-            "min_score": 0.3,
+            "limit": self.search_limit,
+            "min_score": self.search_min_score,
         }
 
-        try:
+        async def _search_backend() -> List[List[Dict[str, Any]]]:
             response = await self.client.post("/api/memories/search", json=payload)
             if response.status_code >= 400:
                 logger.error("Response body: %s", response.text)
             response.raise_for_status()
-            results = response.json()
+            return [response.json()]
 
-            memories = []
-            for item in results:
-                content = types.Content(
-                    role="user",
-                    parts=[types.Part(text=item.get("content", ""))],
-                )
-                memory_entry = MemoryEntry(id=item.get("id"), content=content)
-                memories.append(memory_entry)
+        try:
+            results = await self._search_indexed(user_id, [vector], _search_backend)
+            memories = self._to_memory_entries(results[0])
 
             if len(memories) == 0:
                 logger.warning("No memories found for query: %s", query)
@@ -234,7 +445,204 @@ class KagentMemoryService(BaseMemoryService):
             logger.error("Failed to search memory: %s", e)
             return SearchMemoryResponse(memories=[])
 
-    def _extract_session_content(self, session: Session) -> str:
+    async def search_memory_batch(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        queries: List[str],
+    ) -> SearchMemoryResponse:
+        """Search memory for several queries at once.
+
+        All queries are embedded with a single provider call and searched with
+        a single request. The per-query results are fused with reciprocal rank
+        fusion, so memories that match several queries rank first, and the
+        best ``search_limit`` memories are returned. Each memory's
+        ``custom_metadata`` holds its best similarity ``score`` and its fused
+        ``rrf_score``.
+
+        Args:
+            app_name: The application name (used for filtering)
+            user_id: The user ID to search within
+            queries: The search query texts
+
+        Returns:
+            SearchMemoryResponse containing the matching MemoryEntry objects of all queries
+        """
+        queries = list(dict.fromkeys(q for q in queries if q))
+        if not queries:
+            return SearchMemoryResponse(memories=[])
+
+        vectors = await self._generate_embedding_async(queries, input_type="search_query")
+        if not vectors:
+            logger.warning("Failed to generate embeddings for %d search queries", len(queries))
+            return SearchMemoryResponse(memories=[])
+
+        try:
+            ranked_lists = await self._search_indexed(user_id, vectors, lambda: self._search_vectors(user_id, vectors))
+        except Exception as e:
+            logger.error("Failed to search memory: %s", e)
+            return SearchMemoryResponse(memories=[])
+
+        results = self._fuse_results(ranked_lists)[: self.search_limit]
+        logger.info("Retrieved %d memories for %d queries", len(results), len(queries))
+        return SearchMemoryResponse(memories=self._to_memory_entries(results))
+
+    async def _search_vectors(self, user_id: str, vectors: List[List[float]]) -> List[List[Dict[str, Any]]]:
+        """Search memory with several query vectors, returning the results of each."""
+        payload: Dict[str, Any] = {
+            "agent_name": self.agent_name,
+            "user_id": user_id,
+            "vectors": vectors,
+            "limit": self.search_limit,
+            "min_score": self.search_min_score,
+            "per_query": True,
+        }
+        if self._batch_search_supported:
+            # The server rejects batches of more than _SEARCH_BATCH_MAX_VECTORS vectors
+            chunks = [
+                vectors[i : i + _SEARCH_BATCH_MAX_VECTORS] for i in range(0, len(vectors), _SEARCH_BATCH_MAX_VECTORS)
+            ]
+            responses = await asyncio.gather(
+                *[
+                    self.client.post("/api/memories/search/batch", json={**payload, "vectors": chunk})
+                    for chunk in chunks
+                ]
+            )
+            if all(response.status_code not in (404, 405) for response in responses):
+                results: List[List[Dict[str, Any]]] = []
+                for response in responses:
+                    if response.status_code >= 400:
+                        logger.error("Response body: %s", response.text)
+                    response.raise_for_status()
+                    chunk_results = response.json()
+                    # Servers that predate per-query results return one merged list
+                    if chunk_results and not isinstance(chunk_results[0], list):
+                        chunk_results = [chunk_results]
+                    results.extend(chunk_results)
+                return results
+            logger.info("Memory batch search endpoint not available, searching once per query")
+            self._batch_search_supported = False
+
+        del payload["vectors"], payload["per_query"]
+        responses = await asyncio.gather(
+            *[self.client.post("/api/memories/search", json={**payload, "vector": vector}) for vector in vectors]
+        )
+        for response in responses:
+            response.raise_for_status()
+        return [response.json() for response in responses]
+
+    @staticmethod
+    def _fuse_results(ranked_lists: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Fuse per-query results by reciprocal rank, keeping each memory's best similarity score."""
+        best_scores: Dict[Any, float] = {}
+        for item in (item for ranked in ranked_lists for item in ranked):
+            best_scores[item.get("id")] = max(item.get("score", 0.0), best_scores.get(item.get("id"), 0.0))
+        return [
+            {**item, "score": best_scores[item.get("id")], "rrf_score": rrf_score}
+            for item, rrf_score in reciprocal_rank_fusion(ranked_lists, key=lambda item: item.get("id"))
+        ]
+
+    async def _search_indexed(
+        self,
+        user_id: str,
+        vectors: List[List[float]],
+        search_backend: Callable[[], Awaitable[List[List[Dict[str, Any]]]]],
+    ) -> List[List[Dict[str, Any]]]:
+        """Search the local index if it is fresh for ``user_id``, otherwise the backend, per query vector."""
+        index = self.local_index
+        if index is None:
+            return await search_backend()
+        if index.is_fresh(user_id):
+            return index.search(user_id, vectors, self.search_limit, self.search_min_score)
+        self._schedule_index_sync(user_id)
+        try:
+            return await search_backend()
+        except httpx.HTTPError as e:
+            logger.warning("Memory backend search failed, using local index: %s", e)
+            return index.search(user_id, vectors, self.search_limit, self.search_min_score)
+
+    def _index_memories(self, items: List[Dict[str, Any]]) -> None:
+        """Add memories about to be stored in the backend to the local index."""
+        if self.local_index is None:
+            return
+        for item in items:
+            user_id, content = item["user_id"], item["content"]
+            self.local_index.add(user_id, [(LocalMemoryIndex.local_id(user_id, content), content, item["vector"])])
+
+    def _schedule_index_sync(self, user_id: str) -> None:
+        """Start reloading a user's local index from the backend, at most once per sync interval."""
+        if not self._vector_list_supported or user_id in self._index_syncs:
+            return
+        now = time.monotonic()
+        if now - self._index_sync_attempts.get(user_id, -float("inf")) < self.local_index.sync_seconds:
+            return
+        self._index_sync_attempts[user_id] = now
+        task = asyncio.create_task(self._sync_index(user_id))
+        self._index_syncs[user_id] = task
+        task.add_done_callback(lambda _: self._index_syncs.pop(user_id, None))
+
+    async def _sync_index(self, user_id: str) -> None:
+        try:
+            response = await self.client.get(
+                "/api/memories",
+                params={"agent_name": self.agent_name, "user_id": user_id, "include_vectors": "true"},
+            )
+            response.raise_for_status()
+            items = response.json()
+        except Exception as e:
+            logger.debug("Failed to sync local memory index for user %s: %s", user_id, e)
+            return
+        if any(not item.get("vector") for item in items):
+            logger.info("Memory backend does not list memory vectors, local index is only used as a fallback")
+            self._vector_list_supported = False
+            return
+        self.local_index.replace(user_id, [(item["id"], item["content"], item["vector"]) for item in items])
+        logger.debug("Synced %d memories into the local index for user %s", len(items), user_id)
+
+    def _to_memory_entries(self, results: List[Dict[str, Any]]) -> List[MemoryEntry]:
+        memories = []
+        for item in results:
+            content = types.Content(
+                role="user",
+                parts=[types.Part(text=item.get("content", ""))],
+            )
+            metadata = {key: item[key] for key in ("score", "rrf_score") if key in item}
+            memories.append(MemoryEntry(id=item.get("id"), content=content, custom_metadata=metadata))
+        return memories
+
+    def _get_watermark(self, session: Session) -> float:
+        """Timestamp of the last session event saved to memory, 0 if none was."""
+        key = (session.app_name, session.user_id, session.id)
+        return max(session.state.get(MEMORY_WATERMARK_STATE_KEY, 0.0), self._watermarks.get(key, 0.0))
+
+    def _advance_watermark(self, session: Session, saved_until: float) -> None:
+        """Record that the session events up to ``saved_until`` are saved to memory."""
+        key = (session.app_name, session.user_id, session.id)
+        self._watermarks[key] = max(self._watermarks.get(key, 0.0), saved_until)
+        self._watermarks.move_to_end(key)
+        # A session whose next turn never comes only loses the watermark's head start on its state
+        while len(self._watermarks) > _MAX_PENDING_WATERMARKS:
+            self._watermarks.popitem(last=False)
+
+    def watermark_state_delta(self, session: Session) -> Dict[str, Any]:
+        """State delta persisting the session's memory watermark, empty if already persisted.
+
+        Called by the agent executor at the start of a turn, so the watermark
+        is written by the request that owns the session rather than by the
+        background save. The watermark is forgotten once the session state
+        holds it, so it is kept until the write is seen to have succeeded.
+        """
+        key = (session.app_name, session.user_id, session.id)
+        watermark = self._watermarks.get(key)
+        if watermark is None:
+            return {}
+        if watermark <= session.state.get(MEMORY_WATERMARK_STATE_KEY, 0.0):
+            del self._watermarks[key]
+            return {}
+        return {MEMORY_WATERMARK_STATE_KEY: watermark}
+
+    def _extract_session_content(self, session: Session, events: Optional[List[Event]] = None) -> str:
         """Extract text content from session events.
 
         Combines all user and agent messages into a single searchable text.
@@ -242,13 +650,16 @@ class KagentMemoryService(BaseMemoryService):
 
         Args:
             session: The session to extract content from
+            events: Events to extract content from. Defaults to all session events.
 
         Returns:
             Combined text content from the session
         """
+        if events is None:
+            events = session.events or []
         parts = []
 
-        for event in session.events or []:
+        for event in events:
             if event.content and event.content.parts:
                 for part in event.content.parts:
                     # Skip tool calls and executable code requests
@@ -289,7 +700,7 @@ class KagentMemoryService(BaseMemoryService):
         return "\n".join(parts)
 
     def _normalize_l2(self, x):
-        x = np.array(x)
+        x = np.asarray(x, dtype=np.float32)
         if x.ndim == 1:
             norm = np.linalg.norm(x)
             if norm == 0:
@@ -297,15 +708,42 @@ class KagentMemoryService(BaseMemoryService):
             return x / norm
         else:
             norm = np.linalg.norm(x, 2, axis=1, keepdims=True)
-            return np.where(norm == 0, x, x / norm)
+            return np.divide(x, norm, out=x.copy(), where=norm != 0)
+
+    def _prepare_embeddings(self, raw_embeddings: List[List[float]]) -> Optional[np.ndarray]:
+        """Bring a batch of embeddings to EMBEDDING_DIMENSION as one 2-D float32 array.
+
+        Most Matryoshka Representation Learning embedding models produce embeddings that still have
+        meaning when truncated to specific sizes: https://huggingface.co/blog/matryoshka
+        Longer embeddings are truncated and L2-normalized again, so the vector storage backend gets
+        consistent dimensions. Returns None if any embedding is shorter than required.
+        """
+        dims = [len(embedding) for embedding in raw_embeddings]
+        if min(dims) < EMBEDDING_DIMENSION:
+            logger.error(
+                "Embedding dimension %d is smaller than required %d; rejecting embeddings batch",
+                min(dims),
+                EMBEDDING_DIMENSION,
+            )
+            return None
+        # Slice before converting so the dropped dimensions are never copied
+        batch = np.array([embedding[:EMBEDDING_DIMENSION] for embedding in raw_embeddings], dtype=np.float32)
+        truncated = np.asarray(dims) > EMBEDDING_DIMENSION
+        if truncated.all():
+            batch = self._normalize_l2(batch)
+        elif truncated.any():
+            batch[truncated] = self._normalize_l2(batch[truncated])
+        return batch
 
     async def _generate_embedding_async(
-        self, input_data: Union[str, List[str]]
+        self, input_data: Union[str, List[str]], input_type: EmbeddingInputType = "search_document"
     ) -> Union[List[float], List[List[float]]]:
         """Generate embedding vector(s) using provider-specific SDK clients.
 
         Args:
             input_data: Single string or list of strings to embed.
+            input_type: "search_document" for texts saved to memory, "search_query" for
+                texts memory is searched with. Only models that embed the two differently use it.
 
         Returns:
             Single vector (List[float]) if input is string,
@@ -327,28 +765,42 @@ class KagentMemoryService(BaseMemoryService):
         texts = input_data if is_batch else [input_data]
         api_base = self.embedding_config.base_url or None
 
+        cache = self.embedding_cache
+        cached: Dict[int, List[float]] = {}
+        if cache.enabled:
+            keys = [EmbeddingCache.key(provider, model_name, text, input_type) for text in texts]
+            for i, key in enumerate(keys):
+                vector = cache.get(key)
+                if vector is not None:
+                    cached[i] = vector.tolist()
+        if len(cached) == len(texts):
+            embeddings = [cached[i] for i in range(len(texts))]
+            return embeddings if is_batch else embeddings[0]
+        # Embed each distinct uncached text once
+        missing = list(dict.fromkeys(text for i, text in enumerate(texts) if i not in cached))
+
         try:
-            raw_embeddings = await self._call_embedding_provider(provider, model_name, texts, api_base)
+            raw_embeddings = await self._call_embedding_provider(
+                provider, model_name, missing, api_base, input_type=input_type
+            )
         except Exception as e:
             logger.error("Error generating embedding with provider=%s model=%s: %s", provider, model_name, e)
             return []
+        if len(raw_embeddings) != len(missing):
+            logger.error("Expected %d embeddings from provider=%s, got %d", len(missing), provider, len(raw_embeddings))
+            return []
+
+        batch = self._prepare_embeddings(raw_embeddings) if raw_embeddings else None
+        if batch is None:
+            return []
+        # Serialized once for the whole batch
+        embeddings = batch.tolist()
 
-        # Most Matryoshka Representation Learning embedding models produce embeddings that still have
-        # meaning when truncated to specific sizes: https://huggingface.co/blog/matryoshka
-        # We must ensure embeddings have consistent dimensions for the vector storage backend.
-        embeddings = []
-        for embedding in raw_embeddings:
-            dim = len(embedding)
-            if dim > 768:
-                embedding = embedding[:768]
-                embedding = self._normalize_l2(embedding).tolist()
-            elif dim < 768:
-                logger.error(
-                    "Embedding dimension %d is smaller than required 768; rejecting embeddings batch",
-                    dim,
-                )
-                return []
-            embeddings.append(embedding)
+        fetched = dict(zip(missing, embeddings, strict=True))
+        if cache.enabled:
+            for text, vector in zip(missing, batch, strict=True):
+                cache.put(EmbeddingCache.key(provider, model_name, text, input_type), vector.copy())
+        embeddings = [cached[i] if i in cached else fetched[text] for i, text in enumerate(texts)]
 
         if is_batch:
             return embeddings
@@ -360,6 +812,7 @@ class KagentMemoryService(BaseMemoryService):
         model_name: str,
         texts: List[str],
         api_base: Optional[str],
+        input_type: EmbeddingInputType = "search_document",
     ) -> List[List[float]]:
         """Dispatch to the correct provider SDK for embedding generation."""
         if provider in ("openai", "azure_openai"):
@@ -369,7 +822,7 @@ class KagentMemoryService(BaseMemoryService):
         if provider in ("vertex_ai", "gemini"):
             return await self._embed_google(provider, model_name, texts)
         if provider == "bedrock":
-            return await self._embed_bedrock(model_name, texts)
+            return await self._embed_bedrock(model_name, texts, input_type)
         # Unknown provider — try OpenAI-compatible as a fallback
         logger.warning("Unknown embedding provider '%s'; attempting OpenAI-compatible call.", provider)
         return await self._embed_openai("openai", model_name, texts, api_base)
@@ -391,11 +844,14 @@ class KagentMemoryService(BaseMemoryService):
             azure_endpoint = api_base or os.environ.get("AZURE_OPENAI_ENDPOINT")
             if not azure_endpoint:
                 raise ValueError("Azure OpenAI endpoint must be set via base_url or AZURE_OPENAI_ENDPOINT env var")
-            client = AsyncAzureOpenAI(api_version=api_version, azure_endpoint=azure_endpoint)
+            client = self._embedding_client(
+                (provider, api_version, azure_endpoint),
+                lambda: AsyncAzureOpenAI(api_version=api_version, azure_endpoint=azure_endpoint),
+            )
         else:
             from openai import AsyncOpenAI
 
-            client = AsyncOpenAI(base_url=api_base or None)
+            client = self._embedding_client((provider, api_base), lambda: AsyncOpenAI(base_url=api_base or None))
 
         response = await client.embeddings.create(model=model_name, input=texts, dimensions=768)
         return [item.embedding for item in response.data]
@@ -412,7 +868,7 @@ class KagentMemoryService(BaseMemoryService):
         import ollama
 
         host = api_base or os.environ.get("OLLAMA_API_BASE", "http://localhost:11434")
-        client = ollama.AsyncClient(host=host)
+        client = self._embedding_client(("ollama", host), lambda: ollama.AsyncClient(host=host))
         result = await client.embed(model=model_name, input=texts)
         return list(result.embeddings)
 
@@ -427,9 +883,9 @@ class KagentMemoryService(BaseMemoryService):
         from google.genai import types as genai_types
 
         if provider == "vertex_ai":
-            client = genai.Client(vertexai=True)
+            client = self._embedding_client((provider,), lambda: genai.Client(vertexai=True))
         else:
-            client = genai.Client()
+            client = self._embedding_client((provider,), genai.Client)
 
         response = await asyncio.to_thread(
             client.models.embed_content,
@@ -443,34 +899,24 @@ class KagentMemoryService(BaseMemoryService):
         self,
         model_name: str,
         texts: List[str],
+        input_type: EmbeddingInputType = "search_document",
     ) -> List[List[float]]:
-        """Embed using the AWS Bedrock Titan Embedding API via boto3.
+        """Embed using the AWS Bedrock embedding models via boto3.
 
         Uses the same credential chain (env vars, IRSA, instance profile) as
-        KAgentBedrockLlm.  Each text is embedded individually because the
-        Titan Embedding API accepts a single ``inputText`` per invocation.
+        KAgentBedrockLlm. Cohere models embed texts in batches; Titan models
+        accept a single ``inputText`` per invocation, so those requests run
+        with bounded, throttling-aware concurrency (see ``embed_bedrock``).
         """
         import os
 
         import boto3
 
         region = os.environ.get("AWS_DEFAULT_REGION") or os.environ.get("AWS_REGION") or "us-east-1"
-        client = boto3.client("bedrock-runtime", region_name=region)
-
-        async def _invoke_single(text: str) -> List[float]:
-            body = json.dumps({"inputText": text})
-            response = await asyncio.to_thread(
-                client.invoke_model,
-                modelId=model_name,
-                body=body,
-                contentType="application/json",
-                accept="application/json",
-            )
-            result = json.loads(response["body"].read())
-            return result["embedding"]
-
-        embeddings = await asyncio.gather(*[_invoke_single(t) for t in texts])
-        return list(embeddings)
+        client = self._embedding_client(
+            ("bedrock", region), lambda: boto3.client("bedrock-runtime", region_name=region)
+        )
+        return await embed_bedrock(client, model_name, texts, self._bedrock_limiter, input_type)
 
     async def _summarize_session_content_async(
         self,
@@ -494,68 +940,14 @@ class KagentMemoryService(BaseMemoryService):
             logger.debug("No model provided for summarization, using original content")
             return [content]
 
-        # NOTE: In the future, we may allow configuring a separate, potentially cheaper
-        # model specifically for summarization tasks to optimize costs.
-        prompt = """Extract and summarize the key information from this conversation that would be useful for the agent to remember in future interactions.
-
-Focus on:
-- User preferences, decisions, and explicit requests
-- Important facts mentioned (names, dates, project names, etc.)
-- Contextual information that provides background
-- Lessons learned from the conversation
-
-You MUST output a JSON list of strings, where each string is a distinct fact or memory.
-Example: ["User prefers dark mode", "Meeting scheduled for Friday", "Always use the save_memory tool to store memory"]
-
-Do not include any preamble or markdown formatting like ```json.
-Output ONLY the JSON list.
-
-Conversation:
-{content}
-
-Summary (JSON List):"""
-
         try:
-            from google.adk.models.llm_request import LlmRequest
-            from google.genai.types import Content, Part
-
-            # Build LLM request using ADK types
-            llm_request = LlmRequest(
-                contents=[
-                    Content(
-                        role="user",
-                        parts=[Part(text=prompt.format(content=content))],
-                    )
-                ],
-            )
-
-            # Call the model directly
             logger.debug("Summarizing session content using model %s", model.model)
-            response_generator = model.generate_content_async(llm_request, stream=False)
-
-            # Consume the async generator (streaming response)
-            summary_text = ""
-            async for chunk in response_generator:
-                if chunk.content and chunk.content.parts:
-                    summary_text += "".join(
-                        part.text for part in chunk.content.parts if hasattr(part, "text") and part.text
-                    )
-
-            summary_text = summary_text.strip()
+            summary_text = await self._generate_text_async(_SUMMARY_PROMPT.format(content=content), model)
 
             if summary_text:
-                # Clean up potential markdown formatting if model ignores instruction
-                if summary_text.startswith("```json"):
-                    summary_text = summary_text[7:]
-                if summary_text.startswith("```"):
-                    summary_text = summary_text[3:]
-                if summary_text.endswith("```"):
-                    summary_text = summary_text[:-3]
-                summary_text = summary_text.strip()
-
                 try:
                     extracted_list = json.loads(summary_text)
-                    if isinstance(extracted_list, list) and all(isinstance(item, str) for item in extracted_list):
+                    if _is_string_list(extracted_list):
                         logger.debug("Summarized session content into %d items", len(extracted_list))
                         return extracted_list
                     else:
@@ -572,3 +964,65 @@ Summary (JSON List):"""
         except Exception as e:
             logger.warning("Failed to summarize session content: %s. Using original.", e)
             return [content]
+
+    async def _summarize_sessions_content_async(
+        self,
+        contents: List[str],
+        model: Optional[BaseLlm] = None,
+    ) -> List[List[str]]:
+        """Summarize the content of several sessions with a single LLM call.
+
+        Falls back to summarizing each session on its own if the model does not
+        return one list of strings per session.
+
+        Returns:
+            One list of summarized content strings per entry of ``contents``
+        """
+        if model is None:
+            logger.debug("No model provided for summarization, using original content")
+            return [[content] for content in contents]
+
+        conversations = "\n\n".join(f"### Conversation {i + 1}\n{content}" for i, content in enumerate(contents))
+        try:
+            logger.debug("Summarizing %d sessions using model %s", len(contents), model.model)
+            summary_text = await self._generate_text_async(
+                _BATCH_SUMMARY_PROMPT.format(count=len(contents), conversations=conversations), model
+            )
+            summaries = json.loads(summary_text)
+            if (
+                isinstance(summaries, list)
+                and len(summaries) == len(contents)
+                and all(_is_string_list(summary) for summary in summaries)
+            ):
+                return summaries
+            logger.warning("LLM did not return one list of strings per session, summarizing sessions separately")
+        except Exception as e:
+            logger.warning("Failed to summarize %d sessions together: %s", len(contents), e)
+
+        return list(
+            await asyncio.gather(*[self._summarize_session_content_async(content, model=model) for content in contents])
+        )
+
+    async def _generate_text_async(self, prompt: str, model: BaseLlm) -> str:
+        """Send a single-turn prompt to ``model`` and return its text, without markdown code fences."""
+        from google.adk.models.llm_request import LlmRequest
+        from google.genai.types import Content, Part
+
+        # Build LLM request using ADK types
+        llm_request = LlmRequest(contents=[Content(role="user", parts=[Part(text=prompt)])])
+
+        # Consume the async generator (streaming response)
+        text = ""
+        async for chunk in model.generate_content_async(llm_request, stream=False):
+            if chunk.content and chunk.content.parts:
+                text += "".join(part.text for part in chunk.content.parts if hasattr(part, "text") and part.text)
+
+        text = text.strip()
+        # Clean up potential markdown formatting if model ignores instruction
+        if text.startswith("```json"):
+            text = text[7:]
+        if text.startswith("```"):
+            text = text[3:]
+        if text.endswith("```"):
+            text = text[:-3]
+        return text.strip()
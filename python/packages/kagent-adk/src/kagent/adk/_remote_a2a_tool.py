@@ -155,6 +155,10 @@ class KAgentRemoteA2ATool(BaseTool):
         """The subagent's session ID (== context_id sent in the A2A message)."""
         return self._last_context_id
 
+    def reset_request_state(self) -> None:
+        """Start a new subagent session for the next request when the tool is reused."""
+        self._last_context_id = str(uuid.uuid4())
+
     async def _ensure_client(self) -> A2AClient:
         """Lazily resolve the agent card and initialize the A2A client."""
         if self._a2a_client is not None:
@@ -469,6 +473,9 @@ class KAgentRemoteA2AToolset(BaseToolset):
         """The subagent's session ID (== context_id sent in the A2A message)."""
         return self._tool.subagent_session_id
 
+    def reset_request_state(self) -> None:
+        self._tool.reset_request_state()
+
     async def get_tools(self, readonly_context: Optional[ReadonlyContext] = None) -> list[BaseTool]:
         return [self._tool]
 
@@ -0,0 +1,268 @@
+"""Bounded pool of warm ADK runners reused across A2A requests."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, Protocol, runtime_checkable
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.artifacts import InMemoryArtifactService
+from google.adk.runners import Runner
+from google.adk.tools.mcp_tool.mcp_toolset import McpToolset
+from pydantic import BaseModel
+
+from ._mcp_toolset import SharedMcpSessionManager
+
+logger = logging.getLogger("kagent_adk." + __name__)
+
+RUNNER_POOL_SIZE_ENV_VAR = "KAGENT_RUNNER_POOL_SIZE"
+RUNNER_POOL_IDLE_TTL_ENV_VAR = "KAGENT_RUNNER_POOL_IDLE_TTL_SECONDS"
+RUNNER_POOL_MAX_USES_ENV_VAR = "KAGENT_RUNNER_POOL_MAX_USES"
+
+
+class RunnerPoolConfig(BaseModel):
+    """Configuration for the A2A executor runner pool."""
+
+    max_size: int = 4  # Maximum number of idle runners kept warm
+    idle_ttl_seconds: float = 300.0  # Idle runners older than this are closed instead of reused
+    max_uses: int = 0  # Recycle a runner after this many requests. 0 means unlimited.
+
+
+def get_runner_pool_config() -> RunnerPoolConfig | None:
+    """Get the runner pool configuration from environment variables.
+
+    Environment variables:
+        KAGENT_RUNNER_POOL_SIZE: Maximum number of idle runners to keep. Unset or "0"
+                                 disables pooling (a fresh runner per request).
+        KAGENT_RUNNER_POOL_IDLE_TTL_SECONDS: Idle time after which a runner is closed.
+        KAGENT_RUNNER_POOL_MAX_USES: Number of requests after which a runner is recycled.
+
+    Returns:
+        The pool configuration, or None if pooling is disabled.
+    """
+    size_str = os.getenv(RUNNER_POOL_SIZE_ENV_VAR)
+    if not size_str:
+        return None
+    try:
+        max_size = int(size_str)
+    except ValueError:
+        logger.warning(f"Invalid {RUNNER_POOL_SIZE_ENV_VAR} value: {size_str}, runner pooling disabled")
+        return None
+    if max_size <= 0:
+        return None
+
+    config = RunnerPoolConfig(max_size=max_size)
+    ttl_str = os.getenv(RUNNER_POOL_IDLE_TTL_ENV_VAR)
+    if ttl_str:
+        try:
+            config.idle_ttl_seconds = float(ttl_str)
+        except ValueError:
+            logger.warning(f"Invalid {RUNNER_POOL_IDLE_TTL_ENV_VAR} value: {ttl_str}, using default")
+    max_uses_str = os.getenv(RUNNER_POOL_MAX_USES_ENV_VAR)
+    if max_uses_str:
+        try:
+            config.max_uses = int(max_uses_str)
+        except ValueError:
+            logger.warning(f"Invalid {RUNNER_POOL_MAX_USES_ENV_VAR} value: {max_uses_str}, using default")
+    logger.info("Runner pooling enabled: %s", config)
+    return config
+
+
+@runtime_checkable
+class SupportsRequestStateReset(Protocol):
+    """Protocol for tools, toolsets and models that hold per-request state.
+
+    Pooled runners are reused across requests, so anything that would otherwise
+    rely on being rebuilt for every request must clear that state here.
+    """
+
+    def reset_request_state(self) -> None: ...
+
+
+def _iter_agents(agent: BaseAgent):
+    yield agent
+    for sub_agent in agent.sub_agents or []:
+        yield from _iter_agents(sub_agent)
+
+
+def reset_runner_request_state(runner: Runner) -> None:
+    """Reset the per-request state held by a runner before it is reused."""
+    for agent in _iter_agents(runner.agent):
+        if not isinstance(agent, LlmAgent):
+            continue
+        if isinstance(agent.model, SupportsRequestStateReset):
+            agent.model.reset_request_state()
+        for tool in agent.tools:
+            if isinstance(tool, SupportsRequestStateReset):
+                tool.reset_request_state()
+
+    # Artifacts were scoped to a single request when runners were not shared
+    if isinstance(runner.artifact_service, InMemoryArtifactService):
+        runner.artifact_service.artifacts.clear()
+
+
+def runner_mcp_sessions_healthy(runner: Runner) -> bool:
+    """Whether none of the MCP sessions owned by a runner has disconnected.
+
+    Toolsets that share their sessions through the process-wide registry are
+    skipped: those sessions outlive the runner and are reconnected by the
+    registry. A runner whose own sessions dropped is rebuilt instead of reused.
+    """
+    for agent in _iter_agents(runner.agent):
+        if not isinstance(agent, LlmAgent):
+            continue
+        for tool in agent.tools:
+            if not isinstance(tool, McpToolset):
+                continue
+            manager = tool._mcp_session_manager
+            if isinstance(manager, SharedMcpSessionManager):
+                continue
+            for session, _, _ in list(manager._sessions.values()):
+                if manager._is_session_disconnected(session):
+                    return False
+    return True
+
+
+@dataclass
+class _PooledRunner:
+    runner: Runner
+    uses: int = 0
+    idle_since: float = 0.0
+
+
+class RunnerPool:
+    """A bounded pool of warm runners.
+
+    Each runner is handed to at most one request at a time. Acquiring never
+    blocks: when no idle runner is available a new one is built. On release the
+    runner's per-request state is reset and it is returned to the pool, unless
+    the request failed, the runner has reached ``max_uses`` or the pool already
+    holds ``max_size`` idle runners, in which case it is closed.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[Runner]],
+        close_runner: Callable[[Runner], Awaitable[None]],
+        config: RunnerPoolConfig,
+        health_check: Optional[Callable[[Runner], bool | Awaitable[bool]]] = None,
+    ):
+        """Initialize the runner pool.
+
+        Args:
+            factory: Coroutine function building a new runner
+            close_runner: Coroutine function closing a runner that leaves the pool
+            config: Pool size and recycling configuration
+            health_check: Optional check run on an idle runner before it is reused
+        """
+        self._factory = factory
+        self._close_runner = close_runner
+        self._config = config
+        self._health_check = health_check
+        self._idle: deque[_PooledRunner] = deque()
+        self._in_use: dict[int, _PooledRunner] = {}
+        self._closed = False
+
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    @property
+    def in_use_count(self) -> int:
+        return len(self._in_use)
+
+    async def acquire(self) -> Runner:
+        """Take a warm runner from the pool, or build a new one."""
+        if self._closed:
+            raise RuntimeError("Runner pool is closed")
+
+        while self._idle:
+            # Most recently released first: its connections are the most likely to still be alive
+            entry = self._idle.pop()
+            if self._is_expired(entry) or not await self._is_healthy(entry.runner):
+                await self._discard(entry)
+                continue
+            self.reused += 1
+            self._in_use[id(entry.runner)] = entry
+            return entry.runner
+
+        runner = await self._factory()
+        self.created += 1
+        entry = _PooledRunner(runner=runner)
+        self._in_use[id(runner)] = entry
+        return runner
+
+    async def release(self, runner: Runner, *, reusable: bool = True) -> None:
+        """Return a runner to the pool once its request has finished.
+
+        Args:
+            runner: The runner previously returned by acquire()
+            reusable: False if the request failed and the runner should not be reused
+        """
+        entry = self._in_use.pop(id(runner), None)
+        if entry is None:
+            entry = _PooledRunner(runner=runner)
+        entry.uses += 1
+
+        if self._closed or not reusable or self._reached_max_uses(entry):
+            await self._discard(entry)
+            return
+
+        try:
+            reset_runner_request_state(runner)
+        except Exception as e:
+            logger.warning("Failed to reset pooled runner state, discarding runner: %s", e)
+            await self._discard(entry)
+            return
+
+        entry.idle_since = time.monotonic()
+        self._idle.append(entry)
+        await self._evict()
+
+    async def close(self) -> None:
+        """Close all idle runners. Runners still in use are closed when released."""
+        self._closed = True
+        while self._idle:
+            await self._discard(self._idle.popleft())
+
+    def _is_expired(self, entry: _PooledRunner) -> bool:
+        return time.monotonic() - entry.idle_since > self._config.idle_ttl_seconds
+
+    def _reached_max_uses(self, entry: _PooledRunner) -> bool:
+        return self._config.max_uses > 0 and entry.uses >= self._config.max_uses
+
+    async def _is_healthy(self, runner: Runner) -> bool:
+        if self._health_check is None:
+            return True
+        try:
+            result = self._health_check(runner)
+            if inspect.isawaitable(result):
+                result = await result
+            return bool(result)
+        except Exception as e:
+            logger.warning("Runner health check failed: %s", e)
+            return False
+
+    async def _evict(self) -> None:
+        # Oldest idle runners are at the left of the deque
+        while self._idle and (len(self._idle) > self._config.max_size or self._is_expired(self._idle[0])):
+            await self._discard(self._idle.popleft())
+
+    async def _discard(self, entry: _PooledRunner) -> None:
+        self.discarded += 1
+        try:
+            await self._close_runner(entry.runner)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Error closing pooled runner: %s", e, exc_info=True)
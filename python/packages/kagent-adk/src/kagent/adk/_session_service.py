@@ -1,9 +1,18 @@
+import asyncio
+import copy
 import logging
+import os
+import re
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from typing import Any, Optional
+from urllib.parse import quote
 
 import httpx
 from google.adk.events.event import Event
-from google.adk.sessions import Session
+from google.adk.sessions import Session, State
 from google.adk.sessions.base_session_service import (
     BaseSessionService,
     GetSessionConfig,
@@ -13,16 +22,135 @@ from typing_extensions import override
 
 logger = logging.getLogger("kagent." + __name__)
 
+SESSION_CACHE_SIZE_ENV_VAR = "KAGENT_SESSION_CACHE_SIZE"
+DEFAULT_SESSION_CACHE_SIZE = 128
+SESSION_EVENT_BATCHING_ENV_VAR = "KAGENT_SESSION_EVENT_BATCHING"
+SESSION_EVENT_FLUSH_INTERVAL_ENV_VAR = "KAGENT_SESSION_EVENT_FLUSH_INTERVAL_SECONDS"
+DEFAULT_SESSION_EVENT_FLUSH_INTERVAL_SECONDS = 0.5
+# Buffered events of a session are flushed right away once this many are pending
+MAX_EVENT_BATCH_SIZE = 100
+# Delta fetches re-read the events stored this long before the cursor. created_at is taken when
+# an event is inserted, so an event may become visible after a newer one, and several may share it.
+CURSOR_OVERLAP_SECONDS = 5.0
+
+_TIMESTAMP_RE = re.compile(r"^(.+T\d{2}:\d{2}:\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:\d{2})?$")
+
+
+def get_session_cache_size() -> int:
+    """Number of sessions whose events are cached in-process (KAGENT_SESSION_CACHE_SIZE, 0 disables)."""
+    value = os.getenv(SESSION_CACHE_SIZE_ENV_VAR)
+    if not value:
+        return DEFAULT_SESSION_CACHE_SIZE
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(
+            f"Invalid {SESSION_CACHE_SIZE_ENV_VAR} value: {value}, using default {DEFAULT_SESSION_CACHE_SIZE}"
+        )
+        return DEFAULT_SESSION_CACHE_SIZE
+
+
+def session_event_batching_enabled() -> bool:
+    """Whether appended events are buffered and persisted in batches (KAGENT_SESSION_EVENT_BATCHING, default true)."""
+    return os.getenv(SESSION_EVENT_BATCHING_ENV_VAR, "true").lower() != "false"
+
+
+def get_session_event_flush_interval() -> float:
+    """Delay before buffered events are flushed (KAGENT_SESSION_EVENT_FLUSH_INTERVAL_SECONDS)."""
+    value = os.getenv(SESSION_EVENT_FLUSH_INTERVAL_ENV_VAR)
+    if not value:
+        return DEFAULT_SESSION_EVENT_FLUSH_INTERVAL_SECONDS
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(
+            f"Invalid {SESSION_EVENT_FLUSH_INTERVAL_ENV_VAR} value: {value}, "
+            f"using default {DEFAULT_SESSION_EVENT_FLUSH_INTERVAL_SECONDS}"
+        )
+        return DEFAULT_SESSION_EVENT_FLUSH_INTERVAL_SECONDS
+
+
+@dataclass
+class _PendingEvents:
+    """Events of a session appended but not yet persisted, in append order."""
+
+    events: list[dict[str, str]] = field(default_factory=list)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    flush_task: Optional[asyncio.Task] = None
+
+
+@dataclass
+class _CachedSession:
+    """Events and derived state of a session already loaded by this process."""
+
+    events: list[Event] = field(default_factory=list)
+    event_ids: set[str] = field(default_factory=set)
+    state: dict[str, Any] = field(default_factory=dict)
+    last_update_time: float = 0.0
+    # created_at of the newest stored event seen, used as the `after` cursor of delta fetches
+    cursor: Optional[str] = None
+
+    def add(self, event: Event) -> None:
+        if event.actions and event.actions.state_delta:
+            for key, value in event.actions.state_delta.items():
+                if not key.startswith(State.TEMP_PREFIX):
+                    self.state[key] = value
+        self.events.append(event)
+        self.event_ids.add(event.id)
+        self.last_update_time = max(self.last_update_time, event.timestamp)
+
 
 class KAgentSessionService(BaseSessionService):
     """A session service implementation that uses the Kagent API.
     This service integrates with the Kagent server to manage session state
     and persistence through HTTP API calls.
+
+    Sessions loaded by get_session are cached in-process (LRU). Later loads of
+    a cached session only fetch the events stored since shortly before the
+    newest one already seen (``CURSOR_OVERLAP_SECONDS``), and only validate
+    events that are not cached yet, skipping the ones fetched again by id.
+
+    With event batching enabled, append_event updates the in-memory session
+    and buffers the event instead of persisting it right away. Buffered events
+    are written in a single batch request after ``flush_interval_seconds``,
+    when ``MAX_EVENT_BATCH_SIZE`` events are pending, before the session is
+    loaded again, and on flush_session_events()/flush() barriers.
     """
 
-    def __init__(self, client: httpx.AsyncClient):
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        cache_size: Optional[int] = None,
+        batch_events: Optional[bool] = None,
+        flush_interval_seconds: Optional[float] = None,
+    ):
         super().__init__()
         self.client = client
+        self._cache_size = get_session_cache_size() if cache_size is None else cache_size
+        self._cache: OrderedDict[tuple[str, str, str], _CachedSession] = OrderedDict()
+        self._batch_events = session_event_batching_enabled() if batch_events is None else batch_events
+        self._flush_interval_seconds = (
+            get_session_event_flush_interval() if flush_interval_seconds is None else flush_interval_seconds
+        )
+        # Keyed by (user_id, session_id)
+        self._pending: dict[tuple[str, str], _PendingEvents] = {}
+        # Cleared if the server predates the batch endpoint
+        self._batch_endpoint_supported = True
+
+    def lifespan(self):
+        """Returns an async context manager that flushes buffered events on shutdown."""
+
+        @asynccontextmanager
+        async def _lifespan(app: Any):
+            try:
+                yield
+            finally:
+                try:
+                    await self.flush()
+                except Exception as e:
+                    logger.error("Failed to flush session events on shutdown: %s", e)
+
+        return _lifespan
 
     @override
     async def create_session(
@@ -71,22 +199,98 @@ class KAgentSessionService(BaseSessionService):
         session_id: str,
         config: Optional[GetSessionConfig] = None,
     ) -> Optional[Session]:
+        # Reads must observe every event appended so far
+        await self._flush_pending((user_id, session_id))
+
+        cache_key = (app_name, user_id, session_id)
+        cached = self._cache.get(cache_key)
+        if self._cache_size <= 0 or (cached is None and config and config.num_recent_events):
+            # A limited load cannot prime the cache, which needs the full history
+            return await self._fetch_session(app_name=app_name, user_id=user_id, session_id=session_id, config=config)
+
         try:
             # ADK requires events to be chronological (especially for calculating deltas)
-            url = f"/api/sessions/{session_id}?user_id={user_id}&order=asc"
-            if config:
-                if config.after_timestamp:
-                    # TODO: implement
-                    # url += f"&after={config.after_timestamp}"
-                    pass
-                if config.num_recent_events:
-                    url += f"&limit={config.num_recent_events}"
-                else:
-                    url += "&limit=-1"
-            else:
-                # return all
-                url += "&limit=-1"
+            url = f"/api/sessions/{session_id}?user_id={user_id}&order=asc&limit=-1"
+            after = _delta_fetch_after(cached.cursor) if cached is not None and cached.cursor else None
+            if after:
+                url += f"&after={quote(after)}"
+            data = await self._get_session_data(url, user_id)
+        except Exception:
+            self._cache.pop(cache_key, None)
+            raise
+        if data is None:
+            self._cache.pop(cache_key, None)
+            return None
+
+        if cached is None:
+            cached = _CachedSession()
+        for event_data in data["events"]:
+            if event_data.get("created_at"):
+                cached.cursor = event_data["created_at"]
+            if event_data["id"] in cached.event_ids:
+                continue
+            cached.add(self._trim_temp_delta_state(Event.model_validate_json(event_data["data"])))
+        self._cache[cache_key] = cached
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+        events = _filter_events(cached.events, config)
+        session_data = data["session"]
+        # Cached events are shared between sessions, only the state is copied
+        return Session(
+            id=session_data["id"],
+            user_id=session_data["user_id"],
+            app_name=app_name,
+            events=events,
+            state=copy.deepcopy(cached.state),
+            last_update_time=cached.last_update_time,
+        )
+
+    async def _fetch_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        """Load a session without the cache."""
+        # ADK requires events to be chronological (especially for calculating deltas)
+        url = f"/api/sessions/{session_id}?user_id={user_id}&order=asc"
+        if config and config.num_recent_events:
+            url += f"&limit={config.num_recent_events}"
+        else:
+            # return all
+            url += "&limit=-1"
+
+        data = await self._get_session_data(url, user_id)
+        if data is None:
+            return None
+        session_data = data["session"]
+
+        events: list[Event] = []
+        for event_data in data["events"]:
+            events.append(Event.model_validate_json(event_data["data"]))
+
+        # Convert to ADK Session format
+        session = Session(
+            id=session_data["id"],
+            user_id=session_data["user_id"],
+            events=[],
+            app_name=app_name,
+            state={},
+        )
+
+        for event in events:
+            await super().append_event(session, event)
+
+        session.events = _filter_events(session.events, config)
+        return session
 
+    async def _get_session_data(self, url: str, user_id: str) -> Optional[dict[str, Any]]:
+        """GET a session with its events, returning None if it does not exist."""
+        try:
             # Make API call to get session
             response: httpx.Response = await self.client.get(
                 url,
@@ -95,39 +299,19 @@ class KAgentSessionService(BaseSessionService):
             if response.status_code == 404:
                 return None
             response.raise_for_status()
-
-            data = response.json()
-            if not data.get("data"):
-                return None
-
-            if not data.get("data").get("session"):
-                return None
-            session_data = data["data"]["session"]
-
-            events_data = data["data"]["events"]
-
-            events: list[Event] = []
-            for event_data in events_data:
-                events.append(Event.model_validate_json(event_data["data"]))
-
-            # Convert to ADK Session format
-            session = Session(
-                id=session_data["id"],
-                user_id=session_data["user_id"],
-                events=[],
-                app_name=app_name,
-                state={},
-            )
-
-            for event in events:
-                await super().append_event(session, event)
-
-            return session
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 return None
             raise
 
+        data = response.json()
+        if not data.get("data"):
+            return None
+
+        if not data.get("data").get("session"):
+            return None
+        return data["data"]
+
     @override
     async def list_sessions(self, *, app_name: str, user_id: str) -> ListSessionsResponse:
         # Make API call to list sessions
@@ -150,6 +334,10 @@ class KAgentSessionService(BaseSessionService):
 
     @override
     async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        self._cache.pop((app_name, user_id, session_id), None)
+        pending = self._pending.pop((user_id, session_id), None)
+        if pending is not None and pending.flush_task is not None:
+            pending.flush_task.cancel()
         # Make API call to delete session
         response = await self.client.delete(
             f"/api/sessions/{session_id}?user_id={user_id}",
@@ -168,17 +356,129 @@ class KAgentSessionService(BaseSessionService):
             "data": event.model_dump_json(),
         }
 
-        # Make API call to append event to session
-        response = await self.client.post(
-            f"/api/sessions/{session.id}/events?user_id={session.user_id}",
-            json=event_data,
-            headers={"X-User-ID": session.user_id},
-        )
-        response.raise_for_status()
+        if self._batch_events:
+            self._buffer_event(session, event_data)
+        else:
+            await self._post_event(session.id, session.user_id, event_data)
 
         # TODO: potentially pull and update the session from the server
         # Update the in-memory session.
         session.last_update_time = event.timestamp
         await super().append_event(session=session, event=event)
 
+        cached = self._cache.get((session.app_name, session.user_id, session.id))
+        if cached is not None and event.id not in cached.event_ids:
+            cached.add(event)
+
         return event
+
+    async def flush_session_events(self, session: Session) -> None:
+        """Persist the buffered events of a session, raising if the write fails."""
+        await self._flush_pending((session.user_id, session.id))
+
+    async def flush(self) -> None:
+        """Persist the buffered events of every session."""
+        errors = []
+        for key in list(self._pending):
+            try:
+                await self._flush_pending(key)
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            raise errors[0]
+
+    def _buffer_event(self, session: Session, event_data: dict[str, str]) -> None:
+        key = (session.user_id, session.id)
+        pending = self._pending.setdefault(key, _PendingEvents())
+        pending.events.append(event_data)
+        if pending.flush_task is None or pending.flush_task.done():
+            delay = 0.0 if len(pending.events) >= MAX_EVENT_BATCH_SIZE else self._flush_interval_seconds
+            pending.flush_task = asyncio.create_task(self._flush_later(key, delay))
+
+    async def _flush_later(self, key: tuple[str, str], delay: float) -> None:
+        await asyncio.sleep(delay)
+        try:
+            await self._flush_pending(key)
+        except Exception as e:
+            # Events stay buffered; the next barrier retries and surfaces the error
+            logger.warning("Failed to flush events of session %s: %s", key[1], e)
+
+    async def _flush_pending(self, key: tuple[str, str]) -> None:
+        pending = self._pending.get(key)
+        if pending is None:
+            return
+        user_id, session_id = key
+        async with pending.lock:
+            # Events are removed only once persisted, so a failed flush is retried as is
+            while pending.events:
+                if self._batch_endpoint_supported and len(pending.events) > 1:
+                    batch = pending.events[:MAX_EVENT_BATCH_SIZE]
+                    if await self._post_event_batch(session_id, user_id, batch):
+                        del pending.events[: len(batch)]
+                        continue
+                    # Either the session is gone or the server has no batch endpoint;
+                    # the single-event endpoint below tells them apart.
+                    await self._post_event(session_id, user_id, pending.events[0])
+                    del pending.events[0]
+                    logger.info("Session events batch endpoint not available, persisting events one by one")
+                    self._batch_endpoint_supported = False
+                    continue
+                await self._post_event(session_id, user_id, pending.events[0])
+                del pending.events[0]
+        if not pending.events and self._pending.get(key) is pending:
+            del self._pending[key]
+
+    async def _post_event_batch(self, session_id: str, user_id: str, events: list[dict[str, str]]) -> bool:
+        """Persist several events in one request. Returns False on 404/405."""
+        response = await self.client.post(
+            f"/api/sessions/{session_id}/events/batch?user_id={user_id}",
+            json={"events": events},
+            headers={"X-User-ID": user_id},
+        )
+        if response.status_code in (404, 405):
+            return False
+        response.raise_for_status()
+        return True
+
+    async def _post_event(self, session_id: str, user_id: str, event_data: dict[str, str]) -> None:
+        # Make API call to append event to session
+        response = await self.client.post(
+            f"/api/sessions/{session_id}/events?user_id={user_id}",
+            json=event_data,
+            headers={"X-User-ID": user_id},
+        )
+        response.raise_for_status()
+
+
+def _delta_fetch_after(cursor: str) -> Optional[str]:
+    """The `after` timestamp of a delta fetch: the cursor moved back by CURSOR_OVERLAP_SECONDS.
+
+    Returns None, so that the whole history is fetched, if the cursor cannot be parsed.
+    """
+    match = _TIMESTAMP_RE.match(cursor)
+    if match is None:
+        return None
+    seconds, fraction, offset = match.groups()
+    # fromisoformat before Python 3.11 takes neither Z nor nanoseconds
+    if offset is None or offset == "Z":
+        offset = "+00:00"
+    try:
+        timestamp = datetime.fromisoformat(f"{seconds}.{(fraction or '')[:6].ljust(6, '0')}{offset}")
+    except ValueError:
+        return None
+    return (timestamp - timedelta(seconds=CURSOR_OVERLAP_SECONDS)).isoformat()
+
+
+def _filter_events(events: list[Event], config: Optional[GetSessionConfig]) -> list[Event]:
+    """Apply num_recent_events and after_timestamp the way InMemorySessionService does."""
+    events = list(events)
+    if not config:
+        return events
+    if config.num_recent_events:
+        events = events[-config.num_recent_events :]
+    if config.after_timestamp:
+        i = len(events) - 1
+        while i >= 0 and events[i].timestamp >= config.after_timestamp:
+            i -= 1
+        events = events[i + 1 :]
+    return events
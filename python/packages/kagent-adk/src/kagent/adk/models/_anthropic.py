@@ -4,11 +4,18 @@ from __future__ import annotations
 
 import logging
 import os
-from functools import cached_property
 from typing import Optional
 
-from anthropic import AsyncAnthropic
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 from google.adk.models.anthropic_llm import AnthropicLlm
+from pydantic import PrivateAttr
+
+from ._client_registry import (
+    client_key,
+    get_llm_client_registry,
+    get_request_passthrough_key,
+    set_request_passthrough_key,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -18,21 +25,22 @@ class KAgentAnthropicLlm(AnthropicLlm):
 
     api_key_passthrough: Optional[bool] = None
 
-    _api_key: Optional[str] = None
     base_url: Optional[str] = None
     extra_headers: Optional[dict[str, str]] = None
 
     model_config = {"arbitrary_types_allowed": True}
 
+    # API key and client of the last _anthropic_client lookup, so that the registry key is hashed once per key
+    _resolved_client: Optional[tuple[Optional[str], AsyncAnthropic]] = PrivateAttr(default=None)
+
     def set_passthrough_key(self, token: str) -> None:
         """Forward the Bearer token from the incoming A2A request as the Anthropic API key."""
-        self._api_key = token
-        # Invalidate cached client so it's recreated with the new key
-        self.__dict__.pop("_anthropic_client", None)
+        set_request_passthrough_key(token)
 
-    @cached_property
-    def _anthropic_client(self) -> AsyncAnthropic:
-        api_key = self._api_key or os.environ.get("ANTHROPIC_API_KEY")
+    def _client_key(self, kind: str, api_key: Optional[str] = None) -> str:
+        return client_key(f"anthropic:{kind}", api_key=api_key, base_url=self.base_url, headers=self.extra_headers)
+
+    def _build_client(self, api_key: Optional[str], http_client: DefaultAsyncHttpxClient) -> AsyncAnthropic:
         kwargs = {}
         if api_key:
             kwargs["api_key"] = api_key
@@ -40,4 +48,32 @@ class KAgentAnthropicLlm(AnthropicLlm):
             kwargs["base_url"] = self.base_url
         if self.extra_headers:
             kwargs["default_headers"] = self.extra_headers
-        return AsyncAnthropic(**kwargs)
+        return AsyncAnthropic(http_client=http_client, **kwargs)
+
+    @property
+    def _anthropic_client(self) -> AsyncAnthropic:
+        """Shared client for the current request's passthrough key, or for the configured key."""
+        token = get_request_passthrough_key() if self.api_key_passthrough else None
+        api_key = token or os.environ.get("ANTHROPIC_API_KEY")
+        resolved = self._resolved_client
+        if resolved is not None and resolved[0] == api_key:
+            return resolved[1]
+        client = self._registry_client(token, api_key)
+        self._resolved_client = (api_key, client)
+        return client
+
+    def _registry_client(self, token: Optional[str], api_key: Optional[str]) -> AsyncAnthropic:
+        registry = get_llm_client_registry()
+        if token:
+            # Passthrough clients share one connection pool, so evicting them from the cache closes nothing
+            http_client = registry.get(
+                self._client_key("passthrough_pool"),
+                lambda: DefaultAsyncHttpxClient(**registry.http_client_kwargs()),
+            )
+            return registry.get_passthrough(
+                self._client_key("client", token), lambda: self._build_client(token, http_client)
+            )
+        return registry.get(
+            self._client_key("client", api_key),
+            lambda: self._build_client(api_key, DefaultAsyncHttpxClient(**registry.http_client_kwargs())),
+        )
@@ -11,19 +11,27 @@ import asyncio
 import json
 import logging
 import os
+import threading
+from contextlib import aclosing
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Iterable, Optional
 
 import boto3
 from google.adk.models import BaseLlm
 from google.adk.models.llm_response import LlmResponse
 from google.genai import types
 
+from ._streaming import StreamingTextAccumulator
+
 if TYPE_CHECKING:
     from google.adk.models.llm_request import LlmRequest
 
 logger = logging.getLogger(__name__)
 
+# Events read ahead of the consumer before the reader thread stops reading
+_STREAM_BUFFER_SIZE = 64
+_STREAM_END = object()
+
 
 def _get_bedrock_client(extra_headers: Optional[dict[str, str]] = None):
     region = os.environ.get("AWS_DEFAULT_REGION") or os.environ.get("AWS_REGION") or "us-east-1"
@@ -147,6 +155,79 @@ def _convert_tools_to_converse(tools: list[types.Tool]) -> list[dict]:
     return converse_tools
 
 
+async def _stream_events(open_stream: Callable[[], Iterable[dict]]) -> AsyncGenerator[dict, None]:
+    """Yield the events of a blocking Bedrock event stream as they arrive.
+
+    A worker thread opens and reads the stream and hands each event to the
+    event loop. At most ``_STREAM_BUFFER_SIZE`` events are buffered, so the
+    thread stops reading while the consumer falls behind. Closing the
+    generator, e.g. when the request is cancelled, closes the event stream,
+    which aborts the underlying HTTP response.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    slots = threading.Semaphore(_STREAM_BUFFER_SIZE)
+    stopped = threading.Event()
+    lock = threading.Lock()
+    event_stream: Any = None
+
+    def _put(item: Any) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            # The event loop is closed, nobody is reading anymore
+            stopped.set()
+
+    def _read() -> None:
+        nonlocal event_stream
+        try:
+            stream = open_stream()
+            with lock:
+                event_stream = stream
+            if stopped.is_set():
+                _close(stream)
+                return
+            for event in stream:
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                _put(event)
+        except Exception as e:
+            if not stopped.is_set():
+                _put(e)
+            return
+        _put(_STREAM_END)
+
+    reader = loop.run_in_executor(None, _read)
+    try:
+        while True:
+            item = await queue.get()
+            slots.release()
+            if item is _STREAM_END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+        # Wake the reader if it waits for a free slot
+        slots.release()
+        with lock:
+            stream = event_stream
+        if stream is not None and not reader.done():
+            _close(stream)
+
+
+def _close(event_stream: Any) -> None:
+    close = getattr(event_stream, "close", None)
+    if close is None:
+        return
+    try:
+        close()
+    except Exception as e:
+        logger.debug("Failed to close Bedrock event stream: %s", e)
+
+
 def _stop_reason_to_finish_reason(stop_reason: str) -> types.FinishReason:
     if stop_reason == "max_tokens":
         return types.FinishReason.MAX_TOKENS
@@ -212,59 +293,60 @@ class KAgentBedrockLlm(BaseLlm):
         if inference_config:
             kwargs["inferenceConfig"] = inference_config
 
-        def _run_converse_stream(**kw):
-            resp = client.converse_stream(**kw)
-            return list(resp.get("stream", []))
+        def _open_converse_stream():
+            return client.converse_stream(**kwargs).get("stream", [])
 
         try:
             if stream:
-                stream_body = await asyncio.to_thread(_run_converse_stream, **kwargs)
-
-                aggregated_text = ""
-                tool_uses: dict[str, dict] = {}  # toolUseId -> {name, input_json}
+                text_acc = StreamingTextAccumulator()
+                tool_uses: dict[str, dict] = {}  # toolUseId -> {name, input_chunks}
                 current_tool_id: Optional[str] = None
                 stop_reason = "end_turn"
                 usage_metadata: Optional[types.GenerateContentResponseUsageMetadata] = None
 
-                for event in stream_body:
-                    if "contentBlockStart" in event:
-                        start = event["contentBlockStart"].get("start", {})
-                        if "toolUse" in start:
-                            current_tool_id = start["toolUse"]["toolUseId"]
-                            tool_uses[current_tool_id] = {
-                                "name": start["toolUse"]["name"],
-                                "input_json": "",
-                            }
-
-                    elif "contentBlockDelta" in event:
-                        delta = event["contentBlockDelta"].get("delta", {})
-                        if "text" in delta:
-                            aggregated_text += delta["text"]
-                            yield LlmResponse(
-                                content=types.Content(role="model", parts=[types.Part.from_text(text=delta["text"])]),
-                                partial=True,
-                                turn_complete=False,
-                            )
-                        elif "toolUse" in delta and current_tool_id:
-                            tool_uses[current_tool_id]["input_json"] += delta["toolUse"].get("input", "")
-
-                    elif "messageStop" in event:
-                        stop_reason = event["messageStop"].get("stopReason", "end_turn")
-
-                    elif "metadata" in event:
-                        usage = event["metadata"].get("usage", {})
-                        if usage:
-                            usage_metadata = types.GenerateContentResponseUsageMetadata(
-                                prompt_token_count=usage.get("inputTokens"),
-                                candidates_token_count=usage.get("outputTokens"),
-                                total_token_count=usage.get("totalTokens"),
-                            )
+                async with aclosing(_stream_events(_open_converse_stream)) as events:
+                    async for event in events:
+                        if "contentBlockStart" in event:
+                            start = event["contentBlockStart"].get("start", {})
+                            if "toolUse" in start:
+                                current_tool_id = start["toolUse"]["toolUseId"]
+                                tool_uses[current_tool_id] = {
+                                    "name": start["toolUse"]["name"],
+                                    "input_chunks": [],
+                                }
+
+                        elif "contentBlockDelta" in event:
+                            delta = event["contentBlockDelta"].get("delta", {})
+                            if "text" in delta:
+                                partial_response = text_acc.add(delta["text"])
+                                if partial_response:
+                                    yield partial_response
+                            elif "toolUse" in delta and current_tool_id:
+                                tool_uses[current_tool_id]["input_chunks"].append(delta["toolUse"].get("input", ""))
+
+                        elif "messageStop" in event:
+                            stop_reason = event["messageStop"].get("stopReason", "end_turn")
+
+                        elif "metadata" in event:
+                            usage = event["metadata"].get("usage", {})
+                            if usage:
+                                usage_metadata = types.GenerateContentResponseUsageMetadata(
+                                    prompt_token_count=usage.get("inputTokens"),
+                                    candidates_token_count=usage.get("outputTokens"),
+                                    total_token_count=usage.get("totalTokens"),
+                                )
+
+                partial_response = text_acc.flush()
+                if partial_response:
+                    yield partial_response
 
                 final_parts = []
+                aggregated_text = text_acc.take()
                 if aggregated_text:
                     final_parts.append(types.Part.from_text(text=aggregated_text))
                 for tool_id, tool in tool_uses.items():
-                    args = json.loads(tool["input_json"]) if tool["input_json"] else {}
+                    input_json = "".join(tool["input_chunks"])
+                    args = json.loads(input_json) if input_json else {}
                     part = types.Part.from_function_call(name=tool["name"], args=args)
                     if part.function_call:
                         part.function_call.id = tool_id
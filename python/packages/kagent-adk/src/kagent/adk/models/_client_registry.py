@@ -0,0 +1,263 @@
+"""Process-wide registry of LLM provider clients shared by the per-request agents."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib.util
+import inspect
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, Iterator, Optional, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LLM_HTTP_MAX_CONNECTIONS_ENV_VAR = "KAGENT_LLM_HTTP_MAX_CONNECTIONS"
+LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS_ENV_VAR = "KAGENT_LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS"
+LLM_HTTP_KEEPALIVE_EXPIRY_ENV_VAR = "KAGENT_LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS"
+LLM_HTTP2_ENV_VAR = "KAGENT_LLM_HTTP2"
+LLM_PASSTHROUGH_CLIENT_CACHE_SIZE_ENV_VAR = "KAGENT_LLM_PASSTHROUGH_CLIENT_CACHE_SIZE"
+LLM_PASSTHROUGH_CLIENT_TTL_ENV_VAR = "KAGENT_LLM_PASSTHROUGH_CLIENT_TTL_SECONDS"
+DEFAULT_LLM_HTTP_MAX_CONNECTIONS = 100
+DEFAULT_LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS = 60.0
+DEFAULT_LLM_PASSTHROUGH_CLIENT_CACHE_SIZE = 128
+DEFAULT_LLM_PASSTHROUGH_CLIENT_TTL_SECONDS = 600.0
+# Time a superseded client is kept open for the requests still using it
+SUPERSEDED_CLIENT_CLOSE_DELAY_SECONDS = 600.0
+
+# Bearer token of the current request, used as the API key of api_key_passthrough models.
+# Each request runs in its own task, so concurrent requests never see each other's token.
+_request_passthrough_key: ContextVar[Optional[str]] = ContextVar("kagent_llm_passthrough_key", default=None)
+
+
+def set_request_passthrough_key(token: Optional[str]) -> None:
+    _request_passthrough_key.set(token)
+
+
+def get_request_passthrough_key() -> Optional[str]:
+    return _request_passthrough_key.get()
+
+
+@contextmanager
+def use_passthrough_key(token: Optional[str]) -> Iterator[None]:
+    """Use ``token`` as the passthrough key inside the block, for work done outside the request's task."""
+    reset_token = _request_passthrough_key.set(token)
+    try:
+        yield
+    finally:
+        _request_passthrough_key.reset(reset_token)
+
+
+def _env_number(name: str, default: Any, parse: Callable[[str], Any]) -> Any:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return parse(value)
+    except ValueError:
+        logger.warning(f"Invalid {name} value: {value}, using default {default}")
+        return default
+
+
+def get_llm_http_limits() -> httpx.Limits:
+    """Connection pool limits of LLM clients (KAGENT_LLM_HTTP_MAX_*CONNECTIONS, KAGENT_LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS)."""
+    return httpx.Limits(
+        max_connections=_env_number(LLM_HTTP_MAX_CONNECTIONS_ENV_VAR, DEFAULT_LLM_HTTP_MAX_CONNECTIONS, int),
+        max_keepalive_connections=_env_number(
+            LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS_ENV_VAR, DEFAULT_LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS, int
+        ),
+        keepalive_expiry=_env_number(
+            LLM_HTTP_KEEPALIVE_EXPIRY_ENV_VAR, DEFAULT_LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS, float
+        ),
+    )
+
+
+def llm_http2_enabled() -> bool:
+    """Whether LLM clients negotiate HTTP/2 (KAGENT_LLM_HTTP2, default false). Requires the h2 package."""
+    if os.getenv(LLM_HTTP2_ENV_VAR, "false").lower() != "true":
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning(f"{LLM_HTTP2_ENV_VAR} is set but the h2 package is not installed, using HTTP/1.1")
+        return False
+    return True
+
+
+def get_llm_passthrough_client_cache_size() -> int:
+    """Maximum number of cached passthrough key clients (KAGENT_LLM_PASSTHROUGH_CLIENT_CACHE_SIZE)."""
+    return _env_number(LLM_PASSTHROUGH_CLIENT_CACHE_SIZE_ENV_VAR, DEFAULT_LLM_PASSTHROUGH_CLIENT_CACHE_SIZE, int)
+
+
+def get_llm_passthrough_client_ttl() -> float:
+    """Seconds a passthrough key client is cached for (KAGENT_LLM_PASSTHROUGH_CLIENT_TTL_SECONDS)."""
+    return _env_number(LLM_PASSTHROUGH_CLIENT_TTL_ENV_VAR, DEFAULT_LLM_PASSTHROUGH_CLIENT_TTL_SECONDS, float)
+
+
+def client_key(provider: str, **settings: Any) -> str:
+    """Identify a client by provider and settings. API keys are hashed so they are not kept in the key."""
+    if settings.get("api_key"):
+        settings["api_key"] = hashlib.sha256(settings["api_key"].encode()).hexdigest()
+    return json.dumps({"provider": provider, **settings}, sort_keys=True, default=str)
+
+
+class LlmClientRegistry:
+    """Long-lived LLM provider clients, keyed by provider and connection settings.
+
+    Agents are built per request, so caching clients on the model instances
+    would open new connection pools for every request and never close them.
+    The registry hands out one client per distinct provider, base URL,
+    headers, TLS configuration and API key instead, and closes them on
+    shutdown. Clients it creates keep pooled connections alive with the
+    ``limits`` and ``http2`` settings, see ``http_client_kwargs``.
+
+    Clients for passthrough API keys are kept apart, in a cache bounded by
+    ``passthrough_cache_size`` whose entries expire after
+    ``passthrough_ttl_seconds``, see ``get_passthrough``.
+
+    A client can be registered with a ``version``, such as the fingerprint of
+    the CA file its connections trust. A client whose version changed is
+    replaced, and the superseded one is closed ``superseded_close_delay_seconds``
+    later, once the requests still using it are done.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,
+        passthrough_cache_size: Optional[int] = None,
+        passthrough_ttl_seconds: Optional[float] = None,
+        superseded_close_delay_seconds: float = SUPERSEDED_CLIENT_CLOSE_DELAY_SECONDS,
+    ):
+        self.limits = get_llm_http_limits() if limits is None else limits
+        self.http2 = llm_http2_enabled() if http2 is None else http2
+        self.passthrough_cache_size = (
+            get_llm_passthrough_client_cache_size() if passthrough_cache_size is None else passthrough_cache_size
+        )
+        self.passthrough_ttl_seconds = (
+            get_llm_passthrough_client_ttl() if passthrough_ttl_seconds is None else passthrough_ttl_seconds
+        )
+        self.superseded_close_delay_seconds = superseded_close_delay_seconds
+        self._clients: dict[str, Any] = {}
+        self._versions: dict[str, Hashable] = {}
+        # Passthrough key clients with their creation time and version, least recently used first
+        self._passthrough_clients: OrderedDict[str, tuple[Any, float, Hashable]] = OrderedDict()
+        # Superseded clients not closed yet, and the tasks that close them
+        self._superseded: list[Any] = []
+        self._close_tasks: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def http_client_kwargs(self) -> dict[str, Any]:
+        """Connection pool arguments for the httpx clients of registered clients."""
+        return {"limits": self.limits, "http2": self.http2}
+
+    def get(self, key: str, create: Callable[[], T], version: Hashable = None) -> T:
+        """Return the client registered under ``key``, creating it with ``create`` on first use.
+
+        A client registered with another ``version`` is replaced by a new one
+        and closed after ``superseded_close_delay_seconds``.
+        """
+        client = self._clients.get(key)
+        if client is not None and self._versions.get(key) != version:
+            logger.info("Replacing LLM client %s, its configuration changed", type(client).__name__)
+            self._close_later(client)
+            client = None
+        if client is None:
+            client = create()
+            self._clients[key] = client
+            self._versions[key] = version
+        return client
+
+    def get_passthrough(self, key: str, create: Callable[[], T], version: Hashable = None) -> T:
+        """Return the cached client for a passthrough API key, creating it with ``create`` if needed.
+
+        Evicted, expired and superseded clients are dropped without being
+        closed, since a request may still be using them. ``create`` must
+        therefore build them on an HTTP client registered with ``get``, which
+        is closed on shutdown or once it is superseded itself.
+        """
+        now = time.monotonic()
+        entry = self._passthrough_clients.get(key)
+        if entry is not None and now - entry[1] < self.passthrough_ttl_seconds and entry[2] == version:
+            self._passthrough_clients.move_to_end(key)
+            return entry[0]
+        client = create()
+        self._passthrough_clients[key] = (client, now, version)
+        self._passthrough_clients.move_to_end(key)
+        while len(self._passthrough_clients) > self.passthrough_cache_size:
+            self._passthrough_clients.popitem(last=False)
+        return client
+
+    def _close_later(self, client: Any) -> None:
+        self._superseded.append(client)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Closed on shutdown instead
+            return
+        task = loop.create_task(self._close_superseded(client))
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
+    async def _close_superseded(self, client: Any) -> None:
+        await asyncio.sleep(self.superseded_close_delay_seconds)
+        if client in self._superseded:
+            self._superseded.remove(client)
+            await _close_client(client)
+
+    async def close(self) -> None:
+        """Close every registered client, including superseded ones not closed yet."""
+        for task in list(self._close_tasks):
+            task.cancel()
+        clients = list(self._clients.values()) + self._superseded
+        self._clients.clear()
+        self._versions.clear()
+        self._passthrough_clients.clear()
+        self._superseded = []
+        for client in clients:
+            await _close_client(client)
+
+    def lifespan(self):
+        """Returns an async context manager that closes all clients on shutdown."""
+
+        @asynccontextmanager
+        async def _lifespan(app: Any):
+            try:
+                yield
+            finally:
+                await self.close()
+
+        return _lifespan
+
+
+async def _close_client(client: Any) -> None:
+    close = getattr(client, "aclose", None) or getattr(client, "close", None)
+    if close is None:
+        return
+    try:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        logger.warning("Failed to close LLM client %s: %s", type(client).__name__, e)
+
+
+_llm_client_registry: LlmClientRegistry | None = None
+
+
+def get_llm_client_registry() -> LlmClientRegistry:
+    """Return the process-wide LLM client registry."""
+    global _llm_client_registry
+    if _llm_client_registry is None:
+        _llm_client_registry = LlmClientRegistry()
+    return _llm_client_registry
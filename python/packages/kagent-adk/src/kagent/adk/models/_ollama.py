@@ -15,6 +15,9 @@ from google.genai import types
 from ollama import AsyncClient
 from ollama import Message as OllamaMessage
 
+from ._client_registry import client_key, get_llm_client_registry
+from ._streaming import StreamingTextAccumulator
+
 if TYPE_CHECKING:
     from google.adk.models.llm_request import LlmRequest
 
@@ -152,7 +155,11 @@ class KAgentOllamaLlm(BaseLlm):
     @cached_property
     def _client(self) -> AsyncClient:
         host = os.environ.get("OLLAMA_API_BASE", "http://localhost:11434")
-        return AsyncClient(host=host, headers=self.default_headers or {})
+        registry = get_llm_client_registry()
+        return registry.get(
+            client_key("ollama", host=host, headers=self.default_headers),
+            lambda: AsyncClient(host=host, headers=self.default_headers or {}, **registry.http_client_kwargs()),
+        )
 
     @classmethod
     def supported_models(cls) -> list[str]:
@@ -179,7 +186,7 @@ class KAgentOllamaLlm(BaseLlm):
 
         try:
             if stream:
-                aggregated_text = ""
+                text_acc = StreamingTextAccumulator()
                 response: AsyncIterator[ollama_sdk.ChatResponse] = await self._client.chat(
                     model=llm_request.model or self.model,
                     messages=messages,
@@ -189,16 +196,15 @@ class KAgentOllamaLlm(BaseLlm):
                 )
                 async for chunk in response:
                     if chunk.message.content:
-                        aggregated_text += chunk.message.content
-                        yield LlmResponse(
-                            content=types.Content(
-                                role="model", parts=[types.Part.from_text(text=chunk.message.content)]
-                            ),
-                            partial=True,
-                            turn_complete=False,
-                        )
+                        partial_response = text_acc.add(chunk.message.content)
+                        if partial_response:
+                            yield partial_response
                     if chunk.done:
+                        partial_response = text_acc.flush()
+                        if partial_response:
+                            yield partial_response
                         final_parts = []
+                        aggregated_text = text_acc.take()
                         if aggregated_text:
                             final_parts.append(types.Part.from_text(text=aggregated_text))
                         for tc in chunk.message.tool_calls or []:
@@ -32,11 +32,25 @@ from openai.types.chat.chat_completion_message_tool_call_param import (
 from openai.types.shared_params import FunctionDefinition, FunctionParameters
 from pydantic import Field
 
-from ._ssl import create_ssl_context
+from ._client_registry import (
+    client_key,
+    get_llm_client_registry,
+    get_request_passthrough_key,
+    set_request_passthrough_key,
+)
+from ._ssl import ca_cert_fingerprint, get_ssl_context
+from ._streaming import StreamingTextAccumulator
 
 if TYPE_CHECKING:
     from google.adk.models.llm_request import LlmRequest
 
+OPENAI_EARLY_TOOL_DISPATCH_ENV_VAR = "KAGENT_OPENAI_EARLY_TOOL_DISPATCH"
+
+
+def openai_early_tool_dispatch_enabled() -> bool:
+    """Whether streamed tool calls are emitted as soon as complete (KAGENT_OPENAI_EARLY_TOOL_DISPATCH, default false)."""
+    return os.getenv(OPENAI_EARLY_TOOL_DISPATCH_ENV_VAR, "false").lower() == "true"
+
 
 def _convert_role_to_openai(role: Optional[str]) -> str:
     """Convert google.genai role to OpenAI role."""
@@ -76,6 +90,70 @@ def _openai_extra_content_for_thought_signature(thought_signature: Optional[byte
     }
 
 
+class _StreamingToolCall:
+    """A tool call assembled from streamed chunks.
+
+    The JSON nesting of the argument fragments is tracked as they arrive, so
+    ``complete`` is set as soon as the closing brace of the arguments object
+    is received, without re-parsing the accumulated string on every chunk.
+    """
+
+    def __init__(self) -> None:
+        self.id = ""
+        self.name = ""
+        self.thought_signature: Optional[str] = None
+        self.complete = False
+        self.emitted = False
+        self._fragments: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    @property
+    def arguments(self) -> str:
+        return "".join(self._fragments)
+
+    def add_arguments(self, fragment: str) -> None:
+        self._fragments.append(fragment)
+        if self.complete:
+            return
+        for char in fragment:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.complete = True
+                    return
+
+    def parse_arguments(self) -> Optional[Any]:
+        """The decoded arguments, None if they are not valid JSON."""
+        arguments = self.arguments
+        if not arguments:
+            return {}
+        try:
+            return json.loads(arguments)
+        except json.JSONDecodeError:
+            return None
+
+    def to_part(self, args: Any) -> types.Part:
+        return _build_function_call_part(
+            name=self.name,
+            args=args,
+            tool_call_id=self.id,
+            thought_signature=self.thought_signature,
+        )
+
+
 def _thought_signatures_by_tool_call_id(contents: list[types.Content]) -> dict[str, bytes]:
     """Index function call thought signatures by tool call id."""
     thought_signatures: dict[str, bytes] = {}
@@ -390,7 +468,8 @@ class BaseOpenAI(BaseLlm):
     api_key_passthrough: Optional[bool] = None
 
     def set_passthrough_key(self, token: str) -> None:
-        self.api_key = token
+        """Use the Bearer token as the API key for the rest of the current request."""
+        set_request_passthrough_key(token)
 
     @classmethod
     def supported_models(cls) -> list[str]:
@@ -411,46 +490,83 @@ class BaseOpenAI(BaseLlm):
 
         return disable_verify, ca_cert_path, disable_system_cas
 
-    def _create_http_client(self) -> Optional[httpx.AsyncClient]:
+    def _create_http_client(self) -> httpx.AsyncClient:
         """Create HTTP client with custom SSL context using OpenAI SDK defaults.
 
         Uses DefaultAsyncHttpxClient to preserve OpenAI's default settings for
-        timeout, connection pooling, and redirect behavior while applying custom
-        SSL configuration.
+        timeout and redirect behavior while applying the shared connection pool
+        settings and custom SSL configuration.
 
         Returns:
-            DefaultAsyncHttpxClient with SSL configuration, or None if no TLS config
+            DefaultAsyncHttpxClient with pool and SSL configuration
         """
+        kwargs = get_llm_client_registry().http_client_kwargs()
         disable_verify, ca_cert_path, disable_system_cas = self._get_tls_config()
 
-        # Only create custom http client if TLS configuration is present
+        # Only customize verification if TLS configuration is present
         if disable_verify or ca_cert_path or disable_system_cas:
-            ssl_context = create_ssl_context(
+            # ssl_context is either False (verification disabled) or SSLContext
+            kwargs["verify"] = get_ssl_context(
                 disable_verify=disable_verify,
                 ca_cert_path=ca_cert_path,
                 disable_system_cas=disable_system_cas,
             )
 
-            # ssl_context is either False (verification disabled) or SSLContext
-            # Use DefaultAsyncHttpxClient to preserve OpenAI's defaults
-            return DefaultAsyncHttpxClient(verify=ssl_context)
+        return DefaultAsyncHttpxClient(**kwargs)
 
-        # No TLS configuration, return None to use OpenAI SDK default
-        return None
+    def _configured_api_key(self) -> Optional[str]:
+        """API key of the model's own client, used when there is no passthrough key."""
+        return self.api_key
 
-    @cached_property
-    def _client(self) -> AsyncOpenAI:
-        """Get the OpenAI client with optional custom SSL configuration."""
-        http_client = self._create_http_client()
+    def _client_settings(self) -> dict[str, Any]:
+        """Settings besides the API key, headers and TLS configuration that distinguish clients."""
+        return {"base_url": self.base_url, "timeout": self.timeout}
 
+    def _build_client(self, api_key: Optional[str], http_client: httpx.AsyncClient) -> AsyncOpenAI:
         return AsyncOpenAI(
-            api_key=self.api_key,
+            api_key=api_key,
             base_url=self.base_url or None,
             default_headers=self.default_headers,
             timeout=self.timeout,
             http_client=http_client,
         )
 
+    def _client_key(self, kind: str, api_key: Optional[str] = None) -> str:
+        return client_key(
+            f"{type(self).__name__}:{kind}",
+            api_key=api_key,
+            headers=self.default_headers,
+            tls=self._get_tls_config(),
+            **self._client_settings(),
+        )
+
+    def _client_version(self) -> Optional[tuple]:
+        """Fingerprint of the CA file, so a changed file replaces clients with ones using the reloaded SSL context."""
+        return ca_cert_fingerprint(self._get_tls_config()[1])
+
+    @cached_property
+    def _client(self) -> AsyncOpenAI:
+        """Get the shared client for this model's settings and configured API key."""
+        api_key = self._configured_api_key()
+        return get_llm_client_registry().get(
+            self._client_key("client", api_key),
+            lambda: self._build_client(api_key, self._create_http_client()),
+            version=self._client_version(),
+        )
+
+    def _request_client(self) -> AsyncOpenAI:
+        """Get the client for the current request, which uses its passthrough key if it has one."""
+        token = get_request_passthrough_key() if self.api_key_passthrough else None
+        if not token:
+            return self._client
+        registry = get_llm_client_registry()
+        version = self._client_version()
+        # Passthrough clients share one connection pool, so evicting them from the cache closes nothing
+        http_client = registry.get(self._client_key("passthrough_pool"), self._create_http_client, version=version)
+        return registry.get_passthrough(
+            self._client_key("client", token), lambda: self._build_client(token, http_client), version=version
+        )
+
     async def generate_content_async(
         self, llm_request: LlmRequest, stream: bool = False
     ) -> AsyncGenerator[LlmResponse, None]:
@@ -513,52 +629,81 @@ class BaseOpenAI(BaseLlm):
         try:
             if stream:
                 # Handle streaming
-                aggregated_text = ""
+                text_acc = StreamingTextAccumulator()
                 finish_reason = None
                 usage_metadata = None
                 # Accumulate tool calls - keyed by index since they arrive in chunks
-                tool_calls_acc: dict[int, dict[str, Any]] = {}
+                tool_calls_acc: dict[int, _StreamingToolCall] = {}
+                # Calls are emitted as soon as their arguments are complete, so ADK can start
+                # executing them while the rest of the response is still being streamed
+                early_tool_dispatch = openai_early_tool_dispatch_enabled()
+                # The last emitted call is held until more output arrives. If none does, it becomes the
+                # final response, since ADK drops a final response without content along with its usage.
+                held_response: Optional[LlmResponse] = None
 
                 # Request usage metadata in streaming mode (OpenAI API feature since Nov 2023)
                 # Without this option, chunk.usage is always None in streaming responses
-                async for chunk in await self._client.chat.completions.create(
+                async for chunk in await self._request_client().chat.completions.create(
                     stream=True, stream_options={"include_usage": True}, **kwargs
                 ):
                     if chunk.choices and chunk.choices[0].delta:
                         delta = chunk.choices[0].delta
 
+                        if held_response is not None and (delta.content or getattr(delta, "tool_calls", None)):
+                            yield held_response
+                            held_response = None
+
                         # Handle text content streaming
                         if delta.content:
-                            aggregated_text += delta.content
-                            content = types.Content(role="model", parts=[types.Part.from_text(text=delta.content)])
-                            yield LlmResponse(
-                                content=content, partial=True, turn_complete=chunk.choices[0].finish_reason is not None
+                            partial_response = text_acc.add(
+                                delta.content, turn_complete=chunk.choices[0].finish_reason is not None
                             )
+                            if partial_response:
+                                yield partial_response
 
                         # Handle tool call chunks - accumulate them
                         if hasattr(delta, "tool_calls") and delta.tool_calls:
                             for tool_call_chunk in delta.tool_calls:
-                                idx = tool_call_chunk.index
-                                if idx not in tool_calls_acc:
-                                    tool_calls_acc[idx] = {
-                                        "id": "",
-                                        "name": "",
-                                        "arguments": "",
-                                        "thought_signature": None,
-                                    }
+                                tc = tool_calls_acc.setdefault(tool_call_chunk.index, _StreamingToolCall())
                                 # Accumulate the chunks
                                 if tool_call_chunk.id:
-                                    tool_calls_acc[idx]["id"] = tool_call_chunk.id
+                                    tc.id = tool_call_chunk.id
                                 if tool_call_chunk.function:
                                     if tool_call_chunk.function.name:
-                                        tool_calls_acc[idx]["name"] = tool_call_chunk.function.name
+                                        tc.name = tool_call_chunk.function.name
                                     if tool_call_chunk.function.arguments:
-                                        tool_calls_acc[idx]["arguments"] += tool_call_chunk.function.arguments
+                                        tc.add_arguments(tool_call_chunk.function.arguments)
                                 thought_signature = _extract_thought_signature(
                                     getattr(tool_call_chunk, "model_extra", {}).get("extra_content")
                                 )
                                 if thought_signature:
-                                    tool_calls_acc[idx]["thought_signature"] = thought_signature
+                                    tc.thought_signature = thought_signature
+
+                            if early_tool_dispatch:
+                                for idx in sorted(tool_calls_acc.keys()):
+                                    tc = tool_calls_acc[idx]
+                                    if tc.emitted or not tc.complete or not tc.id or not tc.name:
+                                        continue
+                                    args = tc.parse_arguments()
+                                    if args is None:
+                                        continue
+                                    # Text streamed before the call stays ahead of it in the history
+                                    partial_response = text_acc.flush()
+                                    if partial_response:
+                                        yield partial_response
+                                    early_parts = []
+                                    text = text_acc.take()
+                                    if text:
+                                        early_parts.append(types.Part.from_text(text=text))
+                                    early_parts.append(tc.to_part(args))
+                                    tc.emitted = True
+                                    if held_response is not None:
+                                        yield held_response
+                                    held_response = LlmResponse(
+                                        content=types.Content(role="model", parts=early_parts),
+                                        partial=False,
+                                        turn_complete=False,
+                                    )
 
                         if chunk.choices[0].finish_reason:
                             finish_reason = chunk.choices[0].finish_reason
@@ -570,28 +715,25 @@ class BaseOpenAI(BaseLlm):
                             total_token_count=chunk.usage.total_tokens,
                         )
 
+                partial_response = text_acc.flush()
+                if partial_response:
+                    yield partial_response
+
                 # Yield final aggregated response with partial=False
                 final_parts = []
 
-                # Add aggregated text if any
-                if aggregated_text:
-                    final_parts.append(types.Part.from_text(text=aggregated_text))
+                # Add aggregated text if any, except what was emitted with early tool calls
+                text = text_acc.take()
+                if text:
+                    final_parts.append(types.Part.from_text(text=text))
 
-                # Add accumulated tool calls
+                # Add accumulated tool calls that were not emitted yet
                 for idx in sorted(tool_calls_acc.keys()):
                     tc = tool_calls_acc[idx]
-                    try:
-                        args = json.loads(tc["arguments"]) if tc["arguments"] else {}
-                    except json.JSONDecodeError:
-                        args = {}
-
-                    part = _build_function_call_part(
-                        name=tc["name"],
-                        args=args,
-                        tool_call_id=tc["id"],
-                        thought_signature=tc["thought_signature"],
-                    )
-                    final_parts.append(part)
+                    if tc.emitted:
+                        continue
+                    args = tc.parse_arguments()
+                    final_parts.append(tc.to_part({} if args is None else args))
 
                 # Map finish reason
                 final_reason = types.FinishReason.STOP
@@ -602,18 +744,26 @@ class BaseOpenAI(BaseLlm):
                 elif finish_reason == "tool_calls":
                     final_reason = types.FinishReason.STOP  # Tool calls is a normal completion
 
-                # Always yield final response to signal completion and valid metadata
-                final_content = types.Content(role="model", parts=final_parts)
-                yield LlmResponse(
-                    content=final_content,
-                    partial=False,
-                    finish_reason=final_reason,
-                    usage_metadata=usage_metadata,
-                    turn_complete=True,
-                )
+                # Always yield final response to signal completion and valid metadata. When
+                # everything was already emitted with early tool calls, the last of them is final.
+                if held_response is not None and not final_parts:
+                    held_response.finish_reason = final_reason
+                    held_response.usage_metadata = usage_metadata
+                    held_response.turn_complete = True
+                    yield held_response
+                else:
+                    if held_response is not None:
+                        yield held_response
+                    yield LlmResponse(
+                        content=types.Content(role="model", parts=final_parts),
+                        partial=False,
+                        finish_reason=final_reason,
+                        usage_metadata=usage_metadata,
+                        turn_complete=True,
+                    )
             else:
                 # Handle non-streaming
-                response = await self._client.chat.completions.create(stream=False, **kwargs)
+                response = await self._request_client().chat.completions.create(stream=False, **kwargs)
                 yield _convert_openai_response_to_llm_response(response)
 
         except Exception as e:
@@ -634,29 +784,31 @@ class AzureOpenAI(BaseOpenAI):
     azure_endpoint: Optional[str] = None
     azure_deployment: Optional[str] = None
 
-    @cached_property
-    def _client(self) -> AsyncAzureOpenAI:
-        """Get the Azure OpenAI client with optional custom SSL configuration."""
-        api_version = self.api_version or os.environ.get("OPENAI_API_VERSION", "2024-02-15-preview")
-        azure_endpoint = self.azure_endpoint or os.environ.get("AZURE_OPENAI_ENDPOINT")
+    def _configured_api_key(self) -> Optional[str]:
         api_key = self.api_key or os.environ.get("AZURE_OPENAI_API_KEY")
-
-        if not azure_endpoint:
-            raise ValueError(
-                "Azure endpoint must be provided either via azure_endpoint parameter or AZURE_OPENAI_ENDPOINT environment variable"
-            )
-
         if not api_key:
             raise ValueError(
                 "API key must be provided either via api_key parameter or AZURE_OPENAI_API_KEY environment variable"
             )
+        return api_key
 
-        http_client = self._create_http_client()
+    def _client_settings(self) -> dict[str, Any]:
+        return {
+            "api_version": self.api_version or os.environ.get("OPENAI_API_VERSION", "2024-02-15-preview"),
+            "azure_endpoint": self.azure_endpoint or os.environ.get("AZURE_OPENAI_ENDPOINT"),
+        }
+
+    def _build_client(self, api_key: Optional[str], http_client: httpx.AsyncClient) -> AsyncAzureOpenAI:
+        settings = self._client_settings()
+        if not settings["azure_endpoint"]:
+            raise ValueError(
+                "Azure endpoint must be provided either via azure_endpoint parameter or AZURE_OPENAI_ENDPOINT environment variable"
+            )
 
         return AsyncAzureOpenAI(
             api_key=api_key,
-            api_version=api_version,
-            azure_endpoint=azure_endpoint,
+            api_version=settings["api_version"],
+            azure_endpoint=settings["azure_endpoint"],
             default_headers=self.default_headers,
             http_client=http_client,
         )
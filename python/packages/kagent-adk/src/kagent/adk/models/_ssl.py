@@ -1,12 +1,18 @@
 """SSL/TLS utilities for configuring httpx clients with custom certificates."""
 
 import logging
+import os
 import ssl
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# SSL contexts by TLS configuration, with the fingerprint of the CA file they were loaded from
+_ssl_context_cache: dict[tuple, tuple[tuple | None, ssl.SSLContext | bool]] = {}
+_ssl_context_lock = threading.Lock()
+
 
 def get_ssl_troubleshooting_message(
     error: Exception, ca_cert_path: str | None = None, server_url: str | None = None
@@ -243,3 +249,51 @@ def create_ssl_context(
             ) from e
 
     return ctx
+
+
+def ca_cert_fingerprint(ca_cert_path: str | None) -> tuple | None:
+    """Identify the current contents of a CA file by inode, modification time and size.
+
+    Kubernetes updates mounted Secrets by swapping a symlink, which changes the
+    inode and modification time of the file the path resolves to.
+
+    Returns:
+        The fingerprint, or None if no path is given or the file does not exist.
+    """
+    if not ca_cert_path:
+        return None
+    try:
+        stat = os.stat(ca_cert_path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def get_ssl_context(
+    disable_verify: bool,
+    ca_cert_path: str | None,
+    disable_system_cas: bool,
+) -> ssl.SSLContext | bool:
+    """Return a shared SSL context for the TLS configuration, see ``create_ssl_context``.
+
+    Contexts are created once per configuration and reused by every client,
+    so CA files are only read and validated again after they change on disk.
+    """
+    key = (disable_verify, ca_cert_path, disable_system_cas)
+    fingerprint = ca_cert_fingerprint(ca_cert_path)
+    cached = _ssl_context_cache.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    with _ssl_context_lock:
+        cached = _ssl_context_cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        if cached is not None:
+            logger.info("CA certificate %s changed on disk, reloading SSL context", ca_cert_path)
+        ctx = create_ssl_context(
+            disable_verify=disable_verify,
+            ca_cert_path=ca_cert_path,
+            disable_system_cas=disable_system_cas,
+        )
+        _ssl_context_cache[key] = (fingerprint, ctx)
+        return ctx
@@ -0,0 +1,104 @@
+"""Text accumulation and partial response coalescing for streaming model adapters."""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import Optional
+
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+LLM_STREAM_COALESCE_CHARS_ENV_VAR = "KAGENT_LLM_STREAM_COALESCE_CHARS"
+LLM_STREAM_COALESCE_INTERVAL_ENV_VAR = "KAGENT_LLM_STREAM_COALESCE_INTERVAL_SECONDS"
+
+
+def _env_threshold(name: str) -> float:
+    value = os.getenv(name)
+    if not value:
+        return 0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        logger.warning(f"Invalid {name} value: {value}, coalescing on it is disabled")
+        return 0
+
+
+def get_llm_stream_coalesce_chars() -> int:
+    """Characters of streamed text buffered per partial response (KAGENT_LLM_STREAM_COALESCE_CHARS, 0 disables)."""
+    return int(_env_threshold(LLM_STREAM_COALESCE_CHARS_ENV_VAR))
+
+
+def get_llm_stream_coalesce_interval() -> float:
+    """Seconds between partial responses (KAGENT_LLM_STREAM_COALESCE_INTERVAL_SECONDS, 0 disables)."""
+    return _env_threshold(LLM_STREAM_COALESCE_INTERVAL_ENV_VAR)
+
+
+class StreamingTextAccumulator:
+    """Text of a streamed model response, and the partial responses streaming it.
+
+    Chunks are kept in a list and joined once when the text is taken, so
+    aggregating a long response stays linear in its length. By default every
+    chunk is streamed as its own partial response. When ``min_chars`` or
+    ``min_interval_seconds`` is set, chunks are buffered instead and streamed
+    together once the buffer holds ``min_chars`` characters or
+    ``min_interval_seconds`` have passed since the previous partial response,
+    whichever comes first. The interval is only checked when a chunk arrives.
+    """
+
+    def __init__(self, min_chars: Optional[int] = None, min_interval_seconds: Optional[float] = None):
+        self.min_chars = get_llm_stream_coalesce_chars() if min_chars is None else min_chars
+        self.min_interval_seconds = (
+            get_llm_stream_coalesce_interval() if min_interval_seconds is None else min_interval_seconds
+        )
+        # Text not taken yet, and the tail of it not streamed yet
+        self._chunks: list[str] = []
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._last_emit = time.monotonic()
+
+    def add(self, text: str, turn_complete: bool = False) -> Optional[LlmResponse]:
+        """Add a chunk of text, returning the partial response to stream if one is due."""
+        self._chunks.append(text)
+        self._pending.append(text)
+        self._pending_chars += len(text)
+        if turn_complete or self._due():
+            return self._emit(turn_complete)
+        return None
+
+    def flush(self) -> Optional[LlmResponse]:
+        """Partial response with the buffered text, None if there is none.
+
+        Must be yielded before any non-partial response, so that streamed text
+        reaches clients before the response that aggregates it.
+        """
+        if not self._pending:
+            return None
+        return self._emit(False)
+
+    def take(self) -> str:
+        """All text added since the previous call."""
+        text = "".join(self._chunks)
+        self._chunks.clear()
+        return text
+
+    def _due(self) -> bool:
+        if not self.min_chars and not self.min_interval_seconds:
+            return True
+        if self.min_chars and self._pending_chars >= self.min_chars:
+            return True
+        return bool(self.min_interval_seconds) and time.monotonic() - self._last_emit >= self.min_interval_seconds
+
+    def _emit(self, turn_complete: bool) -> LlmResponse:
+        text = self._pending[0] if len(self._pending) == 1 else "".join(self._pending)
+        self._pending.clear()
+        self._pending_chars = 0
+        self._last_emit = time.monotonic()
+        return LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=text)]),
+            partial=True,
+            turn_complete=turn_complete,
+        )
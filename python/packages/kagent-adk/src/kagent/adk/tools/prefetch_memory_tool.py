@@ -12,6 +12,8 @@ from google.adk.tools.base_tool import BaseTool
 from google.adk.tools.tool_context import ToolContext
 from typing_extensions import override
 
+from kagent.adk._memory_service import KagentMemoryService, reciprocal_rank_fusion
+
 if TYPE_CHECKING:
     from google.adk.models.llm_request import LlmRequest
 
@@ -41,9 +43,12 @@ class PrefetchMemoryTool(BaseTool):
     Runs only on the first turn (exactly one user message in the session).
     Injects past context into the LLM request so the agent has prior context without an extra tool call.
 
-    Query strategy: split the user message into sentences and search memory for each sentence
-    in parallel, then deduplicate results by memory ID. This surfaces relevant memories that
-    may only match a specific part of a multi-sentence message.
+    Query strategy: split the user message into sentences and search memory for each sentence,
+    then fuse the results by reciprocal rank, deduplicated by memory ID. This surfaces relevant
+    memories that may only match a specific part of a multi-sentence message, while memories
+    that match several sentences rank first. With KagentMemoryService all sentences are
+    embedded and searched in one batch, which returns the fused results limited to the
+    configured search limit; other memory services are searched in parallel.
     """
 
     def __init__(self):
@@ -94,22 +99,25 @@ class PrefetchMemoryTool(BaseTool):
                 logger.warning("Failed to prefetch memory for query: %s", q[:100])
                 return None
 
-        # Search all sentences in parallel.
-        results = await asyncio.gather(*[_search(q) for q in queries])
-
-        # Deduplicate memories by ID, preserving first-seen order.
-        seen_ids: set[str] = set()
-        memory_text_lines: list[str] = []
-        for response in results:
-            if not response or not response.memories:
-                continue
-            for memory in response.memories:
-                memory_id = str(getattr(memory, "id", None) or id(memory))
-                if memory_id in seen_ids:
-                    continue
-                seen_ids.add(memory_id)
-                if memory_text := extract_text(memory):
-                    memory_text_lines.append(memory_text)
+        memory_service = tool_context._invocation_context.memory_service
+        if isinstance(memory_service, KagentMemoryService):
+            # One embedding call and one search request for all sentences, already fused.
+            response = await memory_service.search_memory_batch(
+                app_name=tool_context._invocation_context.app_name,
+                user_id=tool_context._invocation_context.user_id,
+                queries=queries,
+            )
+            memories = response.memories
+        else:
+            # Search all sentences in parallel and fuse the results by rank.
+            results = await asyncio.gather(*[_search(q) for q in queries])
+            fused = reciprocal_rank_fusion(
+                [response.memories for response in results if response and response.memories],
+                key=lambda memory: str(getattr(memory, "id", None) or id(memory)),
+            )
+            memories = [memory for memory, _ in fused]
+
+        memory_text_lines = [memory_text for memory in memories if (memory_text := extract_text(memory))]
 
         if not memory_text_lines:
             return
@@ -33,6 +33,12 @@ PROXY_HOST_HEADER = "x-kagent-host"
 # Key used to store headers in session state
 HEADERS_STATE_KEY = "headers"
 
+# Key used to store a hash of the persisted headers in session state
+HEADERS_HASH_STATE_KEY = "headers_hash"
+
+# Key used to store the timestamp of the last session event saved to memory in session state
+MEMORY_WATERMARK_STATE_KEY = "memory_saved_until"
+
 
 def create_header_provider(
     allowed_headers: list[str] | None = None,
@@ -252,6 +258,10 @@ class MemoryConfig(BaseModel):
 
     ttl_days: int = 0  # TTL for memory entries in days. 0 means use the server default.
     embedding: EmbeddingConfig | None = None  # Embedding model config for memory tools.
+    # Model that summarizes sessions before they are saved. Defaults to the agent's model.
+    summarizer_model: ModelUnion | None = Field(default=None, discriminator="type")
+    search_limit: int = 5  # Maximum number of memories returned by a search.
+    search_min_score: float = 0.3  # Minimum similarity score of returned memories.
 
 
 class NetworkConfig(BaseModel):
@@ -448,6 +458,10 @@ class AgentConfig(BaseModel):
             else:
                 agent.instruction += memory_suffix
 
+            summarizer_model = agent.model
+            if self.memory.summarizer_model is not None:
+                summarizer_model = _create_llm_from_model_config(self.memory.summarizer_model)
+
             # Define auto-save callback
             async def auto_save_session_to_memory_callback(callback_context: CallbackContext):
                 try:
@@ -459,10 +473,9 @@ class AgentConfig(BaseModel):
                     if user_msg_count > 0 and user_msg_count % 5 == 0:
                         logger.info("Auto-saving session %s to memory (turn %d)", session.id, user_msg_count)
 
-                        # Pass the agent's model directly for summarization
                         await callback_context._invocation_context.memory_service.add_session_to_memory(
                             session,
-                            model=agent.model,
+                            model=summarizer_model,
                         )
                     else:
                         logger.debug("Skipping auto-save for session %s (turn %d)", session.id, user_msg_count)
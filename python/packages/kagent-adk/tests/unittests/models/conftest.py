@@ -0,0 +1,13 @@
+import pytest
+
+from kagent.adk.models import _client_registry
+
+
+@pytest.fixture(autouse=True)
+def fresh_llm_client_registry(monkeypatch):
+    """Give every test its own client registry and no passthrough key, so that clients are not shared across tests."""
+    registry = _client_registry.LlmClientRegistry()
+    monkeypatch.setattr(_client_registry, "_llm_client_registry", registry)
+    token = _client_registry._request_passthrough_key.set(None)
+    yield registry
+    _client_registry._request_passthrough_key.reset(token)
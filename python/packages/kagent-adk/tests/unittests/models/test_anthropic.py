@@ -5,6 +5,7 @@ from unittest import mock
 from anthropic import AsyncAnthropic
 
 from kagent.adk.models._anthropic import KAgentAnthropicLlm
+from kagent.adk.models._client_registry import client_key, get_request_passthrough_key
 
 
 class TestKAgentAnthropicLlm:
@@ -18,15 +19,40 @@ class TestKAgentAnthropicLlm:
     def test_set_passthrough_key(self):
         llm = KAgentAnthropicLlm(model="claude-3-sonnet-20240229", api_key_passthrough=True)
         llm.set_passthrough_key("sk-bearer-token")
-        assert llm._api_key == "sk-bearer-token"
+        assert get_request_passthrough_key() == "sk-bearer-token"
 
-    def test_set_passthrough_key_invalidates_cached_client(self):
+    def test_passthrough_clients_are_cached_per_key(self):
+        llm = KAgentAnthropicLlm(model="claude-3-sonnet-20240229", api_key_passthrough=True)
+        llm.set_passthrough_key("token-a")
+        client_a = llm._anthropic_client
+        assert llm._anthropic_client is client_a
+        assert KAgentAnthropicLlm(model="claude-3-haiku", api_key_passthrough=True)._anthropic_client is client_a
+
+        llm.set_passthrough_key("token-b")
+        client_b = llm._anthropic_client
+        assert client_b is not client_a
+        assert client_b.api_key == "token-b"
+        # Clients for different keys share one connection pool
+        assert client_b._client is client_a._client
+
+    def test_client_key_is_computed_once_per_key(self):
+        llm = KAgentAnthropicLlm(model="claude-3-sonnet-20240229", api_key_passthrough=True)
+        llm.set_passthrough_key("token-a")
+        with mock.patch("kagent.adk.models._anthropic.client_key", wraps=client_key) as key:
+            client_a = llm._anthropic_client
+            calls = key.call_count
+            assert llm._anthropic_client is client_a
+            assert key.call_count == calls
+
+            llm.set_passthrough_key("token-b")
+            assert llm._anthropic_client is not client_a
+            assert key.call_count > calls
+
+    def test_passthrough_key_is_ignored_without_passthrough(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "configured-key")
         llm = KAgentAnthropicLlm(model="claude-3-sonnet-20240229")
-        with mock.patch("anthropic.AsyncAnthropic"):
-            _ = llm._anthropic_client
-            assert "_anthropic_client" in llm.__dict__
-        llm.set_passthrough_key("new-token")
-        assert "_anthropic_client" not in llm.__dict__
+        llm.set_passthrough_key("token-a")
+        assert llm._anthropic_client.api_key == "configured-key"
 
     def test_client_uses_base_url(self):
         llm = KAgentAnthropicLlm(model="claude-3-sonnet-20240229", base_url="https://proxy.internal/anthropic")
@@ -1,6 +1,7 @@
 """Tests for KAgentBedrockLlm."""
 
 import asyncio
+import threading
 from unittest import mock
 
 import pytest
@@ -101,6 +102,62 @@ class TestKAgentBedrockLlm:
         assert final.usage_metadata.candidates_token_count == 5
         assert final.usage_metadata.total_token_count == 15
 
+    @pytest.mark.asyncio
+    async def test_streaming_yields_text_before_stream_ends(self):
+        llm = KAgentBedrockLlm(model="us.anthropic.claude-sonnet-4-20250514-v1:0")
+        first_received = threading.Event()
+
+        def stream_events():
+            yield {"contentBlockDelta": {"delta": {"text": "Hel"}}}
+            # Only continues once the first chunk reached the consumer
+            assert first_received.wait(timeout=5)
+            yield {"contentBlockDelta": {"delta": {"text": "lo"}}}
+            yield {"messageStop": {"stopReason": "end_turn"}}
+
+        mock_client = mock.MagicMock()
+        mock_client.converse_stream.return_value = {"stream": stream_events()}
+        request = mock.MagicMock()
+        request.model = "us.anthropic.claude-sonnet-4-20250514-v1:0"
+        request.contents = []
+        request.config = None
+
+        responses = []
+        with mock.patch("kagent.adk.models._bedrock._get_bedrock_client", return_value=mock_client):
+            async for response in llm.generate_content_async(request, stream=True):
+                responses.append(response)
+                first_received.set()
+
+        assert [r.content.parts[0].text for r in responses] == ["Hel", "lo", "Hello"]
+        assert responses[-1].error_code is None
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_generator_closes_event_stream(self):
+        llm = KAgentBedrockLlm(model="us.anthropic.claude-sonnet-4-20250514-v1:0")
+        closed = threading.Event()
+
+        class EventStream:
+            def __iter__(self):
+                while not closed.is_set():
+                    yield {"contentBlockDelta": {"delta": {"text": "x"}}}
+
+            def close(self):
+                closed.set()
+
+        mock_client = mock.MagicMock()
+        mock_client.converse_stream.return_value = {"stream": EventStream()}
+        request = mock.MagicMock()
+        request.model = "us.anthropic.claude-sonnet-4-20250514-v1:0"
+        request.contents = []
+        request.config = None
+
+        with mock.patch("kagent.adk.models._bedrock._get_bedrock_client", return_value=mock_client):
+            responses = llm.generate_content_async(request, stream=True)
+            first = await anext(responses)
+            await responses.aclose()
+
+        assert first.partial
+        assert closed.is_set()
+
     def test_create_llm_from_bedrock_model_config(self):
         """Integration: _create_llm_from_model_config returns KAgentBedrockLlm for bedrock type."""
         from kagent.adk.types import Bedrock, _create_llm_from_model_config
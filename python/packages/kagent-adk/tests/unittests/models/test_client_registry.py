@@ -0,0 +1,187 @@
+"""Tests for the process-wide LLM client registry."""
+
+import asyncio
+import os
+import time
+from unittest import mock
+
+import httpx
+import pytest
+
+from kagent.adk.models import KAgentAnthropicLlm, KAgentOllamaLlm, OpenAI
+from kagent.adk.models._client_registry import (
+    LlmClientRegistry,
+    client_key,
+    get_llm_http_limits,
+    llm_http2_enabled,
+)
+
+
+def test_openai_models_with_same_settings_share_a_client(fresh_llm_client_registry):
+    first = OpenAI(model="gpt-4o", type="openai", api_key="key", base_url="https://llm.example/v1")
+    second = OpenAI(model="gpt-4o-mini", type="openai", api_key="key", base_url="https://llm.example/v1")
+    other_key = OpenAI(model="gpt-4o", type="openai", api_key="other", base_url="https://llm.example/v1")
+
+    assert first._client is second._client
+    assert other_key._client is not first._client
+    assert len(fresh_llm_client_registry) == 2
+
+
+def test_openai_client_uses_pool_limits(monkeypatch):
+    monkeypatch.setattr(
+        "kagent.adk.models._client_registry._llm_client_registry",
+        LlmClientRegistry(limits=httpx.Limits(max_connections=7, max_keepalive_connections=3), http2=False),
+    )
+    with (
+        mock.patch("kagent.adk.models._openai.DefaultAsyncHttpxClient") as mock_httpx,
+        mock.patch("kagent.adk.models._openai.AsyncOpenAI"),
+    ):
+        _ = OpenAI(model="gpt-4o", type="openai", api_key="key")._client
+
+    assert mock_httpx.call_args.kwargs["limits"].max_connections == 7
+    assert mock_httpx.call_args.kwargs["http2"] is False
+    assert "verify" not in mock_httpx.call_args.kwargs
+
+
+def test_passthrough_clients_are_cached_per_key(fresh_llm_client_registry):
+    llm = OpenAI(model="gpt-4o", type="openai", api_key_passthrough=True)
+    llm.set_passthrough_key("user-token")
+    client = llm._request_client()
+
+    assert client.api_key == "user-token"
+    assert OpenAI(model="gpt-4o-mini", type="openai", api_key_passthrough=True)._request_client() is client
+
+    llm.set_passthrough_key("other-token")
+    other = llm._request_client()
+    assert other is not client
+    assert other._client is client._client
+    # Only the shared connection pool is registered, the clients are cached separately
+    assert len(fresh_llm_client_registry) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_keep_their_passthrough_keys():
+    llm = OpenAI(model="gpt-4o", type="openai", api_key_passthrough=True)
+
+    async def request(token: str) -> str:
+        llm.set_passthrough_key(token)
+        await asyncio.sleep(0)
+        return llm._request_client().api_key
+
+    assert await asyncio.gather(request("token-a"), request("token-b")) == ["token-a", "token-b"]
+
+
+def test_passthrough_cache_is_bounded_and_expires():
+    registry = LlmClientRegistry(http2=False, passthrough_cache_size=2, passthrough_ttl_seconds=60)
+    first = registry.get_passthrough("a", object)
+    registry.get_passthrough("b", object)
+    assert registry.get_passthrough("a", object) is first
+
+    registry.get_passthrough("c", object)
+    assert set(registry._passthrough_clients) == {"a", "c"}
+
+    with mock.patch("kagent.adk.models._client_registry.time.monotonic", return_value=time.monotonic() + 61):
+        assert registry.get_passthrough("a", object) is not first
+
+
+def test_anthropic_and_ollama_clients_are_shared(fresh_llm_client_registry, monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
+
+    assert (
+        KAgentAnthropicLlm(model="claude-sonnet-4")._anthropic_client
+        is KAgentAnthropicLlm(model="claude-haiku-4")._anthropic_client
+    )
+    assert KAgentOllamaLlm(model="llama3")._client is KAgentOllamaLlm(model="qwen3")._client
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_clients():
+    registry = LlmClientRegistry(http2=False)
+    client = registry.get("key", lambda: mock.AsyncMock(spec=httpx.AsyncClient))
+
+    async with registry.lifespan()(None):
+        assert len(registry) == 1
+
+    client.aclose.assert_awaited_once()
+    assert len(registry) == 0
+
+
+def test_client_key_hashes_api_key():
+    key = client_key("openai", api_key="secret", base_url=None)
+
+    assert "secret" not in key
+    assert key == client_key("openai", base_url=None, api_key="secret")
+
+
+def test_pool_settings_from_env(monkeypatch):
+    monkeypatch.setenv("KAGENT_LLM_HTTP_MAX_CONNECTIONS", "50")
+    monkeypatch.setenv("KAGENT_LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS", "soon")
+
+    limits = get_llm_http_limits()
+
+    assert limits.max_connections == 50
+    assert limits.max_keepalive_connections == 20
+    assert limits.keepalive_expiry == 60.0
+
+
+def test_http2_requires_h2(monkeypatch):
+    monkeypatch.delenv("KAGENT_LLM_HTTP2", raising=False)
+    assert llm_http2_enabled() is False
+
+    monkeypatch.setenv("KAGENT_LLM_HTTP2", "true")
+    with mock.patch("importlib.util.find_spec", return_value=None):
+        assert llm_http2_enabled() is False
+    with mock.patch("importlib.util.find_spec", return_value=object()):
+        assert llm_http2_enabled() is True
+
+
+def test_changed_ca_file_gets_a_new_client(tmp_path, fresh_llm_client_registry):
+    cert_path = tmp_path / "ca.crt"
+    cert_path.write_text("dummy cert content")
+
+    with mock.patch("kagent.adk.models._openai.get_ssl_context", return_value=False):
+        first = OpenAI(model="gpt-4o", type="openai", api_key="key", tls_ca_cert_path=str(cert_path))._client
+        same = OpenAI(model="gpt-4o", type="openai", api_key="key", tls_ca_cert_path=str(cert_path))._client
+        os.utime(cert_path, ns=(0, cert_path.stat().st_mtime_ns + 1_000_000))
+        rotated = OpenAI(model="gpt-4o", type="openai", api_key="key", tls_ca_cert_path=str(cert_path))._client
+
+    assert first is same
+    assert rotated is not first
+    assert len(fresh_llm_client_registry) == 1
+    assert fresh_llm_client_registry._superseded == [first]
+
+
+@pytest.mark.asyncio
+async def test_superseded_client_is_closed_after_delay():
+    registry = LlmClientRegistry(http2=False, superseded_close_delay_seconds=0)
+    first = registry.get("key", lambda: mock.AsyncMock(spec=httpx.AsyncClient), version=1)
+
+    assert registry.get("key", lambda: mock.AsyncMock(spec=httpx.AsyncClient), version=1) is first
+    second = registry.get("key", lambda: mock.AsyncMock(spec=httpx.AsyncClient), version=2)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert second is not first
+    first.aclose.assert_awaited_once()
+    second.aclose.assert_not_awaited()
+    assert registry._superseded == []
+
+
+@pytest.mark.asyncio
+async def test_close_closes_superseded_clients_still_in_grace_period():
+    registry = LlmClientRegistry(http2=False)
+    first = registry.get("key", lambda: mock.AsyncMock(spec=httpx.AsyncClient), version=1)
+    second = registry.get("key", lambda: mock.AsyncMock(spec=httpx.AsyncClient), version=2)
+
+    await registry.close()
+
+    first.aclose.assert_awaited_once()
+    second.aclose.assert_awaited_once()
+
+
+def test_passthrough_client_is_rebuilt_for_a_new_version():
+    registry = LlmClientRegistry(http2=False)
+    first = registry.get_passthrough("a", object, version=1)
+
+    assert registry.get_passthrough("a", object, version=1) is first
+    assert registry.get_passthrough("a", object, version=2) is not first
@@ -15,10 +15,14 @@
 from unittest import mock
 
 import pytest
+from google.adk.agents import Agent
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
+from google.adk.runners import InMemoryRunner
 from google.genai import types
 from google.genai.types import Content, Part
+from openai.types.chat import ChatCompletionChunk
 from openai.types.chat.chat_completion_tool_param import ChatCompletionToolParam
 
 from kagent.adk.models import OpenAI
@@ -526,6 +530,202 @@ async def test_streaming_usage_metadata_propagation(openai_llm, llm_request):
         assert final_response.usage_metadata.total_token_count == 15
 
 
+def _tool_call_chunk(index, arguments, call_id=None, name=None, content=None, finish_reason=None):
+    tool_call = {"index": index, "function": {"arguments": arguments}}
+    if call_id:
+        tool_call["id"] = call_id
+        tool_call["type"] = "function"
+        tool_call["function"]["name"] = name
+    return ChatCompletionChunk.model_validate(
+        {
+            "id": "chatcmpl-test",
+            "created": 1234567890,
+            "model": "gpt-4o",
+            "object": "chat.completion.chunk",
+            "choices": [
+                {
+                    "index": 0,
+                    "delta": {"content": content, "tool_calls": [tool_call] if arguments is not None else None},
+                    "finish_reason": finish_reason,
+                }
+            ],
+        }
+    )
+
+
+def _usage_chunk(prompt_tokens, completion_tokens):
+    return ChatCompletionChunk.model_validate(
+        {
+            "id": "chatcmpl-test",
+            "created": 1234567890,
+            "model": "gpt-4o",
+            "object": "chat.completion.chunk",
+            "choices": [],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+    )
+
+
+_MULTI_TOOL_STREAM = [
+    _tool_call_chunk(None, None, content="Checking both."),
+    _tool_call_chunk(0, '{"city": "Par', call_id="call_1", name="weather"),
+    _tool_call_chunk(0, 'is {1}", "units": ["c"]}'),
+    _tool_call_chunk(1, '{"q": "a \\"}\\" b"', call_id="call_2", name="search"),
+    _tool_call_chunk(1, "}", finish_reason="tool_calls"),
+]
+
+
+async def _stream_responses(openai_llm, llm_request, chunks):
+    with mock.patch.object(openai_llm, "_client") as mock_client:
+
+        async def mock_stream_gen_func(*args, **kwargs):
+            async def gen():
+                for chunk in chunks:
+                    yield chunk
+
+            return gen()
+
+        mock_client.chat.completions.create.side_effect = mock_stream_gen_func
+        return [resp async for resp in openai_llm.generate_content_async(llm_request, stream=True)]
+
+
+def _function_calls(responses):
+    return [
+        (part.function_call.id, part.function_call.args)
+        for resp in responses
+        if resp.content
+        for part in resp.content.parts
+        if part.function_call
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streaming_tool_calls_are_aggregated_in_final_response(openai_llm, llm_request, monkeypatch):
+    monkeypatch.delenv("KAGENT_OPENAI_EARLY_TOOL_DISPATCH", raising=False)
+
+    responses = await _stream_responses(openai_llm, llm_request, _MULTI_TOOL_STREAM)
+
+    assert all(resp.partial for resp in responses[:-1])
+    final = responses[-1]
+    assert final.partial is False and final.turn_complete
+    assert final.content.parts[0].text == "Checking both."
+    assert _function_calls([final]) == [
+        ("call_1", {"city": "Paris {1}", "units": ["c"]}),
+        ("call_2", {"q": 'a "}" b'}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streaming_tool_calls_are_dispatched_when_complete(openai_llm, llm_request, monkeypatch):
+    monkeypatch.setenv("KAGENT_OPENAI_EARLY_TOOL_DISPATCH", "true")
+    chunks = iter([*_MULTI_TOOL_STREAM, _usage_chunk(10, 5)])
+    consumed = []
+
+    async def gen():
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield chunk
+
+    with mock.patch.object(openai_llm, "_client") as mock_client:
+
+        async def mock_stream_gen_func(*args, **kwargs):
+            return gen()
+
+        mock_client.chat.completions.create.side_effect = mock_stream_gen_func
+        responses = []
+        async for resp in openai_llm.generate_content_async(llm_request, stream=True):
+            responses.append((resp, len(consumed)))
+
+    dispatched = [(resp, seen) for resp, seen in responses if not resp.partial]
+    # The first call is emitted once the second one starts, before the rest of it is read
+    first, seen = dispatched[0]
+    assert seen == 4 and not first.turn_complete
+    assert first.content.parts[0].text == "Checking both."
+    assert _function_calls([first]) == [("call_1", {"city": "Paris {1}", "units": ["c"]})]
+    # Nothing follows the second call, so it is the final response and carries the usage
+    final, _ = dispatched[1]
+    assert len(dispatched) == 2
+    assert _function_calls([final]) == [("call_2", {"q": 'a "}" b'})]
+    assert final.turn_complete and final.usage_metadata.total_token_count == 15
+
+
+@pytest.mark.asyncio
+async def test_early_dispatched_tool_calls_keep_usage_in_the_session(monkeypatch):
+    monkeypatch.setenv("KAGENT_OPENAI_EARLY_TOOL_DISPATCH", "true")
+
+    def weather(city: str, units: list[str]) -> dict:
+        return {"temperature": 20}
+
+    def search(q: str) -> dict:
+        return {"results": []}
+
+    streams = iter(
+        [
+            [*_MULTI_TOOL_STREAM, _usage_chunk(10, 5)],
+            [_tool_call_chunk(None, None, content="Done.", finish_reason="stop"), _usage_chunk(20, 2)],
+        ]
+    )
+    llm = OpenAI(model="gpt-4o", type="openai", api_key="fake")
+    runner = InMemoryRunner(agent=Agent(name="assistant", model=llm, tools=[weather, search]), app_name="app")
+    session = await runner.session_service.create_session(app_name="app", user_id="u1")
+
+    with mock.patch.object(llm, "_client") as mock_client:
+
+        async def mock_stream_gen_func(*args, **kwargs):
+            chunks = next(streams)
+
+            async def gen():
+                for chunk in chunks:
+                    yield chunk
+
+            return gen()
+
+        mock_client.chat.completions.create.side_effect = mock_stream_gen_func
+        async for _ in runner.run_async(
+            user_id="u1",
+            session_id=session.id,
+            new_message=Content(role="user", parts=[Part(text="Weather in Paris?")]),
+            run_config=RunConfig(streaming_mode=StreamingMode.SSE),
+        ):
+            pass
+
+    session = await runner.session_service.get_session(app_name="app", user_id="u1", session_id=session.id)
+    assert [e.usage_metadata.total_token_count for e in session.events if e.usage_metadata] == [15, 22]
+    assert [fc.id for e in session.events for fc in e.get_function_calls()] == ["call_1", "call_2"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_incomplete_tool_call_is_left_for_final_response(openai_llm, llm_request, monkeypatch):
+    monkeypatch.setenv("KAGENT_OPENAI_EARLY_TOOL_DISPATCH", "true")
+    chunks = [
+        _tool_call_chunk(0, '{"city": "Paris"}', call_id="call_1", name="weather"),
+        _tool_call_chunk(1, '{"q": "unterminated', call_id="call_2", name="search", finish_reason="tool_calls"),
+    ]
+
+    responses = await _stream_responses(openai_llm, llm_request, chunks)
+
+    assert [_function_calls([resp]) for resp in responses] == [
+        [("call_1", {"city": "Paris"})],
+        [("call_2", {})],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streaming_text_is_coalesced(openai_llm, llm_request, monkeypatch):
+    monkeypatch.setenv("KAGENT_LLM_STREAM_COALESCE_CHARS", "6")
+    chunks = [_tool_call_chunk(None, None, content=text) for text in ["Hi", "! How", " can", " I", " help?"]]
+
+    responses = await _stream_responses(openai_llm, llm_request, chunks)
+
+    assert [resp.content.parts[0].text for resp in responses[:-1]] == ["Hi! How", " can I", " help?"]
+    assert all(resp.partial for resp in responses[:-1])
+    assert responses[-1].content.parts[0].text == "Hi! How can I help?"
+
+
 # ============================================================================
 # SSL/TLS Configuration Tests
 # ============================================================================
@@ -544,7 +744,7 @@ def test_openai_client_without_tls_config():
 
 def test_openai_client_with_tls_verification_disabled():
     """Test OpenAI client with TLS verification disabled."""
-    with mock.patch("kagent.adk.models._openai.create_ssl_context") as mock_create_ssl:
+    with mock.patch("kagent.adk.models._openai.get_ssl_context") as mock_create_ssl:
         with mock.patch("kagent.adk.models._openai.DefaultAsyncHttpxClient") as mock_httpx:
             with mock.patch("kagent.adk.models._openai.AsyncOpenAI") as mock_openai:
                 # create_ssl_context returns False when verification is disabled
@@ -584,7 +784,7 @@ def test_openai_client_with_custom_ca_certificate():
     """Test OpenAI client with custom CA certificate."""
     import ssl
 
-    with mock.patch("kagent.adk.models._openai.create_ssl_context") as mock_create_ssl:
+    with mock.patch("kagent.adk.models._openai.get_ssl_context") as mock_create_ssl:
         with mock.patch("kagent.adk.models._openai.DefaultAsyncHttpxClient") as mock_httpx:
             with mock.patch("kagent.adk.models._openai.AsyncOpenAI"):
                 # create_ssl_context returns SSLContext for custom CA
@@ -621,7 +821,7 @@ def test_openai_client_with_custom_ca_only():
     """Test OpenAI client with custom CA only (no system CAs)."""
     import ssl
 
-    with mock.patch("kagent.adk.models._openai.create_ssl_context") as mock_create_ssl:
+    with mock.patch("kagent.adk.models._openai.get_ssl_context") as mock_create_ssl:
         with mock.patch("kagent.adk.models._openai.DefaultAsyncHttpxClient") as mock_httpx:
             with mock.patch("kagent.adk.models._openai.AsyncOpenAI"):
                 mock_ssl_context = mock.MagicMock(spec=ssl.SSLContext)
@@ -677,7 +877,7 @@ def test_azure_openai_client_with_tls():
 
     from kagent.adk.models import AzureOpenAI
 
-    with mock.patch("kagent.adk.models._openai.create_ssl_context") as mock_create_ssl:
+    with mock.patch("kagent.adk.models._openai.get_ssl_context") as mock_create_ssl:
         with mock.patch("kagent.adk.models._openai.DefaultAsyncHttpxClient") as mock_httpx:
             with mock.patch("kagent.adk.models._openai.AsyncAzureOpenAI") as mock_azure_openai:
                 mock_ssl_context = mock.MagicMock(spec=ssl.SSLContext)
@@ -719,7 +919,7 @@ def test_openai_client_with_base_url_and_tls():
     """Test OpenAI client with base_url (LiteLLM gateway) and TLS configuration."""
     import ssl
 
-    with mock.patch("kagent.adk.models._openai.create_ssl_context") as mock_create_ssl:
+    with mock.patch("kagent.adk.models._openai.get_ssl_context") as mock_create_ssl:
         with mock.patch("kagent.adk.models._openai.DefaultAsyncHttpxClient") as mock_httpx:
             with mock.patch("kagent.adk.models._openai.AsyncOpenAI"):
                 mock_ssl_context = mock.MagicMock(spec=ssl.SSLContext)
@@ -1,6 +1,6 @@
 """Unit tests for SSL/TLS context creation.
 
-These tests verify the create_ssl_context() function behavior in isolation:
+These tests verify the create_ssl_context() and get_ssl_context() function behavior in isolation:
 - Function logic and return values
 - Configuration options
 - Error handling
@@ -8,6 +8,7 @@ These tests verify the create_ssl_context() function behavior in isolation:
 """
 
 import logging
+import os
 import ssl
 import tempfile
 from pathlib import Path
@@ -15,7 +16,8 @@ from unittest import mock
 
 import pytest
 
-from kagent.adk.models._ssl import create_ssl_context
+from kagent.adk.models import _ssl
+from kagent.adk.models._ssl import create_ssl_context, get_ssl_context
 
 
 def test_ssl_context_verification_disabled():
@@ -123,3 +125,37 @@ def test_ssl_context_disabled_logs_warning(caplog):
         assert ssl_context is False
         assert "SSL VERIFICATION DISABLED" in caplog.text
         assert "development/testing" in caplog.text.lower()
+
+
+def test_get_ssl_context_reuses_context_until_ca_file_changes(tmp_path, monkeypatch):
+    """Test cached SSL contexts are shared and reloaded when the CA file changes on disk."""
+    monkeypatch.setattr(_ssl, "_ssl_context_cache", {})
+    cert_path = tmp_path / "ca.crt"
+    cert_path.write_text("dummy cert content")
+
+    with mock.patch("kagent.adk.models._ssl.create_ssl_context", side_effect=lambda **kwargs: object()) as mock_create:
+        first = get_ssl_context(disable_verify=False, ca_cert_path=str(cert_path), disable_system_cas=True)
+        second = get_ssl_context(disable_verify=False, ca_cert_path=str(cert_path), disable_system_cas=True)
+        other = get_ssl_context(disable_verify=False, ca_cert_path=str(cert_path), disable_system_cas=False)
+
+        assert first is second
+        assert other is not first
+        assert mock_create.call_count == 2
+
+        cert_path.write_text("rotated cert content")
+        os.utime(cert_path, ns=(0, cert_path.stat().st_mtime_ns + 1_000_000))
+        reloaded = get_ssl_context(disable_verify=False, ca_cert_path=str(cert_path), disable_system_cas=True)
+
+    assert reloaded is not first
+    assert mock_create.call_count == 3
+    mock_create.assert_called_with(disable_verify=False, ca_cert_path=str(cert_path), disable_system_cas=True)
+
+
+def test_get_ssl_context_does_not_cache_missing_ca_file(monkeypatch):
+    """Test a missing CA file fails every time rather than being cached."""
+    monkeypatch.setattr(_ssl, "_ssl_context_cache", {})
+
+    for _ in range(2):
+        with pytest.raises(FileNotFoundError):
+            get_ssl_context(disable_verify=False, ca_cert_path="/nonexistent/ca.crt", disable_system_cas=True)
+    assert _ssl._ssl_context_cache == {}
@@ -0,0 +1,69 @@
+"""Tests for the streaming text accumulator."""
+
+from unittest import mock
+
+from kagent.adk.models._streaming import (
+    StreamingTextAccumulator,
+    get_llm_stream_coalesce_chars,
+    get_llm_stream_coalesce_interval,
+)
+
+
+def _text(response):
+    return response.content.parts[0].text
+
+
+def test_every_chunk_is_streamed_by_default():
+    acc = StreamingTextAccumulator(min_chars=0, min_interval_seconds=0)
+
+    responses = [acc.add(chunk) for chunk in ["Hel", "lo", "!"]]
+
+    assert [_text(r) for r in responses] == ["Hel", "lo", "!"]
+    assert all(r.partial and not r.turn_complete for r in responses)
+    assert acc.flush() is None
+    assert acc.take() == "Hello!"
+    assert acc.take() == ""
+
+
+def test_chunks_are_coalesced_up_to_min_chars():
+    acc = StreamingTextAccumulator(min_chars=5, min_interval_seconds=0)
+
+    responses = [acc.add(chunk) for chunk in ["ab", "cd", "ef", "g", "h"]]
+
+    assert [_text(r) if r else None for r in responses] == [None, None, "abcdef", None, None]
+    assert _text(acc.flush()) == "gh"
+    assert acc.flush() is None
+    assert acc.take() == "abcdefgh"
+
+
+def test_chunks_are_coalesced_per_interval():
+    with mock.patch("kagent.adk.models._streaming.time.monotonic", side_effect=[0.0, 0.05, 0.1, 0.1, 0.12]):
+        acc = StreamingTextAccumulator(min_chars=0, min_interval_seconds=0.1)
+
+        assert acc.add("a") is None
+        assert _text(acc.add("b")) == "ab"
+        assert acc.add("c") is None
+
+
+def test_turn_complete_chunk_is_streamed_immediately():
+    acc = StreamingTextAccumulator(min_chars=100, min_interval_seconds=0)
+
+    assert acc.add("Hi") is None
+    response = acc.add(".", turn_complete=True)
+
+    assert _text(response) == "Hi." and response.turn_complete
+
+
+def test_coalescing_settings_from_env(monkeypatch):
+    monkeypatch.delenv("KAGENT_LLM_STREAM_COALESCE_CHARS", raising=False)
+    monkeypatch.delenv("KAGENT_LLM_STREAM_COALESCE_INTERVAL_SECONDS", raising=False)
+    assert get_llm_stream_coalesce_chars() == 0
+    assert get_llm_stream_coalesce_interval() == 0
+
+    monkeypatch.setenv("KAGENT_LLM_STREAM_COALESCE_CHARS", "64")
+    monkeypatch.setenv("KAGENT_LLM_STREAM_COALESCE_INTERVAL_SECONDS", "0.05")
+    assert get_llm_stream_coalesce_chars() == 64
+    assert get_llm_stream_coalesce_interval() == 0.05
+
+    monkeypatch.setenv("KAGENT_LLM_STREAM_COALESCE_CHARS", "lots")
+    assert get_llm_stream_coalesce_chars() == 0
@@ -0,0 +1,153 @@
+"""Tests for Bedrock embedding requests."""
+
+import asyncio
+import json
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from kagent.adk._bedrock_embedding import (
+    AdaptiveConcurrencyLimiter,
+    embed_bedrock,
+    get_bedrock_embed_concurrency,
+)
+
+
+class _ThrottlingError(Exception):
+    response = {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}
+
+
+def _response(payload) -> dict:
+    return {"body": mock.MagicMock(read=lambda: json.dumps(payload).encode())}
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff():
+    with mock.patch("kagent.adk._bedrock_embedding._backoff_delay", return_value=0):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_cohere_embeds_texts_in_batches():
+    client = mock.MagicMock()
+    client.invoke_model.side_effect = lambda **kw: _response(
+        {"embeddings": {"float": [[float(len(t))] for t in json.loads(kw["body"])["texts"]]}}
+    )
+    texts = ["x" * (i + 1) for i in range(100)]
+
+    result = await embed_bedrock(client, "us.cohere.embed-v4:0", texts, AdaptiveConcurrencyLimiter(4))
+
+    assert result == [[float(i + 1)] for i in range(100)]
+    assert [len(json.loads(c.kwargs["body"])["texts"]) for c in client.invoke_model.call_args_list] == [96, 4]
+
+
+@pytest.mark.asyncio
+async def test_cohere_input_type_is_passed_through():
+    client = mock.MagicMock()
+    client.invoke_model.return_value = _response({"embeddings": {"float": [[1.0]]}})
+
+    await embed_bedrock(client, "cohere.embed-english-v3", ["t"], AdaptiveConcurrencyLimiter(1))
+    await embed_bedrock(client, "cohere.embed-english-v3", ["t"], AdaptiveConcurrencyLimiter(1), "search_query")
+
+    input_types = [json.loads(c.kwargs["body"])["input_type"] for c in client.invoke_model.call_args_list]
+    assert input_types == ["search_document", "search_query"]
+
+
+@pytest.mark.asyncio
+async def test_titan_requests_are_bounded():
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def invoke_model(**kwargs):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return _response({"embedding": [1.0]})
+
+    client = mock.MagicMock()
+    client.invoke_model.side_effect = invoke_model
+
+    result = await embed_bedrock(client, "amazon.titan-embed-text-v2:0", ["t"] * 12, AdaptiveConcurrencyLimiter(3))
+
+    assert len(result) == 12
+    assert peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_throttled_requests_are_retried_and_reduce_concurrency():
+    client = mock.MagicMock()
+    client.invoke_model.side_effect = [_ThrottlingError(), _ThrottlingError(), _response({"embedding": [0.5]})]
+    limiter = AdaptiveConcurrencyLimiter(8)
+
+    result = await embed_bedrock(client, "amazon.titan-embed-text-v2:0", ["t"], limiter)
+
+    assert result == [[0.5]]
+    assert client.invoke_model.call_count == 3
+    assert 2.0 <= limiter.limit < 3.0
+
+
+@pytest.mark.asyncio
+async def test_throttling_gives_up_after_max_attempts():
+    client = mock.MagicMock()
+    client.invoke_model.side_effect = _ThrottlingError()
+
+    with pytest.raises(_ThrottlingError):
+        await embed_bedrock(client, "amazon.titan-embed-text-v2:0", ["t"], AdaptiveConcurrencyLimiter(2))
+
+    assert client.invoke_model.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_other_errors_are_not_retried():
+    client = mock.MagicMock()
+    client.invoke_model.side_effect = ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        await embed_bedrock(client, "amazon.titan-embed-text-v2:0", ["t"], AdaptiveConcurrencyLimiter(2))
+
+    client.invoke_model.assert_called_once()
+
+
+def test_limiter_grows_back_after_throttling():
+    limiter = AdaptiveConcurrencyLimiter(4)
+    limiter.on_throttle()
+    limiter.on_throttle()
+    assert limiter.limit == 1.0
+
+    for _ in range(20):
+        limiter.on_success()
+    assert limiter.limit == 4.0
+
+
+@pytest.mark.asyncio
+async def test_limiter_slot_waits_for_capacity():
+    limiter = AdaptiveConcurrencyLimiter(1)
+    order = []
+
+    async def hold(name):
+        async with limiter.slot():
+            order.append(f"{name} start")
+            await asyncio.sleep(0.01)
+            order.append(f"{name} end")
+
+    await asyncio.gather(hold("a"), hold("b"))
+
+    assert order == ["a start", "a end", "b start", "b end"]
+
+
+def test_get_bedrock_embed_concurrency(monkeypatch):
+    monkeypatch.delenv("KAGENT_BEDROCK_EMBED_CONCURRENCY", raising=False)
+    assert get_bedrock_embed_concurrency() == 4
+
+    monkeypatch.setenv("KAGENT_BEDROCK_EMBED_CONCURRENCY", "16")
+    assert get_bedrock_embed_concurrency() == 16
+
+    monkeypatch.setenv("KAGENT_BEDROCK_EMBED_CONCURRENCY", "lots")
+    assert get_bedrock_embed_concurrency() == 4
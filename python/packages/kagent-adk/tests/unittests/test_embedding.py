@@ -52,7 +52,8 @@ class TestEmbeddingDispatch:
             instance.embeddings.create = mock.AsyncMock(return_value=mock_response)
             mock_cls.return_value = instance
             result = await svc._generate_embedding_async("hello world")
-        assert result == vec
+        # Embeddings are returned with float32 precision, as stored by the backend
+        assert result == np.float32(vec).tolist()
 
     @pytest.mark.asyncio
     async def test_azure_openai_uses_azure_client(self):
@@ -88,7 +89,7 @@ class TestEmbeddingDispatch:
             mock_cls.return_value = mock_client
             result = await svc._generate_embedding_async("test text")
 
-        assert result == vecs[0]
+        assert result == np.float32(vecs[0]).tolist()
         mock_client.embed.assert_called_once_with(model="nomic-embed-text", input=["test text"])
 
     @pytest.mark.asyncio
@@ -117,6 +118,21 @@ class TestEmbeddingDispatch:
         assert len(result) == 768
         assert abs(np.linalg.norm(result) - 1.0) < 1e-5
 
+    @pytest.mark.asyncio
+    async def test_batch_normalizes_only_truncated_embeddings(self):
+        svc = make_service(provider="openai", model="text-embedding-3-large")
+        mock_response = make_openai_embedding_response([[2.0] * 1000, [0.5] * 768, [3.0] * 1536])
+        with mock.patch("openai.AsyncOpenAI") as mock_cls:
+            instance = mock.AsyncMock()
+            instance.embeddings.create = mock.AsyncMock(return_value=mock_response)
+            mock_cls.return_value = instance
+            result = await svc._generate_embedding_async(["a", "b", "c"])
+
+        assert [len(v) for v in result] == [768, 768, 768]
+        assert abs(np.linalg.norm(result[0]) - 1.0) < 1e-5
+        assert result[1] == [0.5] * 768
+        assert abs(np.linalg.norm(result[2]) - 1.0) < 1e-5
+
     @pytest.mark.asyncio
     async def test_unknown_provider_falls_back_to_openai(self):
         svc = make_service(provider="custom_provider", model="my-model")
@@ -127,7 +143,7 @@ class TestEmbeddingDispatch:
             instance.embeddings.create = mock.AsyncMock(return_value=mock_response)
             mock_cls.return_value = instance
             result = await svc._generate_embedding_async("test")
-        assert result == vec
+        assert result == np.float32(vec).tolist()
 
     @pytest.mark.asyncio
     async def test_provider_error_returns_empty_list(self):
@@ -190,3 +206,52 @@ class TestEmbeddingDispatch:
         with mock.patch("boto3.client", return_value=mock_client):
             result = await svc._generate_embedding_async("test")
         assert result == []
+
+
+class TestEmbeddingClientCache:
+    @pytest.mark.asyncio
+    async def test_openai_client_reused_across_calls(self):
+        svc = make_service(provider="openai", model="text-embedding-3-small")
+        mock_response = make_openai_embedding_response([[0.1] * 768])
+        with mock.patch("openai.AsyncOpenAI") as mock_cls:
+            instance = mock.AsyncMock()
+            instance.embeddings.create = mock.AsyncMock(return_value=mock_response)
+            mock_cls.return_value = instance
+            await svc._generate_embedding_async("one")
+            await svc._generate_embedding_async("two")
+
+        mock_cls.assert_called_once()
+        assert instance.embeddings.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bedrock_client_reused_across_calls(self):
+        svc = make_service(provider="bedrock", model="amazon.titan-embed-text-v1")
+        mock_client = mock.MagicMock()
+        mock_client.invoke_model = mock.MagicMock(
+            return_value={"body": mock.MagicMock(read=lambda: b'{"embedding": ' + str([0.1] * 768).encode() + b"}")}
+        )
+
+        with mock.patch("boto3.client", return_value=mock_client) as mock_boto:
+            await svc._generate_embedding_async("one")
+            await svc._generate_embedding_async(["two", "three"])
+
+        mock_boto.assert_called_once()
+        assert mock_client.invoke_model.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_cached_clients(self):
+        svc = make_service(provider="ollama", model="nomic-embed-text")
+        mock_result = mock.MagicMock()
+        mock_result.embeddings = [[0.0] * 768]
+        mock_client = mock.AsyncMock()
+        mock_client.embed = mock.AsyncMock(return_value=mock_result)
+        sync_client = mock.MagicMock()
+        svc._embedding_clients[("bedrock", "us-east-1")] = sync_client
+
+        with mock.patch("ollama.AsyncClient", return_value=mock_client):
+            await svc._generate_embedding_async("hello")
+        await svc.aclose()
+
+        mock_client.close.assert_awaited_once()
+        sync_client.close.assert_called_once()
+        assert svc._embedding_clients == {}
@@ -0,0 +1,119 @@
+"""Tests for the embedding result cache."""
+
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from kagent.adk._embedding_cache import EmbeddingCache, get_embedding_cache_size
+from kagent.adk._memory_service import KagentMemoryService
+from kagent.adk.types import EmbeddingConfig
+
+
+def _service(cache: EmbeddingCache) -> KagentMemoryService:
+    return KagentMemoryService(
+        agent_name="test-agent",
+        http_client=mock.AsyncMock(),
+        embedding_config=EmbeddingConfig(provider="openai", model="text-embedding-3-small"),
+        embedding_cache=cache,
+    )
+
+
+def _vector(seed: float) -> list[float]:
+    return [seed] * 768
+
+
+@pytest.mark.asyncio
+async def test_repeated_queries_skip_the_provider():
+    svc = _service(EmbeddingCache(max_entries=8))
+    provider = mock.AsyncMock(
+        side_effect=lambda provider, model, texts, base, input_type=None: [_vector(0.5) for _ in texts]
+    )
+
+    with mock.patch.object(svc, "_call_embedding_provider", provider):
+        first = await svc._generate_embedding_async("where is my config?")
+        second = await svc._generate_embedding_async("where is my config?")
+
+    assert first == second == _vector(0.5)
+    provider.assert_awaited_once()
+    assert (svc.embedding_cache.hits, svc.embedding_cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_batch_only_embeds_uncached_distinct_texts():
+    svc = _service(EmbeddingCache(max_entries=8))
+    vectors = {"a": _vector(0.25), "b": _vector(0.5), "c": _vector(0.75)}
+    provider = mock.AsyncMock(
+        side_effect=lambda provider, model, texts, base, input_type=None: [vectors[t] for t in texts]
+    )
+
+    with mock.patch.object(svc, "_call_embedding_provider", provider):
+        await svc._generate_embedding_async("a")
+        result = await svc._generate_embedding_async(["b", "a", "c", "b"])
+
+    assert result == [vectors["b"], vectors["a"], vectors["c"], vectors["b"]]
+    assert provider.await_args_list[1].args[2] == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_failed_embeddings_are_not_cached():
+    svc = _service(EmbeddingCache(max_entries=8))
+    provider = mock.AsyncMock(return_value=[[0.1] * 100])
+
+    with mock.patch.object(svc, "_call_embedding_provider", provider):
+        assert await svc._generate_embedding_async("short") == []
+
+    assert len(svc.embedding_cache) == 0
+
+
+def test_cache_key_depends_on_provider_model_input_type_and_text():
+    key = EmbeddingCache.key("openai", "m", "text")
+
+    assert key == EmbeddingCache.key("openai", "m", "text")
+    assert key != EmbeddingCache.key("ollama", "m", "text")
+    assert key != EmbeddingCache.key("openai", "other", "text")
+    assert key != EmbeddingCache.key("openai", "m", "text", "search_query")
+    assert key != EmbeddingCache.key("openai", "m", "other")
+
+
+def test_cache_evicts_least_recently_used_and_stores_float32():
+    cache = EmbeddingCache(max_entries=2)
+    cache.put(b"a", _vector(0.1))
+    cache.put(b"b", _vector(0.2))
+    cache.get(b"a")
+    cache.put(b"c", _vector(0.3))
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"a").dtype == np.float32
+    assert len(cache) == 2
+
+
+def test_cache_persists_to_disk(tmp_path):
+    path = str(tmp_path / "embeddings.npz")
+    cache = EmbeddingCache(max_entries=2, path=path)
+    for key in (b"a", b"b", b"c"):
+        cache.put(EmbeddingCache.key("openai", "m", key.decode()), _vector(0.5))
+    cache.save()
+
+    loaded = EmbeddingCache(max_entries=1, path=path)
+
+    assert len(loaded) == 1
+    np.testing.assert_array_equal(loaded.get(EmbeddingCache.key("openai", "m", "c")), np.float32(_vector(0.5)))
+
+
+def test_unreadable_cache_file_is_ignored(tmp_path):
+    path = tmp_path / "embeddings.npz"
+    path.write_bytes(b"not a cache")
+
+    assert len(EmbeddingCache(path=str(path))) == 0
+
+
+def test_get_embedding_cache_size(monkeypatch):
+    monkeypatch.delenv("KAGENT_EMBEDDING_CACHE_SIZE", raising=False)
+    assert get_embedding_cache_size() == 2048
+
+    monkeypatch.setenv("KAGENT_EMBEDDING_CACHE_SIZE", "0")
+    assert get_embedding_cache_size() == 0
+
+    monkeypatch.setenv("KAGENT_EMBEDDING_CACHE_SIZE", "lots")
+    assert get_embedding_cache_size() == 2048
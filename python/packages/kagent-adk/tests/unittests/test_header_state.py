@@ -0,0 +1,126 @@
+"""Tests for persisting request headers to session state."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from google.adk.sessions import InMemorySessionService
+
+from kagent.adk._agent_executor import A2aAgentExecutor
+from kagent.adk.types import HEADERS_HASH_STATE_KEY, HEADERS_STATE_KEY
+
+
+@pytest.fixture
+async def setup():
+    session_service = InMemorySessionService()
+    runner = MagicMock()
+    runner.session_service = session_service
+    session = await session_service.create_session(app_name="app", user_id="u1", session_id="s1")
+    return A2aAgentExecutor(runner=lambda: runner), runner, session_service, session
+
+
+async def _reload(session_service):
+    return await session_service.get_session(app_name="app", user_id="u1", session_id="s1")
+
+
+@pytest.mark.asyncio
+async def test_headers_persisted_on_first_request(setup):
+    executor, runner, session_service, session = setup
+
+    await executor._update_header_state(runner, session, {"x-user-email": "a@example.com"})
+
+    stored = await _reload(session_service)
+    assert [e.invocation_id for e in stored.events] == ["header_update"]
+    assert stored.state[HEADERS_STATE_KEY] == {"x-user-email": "a@example.com"}
+    assert HEADERS_HASH_STATE_KEY in stored.state
+
+
+@pytest.mark.asyncio
+async def test_unchanged_headers_are_not_persisted_again(setup):
+    executor, runner, session_service, _ = setup
+    await executor._update_header_state(runner, await _reload(session_service), {"a": "1", "b": "2"})
+
+    session = await _reload(session_service)
+    await executor._update_header_state(runner, session, {"b": "2", "a": "1"})
+
+    assert len((await _reload(session_service)).events) == 1
+    assert session.state[HEADERS_STATE_KEY] == {"b": "2", "a": "1"}
+
+
+@pytest.mark.asyncio
+async def test_changed_headers_are_persisted(setup):
+    executor, runner, session_service, _ = setup
+    await executor._update_header_state(runner, await _reload(session_service), {"x-user-email": "a@example.com"})
+
+    await executor._update_header_state(runner, await _reload(session_service), {"x-user-email": "b@example.com"})
+
+    stored = await _reload(session_service)
+    assert len(stored.events) == 2
+    assert stored.state[HEADERS_STATE_KEY] == {"x-user-email": "b@example.com"}
+
+
+def _request_headers(**overrides) -> dict[str, str]:
+    """Headers of a request forwarded by the kagent controller, as found in call_context.state."""
+    headers = {
+        "host": "my-agent.kagent:8080",
+        "user-agent": "python-httpx/0.28.1",
+        "accept": "*/*",
+        "accept-encoding": "gzip, deflate",
+        "connection": "keep-alive",
+        "content-type": "application/json",
+        "content-length": "512",
+        "authorization": "Bearer token-a",
+        "x-user-id": "admin@kagent.dev",
+        "traceparent": "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01",
+        "x-request-id": "5f1c3a0e-8a55-4a4f-9d61-0c7c8a1f9a10",
+        "x-envoy-attempt-count": "1",
+    }
+    headers.update(overrides)
+    return headers
+
+
+@pytest.mark.asyncio
+async def test_volatile_request_headers_do_not_trigger_persistence(setup):
+    executor, runner, session_service, _ = setup
+    await executor._update_header_state(runner, await _reload(session_service), _request_headers())
+
+    session = await _reload(session_service)
+    next_request = _request_headers(
+        **{
+            "content-length": "2048",
+            "traceparent": "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01",
+            "x-request-id": "c2d1e7b4-3c51-4f0e-b7a4-5b8f1e2d9c33",
+            "x-envoy-attempt-count": "2",
+        }
+    )
+    await executor._update_header_state(runner, session, next_request)
+
+    assert len((await _reload(session_service)).events) == 1
+    # The current request's headers are still visible to this turn
+    assert session.state[HEADERS_STATE_KEY]["traceparent"] == next_request["traceparent"]
+
+
+@pytest.mark.asyncio
+async def test_changed_authorization_header_is_persisted(setup):
+    executor, runner, session_service, _ = setup
+    await executor._update_header_state(runner, await _reload(session_service), _request_headers())
+
+    await executor._update_header_state(
+        runner, await _reload(session_service), _request_headers(authorization="Bearer token-b")
+    )
+
+    stored = await _reload(session_service)
+    assert len(stored.events) == 2
+    assert stored.state[HEADERS_STATE_KEY]["authorization"] == "Bearer token-b"
+
+
+@pytest.mark.asyncio
+async def test_state_delta_is_persisted_with_unchanged_headers(setup):
+    executor, runner, session_service, _ = setup
+    await executor._update_header_state(runner, await _reload(session_service), {"a": "1"})
+
+    await executor._update_header_state(runner, await _reload(session_service), {"a": "1"}, state_delta={"k": 1.0})
+
+    stored = await _reload(session_service)
+    assert len(stored.events) == 2
+    assert stored.state["k"] == 1.0
+    assert stored.state[HEADERS_STATE_KEY] == {"a": "1"}
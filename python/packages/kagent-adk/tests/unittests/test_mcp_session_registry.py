@@ -0,0 +1,193 @@
+"""Tests for MCP sessions shared across requests."""
+
+import asyncio
+import time
+from contextlib import AsyncExitStack
+from unittest.mock import MagicMock
+
+import pytest
+from google.adk.tools.mcp_tool import SseConnectionParams, StreamableHTTPConnectionParams
+from google.adk.tools.mcp_tool.mcp_toolset import McpToolset
+from mcp.types import CallToolResult, Tool
+
+from kagent.adk import _mcp_toolset
+from kagent.adk._mcp_toolset import (
+    KAgentMcpToolset,
+    McpSessionRegistry,
+    SharedMcpSessionManager,
+    _CatalogMcpTool,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(monkeypatch):
+    registry = McpSessionRegistry(idle_timeout_seconds=10)
+    monkeypatch.setattr(_mcp_toolset, "_mcp_session_registry", registry)
+    return registry
+
+
+def _http_params(url: str = "http://tools.example/mcp", headers: dict | None = None):
+    return StreamableHTTPConnectionParams(url=url, headers=headers)
+
+
+def _add_fake_session(manager: SharedMcpSessionManager, session_key: str, last_used: float):
+    closed = []
+    exit_stack = AsyncExitStack()
+    exit_stack.push_async_callback(lambda: asyncio.sleep(0, result=closed.append(session_key)))
+    session = MagicMock()
+    session._read_stream._closed = False
+    session._write_stream._closed = False
+    manager._sessions[session_key] = (session, exit_stack, asyncio.get_running_loop())
+    manager._last_used[session_key] = last_used
+    return session, closed
+
+
+def test_toolsets_for_same_server_share_session_manager():
+    first = KAgentMcpToolset(connection_params=_http_params())
+    second = KAgentMcpToolset(connection_params=_http_params())
+
+    assert isinstance(first._mcp_session_manager, SharedMcpSessionManager)
+    assert first._mcp_session_manager is second._mcp_session_manager
+
+
+def test_toolsets_for_different_servers_do_not_share():
+    first = KAgentMcpToolset(connection_params=_http_params())
+    other_url = KAgentMcpToolset(connection_params=_http_params(url="http://other.example/mcp"))
+    other_headers = KAgentMcpToolset(connection_params=_http_params(headers={"x-team": "a"}))
+    sse = KAgentMcpToolset(connection_params=SseConnectionParams(url="http://tools.example/mcp"))
+
+    managers = {id(t._mcp_session_manager) for t in (first, other_url, other_headers, sse)}
+    assert len(managers) == 4
+
+
+def test_sharing_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("KAGENT_MCP_SHARED_SESSIONS", "false")
+    toolset = KAgentMcpToolset(connection_params=_http_params())
+
+    assert not isinstance(toolset._mcp_session_manager, SharedMcpSessionManager)
+
+
+@pytest.mark.asyncio
+async def test_shared_toolset_close_keeps_sessions_open(monkeypatch):
+    async def _close_should_not_be_called(self):
+        raise AssertionError("shared sessions must not be closed by the toolset")
+
+    monkeypatch.setattr(McpToolset, "close", _close_should_not_be_called)
+    toolset = KAgentMcpToolset(connection_params=_http_params())
+
+    await toolset.close()
+
+
+@pytest.mark.asyncio
+async def test_evict_idle_sessions_closes_only_stale_sessions():
+    manager = SharedMcpSessionManager(_http_params(), idle_timeout_seconds=10)
+    manager._connection_params.sse_read_timeout = 0
+    now = time.monotonic()
+    _, stale_closed = _add_fake_session(manager, "session_stale", now - 60)
+    _, fresh_closed = _add_fake_session(manager, "session_fresh", now)
+
+    await manager.evict_idle_sessions()
+
+    assert stale_closed == ["session_stale"]
+    assert fresh_closed == []
+    assert list(manager._sessions) == ["session_fresh"]
+
+
+@pytest.mark.asyncio
+async def test_discard_session_removes_failed_session():
+    manager = SharedMcpSessionManager(_http_params(), idle_timeout_seconds=10)
+    session, closed = _add_fake_session(manager, "session_a", time.monotonic())
+
+    await manager.discard_session(session)
+
+    assert closed == ["session_a"]
+    assert manager.session_count == 0
+
+
+@pytest.mark.asyncio
+async def test_disconnected_session_is_discarded_after_failed_call():
+    toolset = KAgentMcpToolset(connection_params=_http_params())
+    manager = toolset._mcp_session_manager
+    session, closed = _add_fake_session(manager, "session_no_headers", time.monotonic())
+
+    async def _failing_call(session):
+        session._read_stream._closed = True
+        raise RuntimeError("session terminated")
+
+    with pytest.raises(ConnectionError):
+        await toolset._execute_with_session(_failing_call, "Failed to get tools from MCP server")
+
+    assert closed == ["session_no_headers"]
+    assert manager.session_count == 0
+
+
+@pytest.mark.asyncio
+async def test_tool_error_keeps_shared_session():
+    toolset = KAgentMcpToolset(connection_params=_http_params())
+    manager = toolset._mcp_session_manager
+    session, closed = _add_fake_session(manager, "session_no_headers", time.monotonic())
+
+    async def _failing_call(session):
+        raise RuntimeError("tool failed")
+
+    with pytest.raises(ConnectionError):
+        await toolset._execute_with_session(_failing_call, "Failed to get tools from MCP server")
+
+    assert closed == []
+    assert manager._sessions["session_no_headers"][0] is session
+
+
+@pytest.mark.asyncio
+async def test_sessions_in_use_are_not_evicted():
+    toolset = KAgentMcpToolset(connection_params=_http_params())
+    manager = toolset._mcp_session_manager
+    manager._connection_params.sse_read_timeout = 0
+    _, closed = _add_fake_session(manager, "session_no_headers", time.monotonic() - 60)
+    evicted_during_call = []
+
+    async def _long_call(session):
+        await manager.evict_idle_sessions()
+        evicted_during_call.extend(closed)
+        return "done"
+
+    assert await toolset._execute_with_session(_long_call, "Failed to call tool") == "done"
+    await manager.evict_idle_sessions()
+
+    # The call marked the session used when it finished, so it is not idle afterwards either
+    assert evicted_during_call == []
+    assert closed == []
+    assert manager._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_registry_close_closes_all_sessions(fresh_registry):
+    manager = fresh_registry.get_session_manager(_http_params())
+    _, closed = _add_fake_session(manager, "session_a", time.monotonic())
+
+    await fresh_registry.close()
+
+    assert closed == ["session_a"]
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_mark_shared_session_in_flight():
+    manager = SharedMcpSessionManager(_http_params(), idle_timeout_seconds=10)
+    session, _ = _add_fake_session(manager, manager._generate_session_key(manager._merge_headers(None)), 0)
+    in_flight_during_call = []
+
+    async def _call_tool(*args, **kwargs):
+        in_flight_during_call.append(dict(manager._in_flight))
+        return CallToolResult(content=[])
+
+    session.call_tool = _call_tool
+    tool = _CatalogMcpTool(
+        catalog_entry=None,
+        mcp_tool=Tool(name="echo", inputSchema={"type": "object"}),
+        mcp_session_manager=manager,
+    )
+
+    await tool._run_async_impl(args={}, tool_context=MagicMock(), credential=None)
+
+    assert list(in_flight_during_call[0].values()) == [1]
+    assert manager._in_flight == {}
+    assert time.monotonic() - max(manager._last_used.values()) < 5
@@ -0,0 +1,212 @@
+"""Tests for the cached MCP tool catalog."""
+
+from unittest import mock
+
+import pytest
+from google.adk.tools.mcp_tool import StreamableHTTPConnectionParams
+from google.adk.tools.mcp_tool.mcp_session_manager import MCPSessionManager
+from mcp import types as mcp_types
+
+from kagent.adk import _mcp_tool_catalog, _mcp_toolset
+from kagent.adk._mcp_tool_catalog import McpToolCatalog, get_mcp_tool_cache_size, get_mcp_tool_cache_ttl
+from kagent.adk._mcp_toolset import KAgentMcpToolset, McpSessionRegistry
+
+
+class _FakeSession:
+    def __init__(self, tool_names):
+        self.tool_names = tool_names
+        self.list_calls = 0
+        self.notifications = []
+
+        async def _message_handler(message):
+            self.notifications.append(message)
+
+        self._message_handler = _message_handler
+
+    async def list_tools(self):
+        self.list_calls += 1
+        return mcp_types.ListToolsResult(
+            tools=[
+                mcp_types.Tool(
+                    name=name,
+                    description=f"{name} tool",
+                    inputSchema={"type": "object", "properties": {"path": {"type": "string"}}},
+                )
+                for name in self.tool_names
+            ]
+        )
+
+
+@pytest.fixture
+def catalog(monkeypatch):
+    catalog = McpToolCatalog(ttl_seconds=60)
+    monkeypatch.setattr(_mcp_tool_catalog, "_mcp_tool_catalog", catalog)
+    monkeypatch.setattr(_mcp_toolset, "_mcp_session_registry", McpSessionRegistry(idle_timeout_seconds=10))
+    return catalog
+
+
+def _toolset(monkeypatch, session: _FakeSession, **kwargs) -> KAgentMcpToolset:
+    toolset = KAgentMcpToolset(
+        connection_params=StreamableHTTPConnectionParams(url="http://tools.example/mcp"), **kwargs
+    )
+
+    # Stub the connection only, so the shared manager still sees every session it hands out
+    async def _create_session(self, headers=None):
+        return session
+
+    monkeypatch.setattr(MCPSessionManager, "create_session", _create_session)
+    return toolset
+
+
+def _list_changed() -> mcp_types.ServerNotification:
+    return mcp_types.ServerNotification(
+        mcp_types.ToolListChangedNotification(method="notifications/tools/list_changed")
+    )
+
+
+@pytest.mark.asyncio
+async def test_tools_are_listed_once_across_toolsets(catalog, monkeypatch):
+    session = _FakeSession(["read_file", "write_file"])
+
+    first = await _toolset(monkeypatch, session).get_tools()
+    second = await _toolset(monkeypatch, session).get_tools()
+
+    assert [t.name for t in first] == ["read_file", "write_file"]
+    assert [t.name for t in second] == ["read_file", "write_file"]
+    assert session.list_calls == 1
+    assert (catalog.hits, catalog.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_tool_filter_applied_to_cached_catalog(catalog, monkeypatch):
+    session = _FakeSession(["read_file", "write_file"])
+    await _toolset(monkeypatch, session).get_tools()
+
+    tools = await _toolset(monkeypatch, session, tool_filter=["write_file"]).get_tools()
+
+    assert [t.name for t in tools] == ["write_file"]
+    assert session.list_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_declaration_is_converted_once(catalog, monkeypatch):
+    session = _FakeSession(["read_file"])
+    (first,) = await _toolset(monkeypatch, session).get_tools()
+    (second,) = await _toolset(monkeypatch, session).get_tools()
+
+    first_decl = first._get_declaration()
+    second_decl = second._get_declaration()
+    second_decl.name = "prefixed_read_file"
+
+    assert first_decl.name == "read_file"
+    assert first._get_declaration().name == "read_file"
+    entry = catalog.get(
+        _mcp_toolset._connection_key(first._mcp_session_manager._connection_params), "session_no_headers"
+    )
+    assert list(entry._declarations) == ["read_file"]
+
+
+@pytest.mark.asyncio
+async def test_list_changed_notification_invalidates_catalog(catalog, monkeypatch):
+    session = _FakeSession(["read_file"])
+    toolset = _toolset(monkeypatch, session)
+    await toolset.get_tools()
+
+    session.tool_names = ["read_file", "delete_file"]
+    notification = _list_changed()
+    await session._message_handler(notification)
+    tools = await toolset.get_tools()
+
+    assert [t.name for t in tools] == ["read_file", "delete_file"]
+    assert session.list_calls == 2
+    assert session.notifications == [notification]
+
+
+@pytest.mark.asyncio
+async def test_expired_catalog_is_listed_again(catalog, monkeypatch):
+    session = _FakeSession(["read_file"])
+    toolset = _toolset(monkeypatch, session)
+
+    await toolset.get_tools()
+    for entry in catalog._entries.values():
+        entry.fetched_at -= 120
+    await toolset.get_tools()
+
+    assert session.list_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_reconnected_session_reports_tool_list_changes(catalog, monkeypatch):
+    first = _FakeSession(["read_file"])
+    toolset = _toolset(monkeypatch, first)
+    await toolset.get_tools()
+
+    # The session reconnects, and the new one is only used for tool calls
+    second = _FakeSession(["read_file", "delete_file"])
+    _toolset(monkeypatch, second)
+    assert await toolset._mcp_session_manager.create_session() is second
+    await second._message_handler(_list_changed())
+    tools = await toolset.get_tools()
+
+    assert [t.name for t in tools] == ["read_file", "delete_file"]
+    assert second.list_calls == 1
+
+
+def test_catalog_keeps_at_most_max_entries():
+    catalog = McpToolCatalog(ttl_seconds=60, max_entries=2)
+    catalog.put("server", "alice", [])
+    catalog.put("server", "bob", [])
+    assert catalog.get("server", "alice") is not None
+
+    catalog.put("server", "carol", [])
+
+    assert set(catalog._entries) == {("server", "alice"), ("server", "carol")}
+
+
+def test_expired_catalogs_are_swept_when_adding_one():
+    catalog = McpToolCatalog(ttl_seconds=60)
+    catalog.put("server", "token-1", [])
+    catalog.put("other", "token-1", [])
+
+    with mock.patch(
+        "kagent.adk._mcp_tool_catalog.time.monotonic",
+        return_value=catalog._entries[("server", "token-1")].fetched_at + 61,
+    ):
+        catalog.put("server", "token-2", [])
+
+    assert set(catalog._entries) == {("server", "token-2")}
+
+
+@pytest.mark.asyncio
+async def test_catalog_is_separate_per_request_headers(catalog, monkeypatch):
+    session = _FakeSession(["read_file"])
+    user = {"value": "alice"}
+    toolset = _toolset(monkeypatch, session, header_provider=lambda ctx: {"x-user": user["value"]})
+
+    await toolset.get_tools(readonly_context=object())
+    user["value"] = "bob"
+    await toolset.get_tools(readonly_context=object())
+
+    assert session.list_calls == 2
+
+
+def test_get_mcp_tool_cache_ttl(monkeypatch):
+    monkeypatch.delenv("KAGENT_MCP_TOOL_CACHE_TTL_SECONDS", raising=False)
+    assert get_mcp_tool_cache_ttl() == 300.0
+
+    monkeypatch.setenv("KAGENT_MCP_TOOL_CACHE_TTL_SECONDS", "0")
+    assert get_mcp_tool_cache_ttl() == 0.0
+
+    monkeypatch.setenv("KAGENT_MCP_TOOL_CACHE_TTL_SECONDS", "soon")
+    assert get_mcp_tool_cache_ttl() == 300.0
+
+
+def test_get_mcp_tool_cache_size(monkeypatch):
+    monkeypatch.delenv("KAGENT_MCP_TOOL_CACHE_SIZE", raising=False)
+    assert get_mcp_tool_cache_size() == 1024
+
+    monkeypatch.setenv("KAGENT_MCP_TOOL_CACHE_SIZE", "16")
+    assert get_mcp_tool_cache_size() == 16
+
+    monkeypatch.setenv("KAGENT_MCP_TOOL_CACHE_SIZE", "many")
+    assert get_mcp_tool_cache_size() == 1024
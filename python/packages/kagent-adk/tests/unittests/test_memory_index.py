@@ -0,0 +1,153 @@
+"""Tests for the local memory index."""
+
+import asyncio
+from unittest import mock
+
+import httpx
+import numpy as np
+import pytest
+
+from kagent.adk._memory_index import LocalMemoryIndex
+from kagent.adk._memory_service import KagentMemoryService
+from kagent.adk.types import EmbeddingConfig
+
+
+def _vector(*head: float) -> list[float]:
+    return [*head, *[0.0] * (768 - len(head))]
+
+
+def _index(**kwargs) -> LocalMemoryIndex:
+    index = LocalMemoryIndex(sync_seconds=60, **kwargs)
+    index.replace(
+        "u1",
+        [
+            ("m1", "likes tea", _vector(1.0, 0.0)),
+            ("m2", "uses vim", _vector(0.0, 1.0)),
+            ("m3", "likes green tea", _vector(1.0, 0.2)),
+        ],
+    )
+    return index
+
+
+def test_search_ranks_by_cosine_similarity():
+    index = _index()
+
+    [results] = index.search("u1", [_vector(1.0, 0.15)], limit=2, min_score=0.3)
+
+    assert [r["id"] for r in results] == ["m3", "m1"]
+    assert results[1]["score"] == pytest.approx(1.0 / np.hypot(1.0, 0.15))
+
+
+def test_search_ranks_each_query_and_filters_min_score():
+    index = _index()
+
+    results = index.search("u1", [_vector(1.0, 0.0), _vector(0.0, 1.0)], limit=5, min_score=0.9)
+
+    assert [[r["id"] for r in ranked] for ranked in results] == [["m1", "m3"], ["m2"]]
+    assert index.search("u2", [_vector(1.0)], limit=5, min_score=0.0) == [[]]
+
+
+def test_add_skips_known_ids_and_replace_marks_fresh():
+    index = LocalMemoryIndex(sync_seconds=60)
+    index.add("u1", [("local-1", "likes tea", _vector(1.0))])
+    index.add("u1", [("local-1", "likes tea", _vector(1.0))])
+
+    assert len(index) == 1
+    assert not index.is_fresh("u1")
+
+    index.replace("u1", [("m1", "likes tea", _vector(1.0))])
+    assert index.is_fresh("u1")
+    assert [r["id"] for r in index.search("u1", [_vector(1.0)], 5, 0.0)[0]] == ["m1"]
+
+
+def test_index_persists_and_memory_maps_vectors(tmp_path):
+    index = _index(path=str(tmp_path))
+    index.add("u2", [("m4", "works on kagent", _vector(0.0, 0.0, 1.0))])
+    index.save()
+
+    loaded = LocalMemoryIndex(path=str(tmp_path), sync_seconds=60)
+
+    assert len(loaded) == 4
+    assert loaded.is_fresh("u1")
+    assert isinstance(loaded._partitions["u1"].vectors, np.memmap)
+    assert [r["id"] for r in loaded.search("u2", [_vector(0.0, 0.0, 1.0)], 5, 0.3)[0]] == ["m4"]
+    loaded.add("u1", [("m5", "prefers dark mode", _vector(0.5, 0.5))])
+    assert len(loaded) == 5
+
+
+def test_unreadable_index_is_ignored(tmp_path):
+    (tmp_path / "entries.json").write_text("not an index")
+
+    assert len(LocalMemoryIndex(path=str(tmp_path))) == 0
+
+
+def _service(client, index: LocalMemoryIndex) -> KagentMemoryService:
+    svc = KagentMemoryService(
+        agent_name="test-agent",
+        http_client=client,
+        embedding_config=EmbeddingConfig(provider="openai", model="text-embedding-3-small"),
+        local_index=index,
+    )
+    svc._generate_embedding_async = mock.AsyncMock(return_value=_vector(1.0, 0.0))
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_fresh_index_answers_without_backend():
+    client = mock.AsyncMock()
+    svc = _service(client, _index())
+
+    result = await svc.search_memory(app_name="app", user_id="u1", query="tea?")
+
+    assert [m.id for m in result.memories] == ["m1", "m3"]
+    client.post.assert_not_awaited()
+    client.get.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_stale_index_searches_backend_and_syncs():
+    request = httpx.Request("GET", "http://kagent")
+    client = mock.AsyncMock()
+    client.post.return_value = httpx.Response(200, json=[{"id": "m9", "content": "backend"}], request=request)
+    client.get.return_value = httpx.Response(
+        200, json=[{"id": "m9", "content": "backend", "vector": _vector(1.0)}], request=request
+    )
+    svc = _service(client, LocalMemoryIndex(sync_seconds=60))
+
+    result = await svc.search_memory(app_name="app", user_id="u1", query="tea?")
+    await asyncio.gather(*svc._index_syncs.values())
+
+    assert [m.id for m in result.memories] == ["m9"]
+    assert client.get.await_args.kwargs["params"]["include_vectors"] == "true"
+    assert svc.local_index.is_fresh("u1")
+
+
+@pytest.mark.asyncio
+async def test_unreachable_backend_falls_back_to_saved_memories():
+    client = mock.AsyncMock()
+    client.post.side_effect = httpx.ConnectError("connection refused")
+    client.get.side_effect = httpx.ConnectError("connection refused")
+    svc = _service(client, LocalMemoryIndex(sync_seconds=60))
+
+    await svc.add_memory(app_name="app", user_id="u1", content="likes tea")
+    result = await svc.search_memory(app_name="app", user_id="u1", query="tea?")
+    await asyncio.gather(*svc._index_syncs.values())
+
+    assert [m.content.parts[0].text for m in result.memories] == ["likes tea"]
+    assert not svc.local_index.is_fresh("u1")
+
+
+@pytest.mark.asyncio
+async def test_sync_is_disabled_when_backend_omits_vectors():
+    request = httpx.Request("GET", "http://kagent")
+    client = mock.AsyncMock()
+    client.post.return_value = httpx.Response(200, json=[], request=request)
+    client.get.return_value = httpx.Response(200, json=[{"id": "m9", "content": "backend"}], request=request)
+    svc = _service(client, LocalMemoryIndex(sync_seconds=0))
+
+    await svc.search_memory(app_name="app", user_id="u1", query="tea?")
+    await asyncio.gather(*svc._index_syncs.values())
+    await svc.search_memory(app_name="app", user_id="u1", query="tea?")
+
+    assert svc._vector_list_supported is False
+    client.get.assert_awaited_once()
@@ -0,0 +1,232 @@
+"""Tests for the background memory save queue."""
+
+import asyncio
+import contextvars
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from kagent.adk._memory_save_queue import MemorySaveQueue, get_memory_save_concurrency
+from kagent.adk._memory_service import KagentMemoryService
+from kagent.adk.models import OpenAI
+from kagent.adk.models._client_registry import get_request_passthrough_key, set_request_passthrough_key
+
+
+def _session(session_id: str, events: int = 0, user_id: str = "u1"):
+    return SimpleNamespace(app_name="app", user_id=user_id, id=session_id, events=[object()] * events)
+
+
+@pytest.mark.asyncio
+async def test_saves_run_with_bounded_concurrency():
+    running = 0
+    peak = 0
+
+    async def save(sessions, model):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    queue = MemorySaveQueue(save, concurrency=2, max_size=10, drain_timeout=5)
+    for i in range(6):
+        assert queue.submit(_session(f"s{i}", user_id=f"u{i}"))
+    await queue.drain()
+
+    assert peak == 2
+    assert queue.depth == 0
+
+
+@pytest.mark.asyncio
+async def test_resubmitted_session_replaces_queued_copy():
+    release = asyncio.Event()
+    saved = []
+
+    async def save(sessions, model):
+        await release.wait()
+        saved.extend((session.id, len(session.events)) for session in sessions)
+
+    queue = MemorySaveQueue(save, concurrency=1, max_size=10, drain_timeout=5)
+    queue.submit(_session("busy"))
+    await asyncio.sleep(0)
+    queue.submit(_session("s1", events=5))
+    queue.submit(_session("s1", events=10))
+
+    assert queue.depth == 1
+    release.set()
+    await queue.drain()
+    assert saved == [("busy", 0), ("s1", 10)]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_new_sessions():
+    release = asyncio.Event()
+    saved = []
+
+    async def save(sessions, model):
+        await release.wait()
+        saved.extend(session.id for session in sessions)
+
+    queue = MemorySaveQueue(save, concurrency=1, max_size=1, drain_timeout=5)
+    queue.submit(_session("busy"))
+    await asyncio.sleep(0)
+
+    assert queue.submit(_session("s1"))
+    assert not queue.submit(_session("s2"))
+    assert queue.dropped == 1
+    release.set()
+    await queue.drain()
+    assert saved == ["busy", "s1"]
+
+
+@pytest.mark.asyncio
+async def test_drain_times_out_and_rejects_new_saves():
+    async def save(sessions, model):
+        await asyncio.sleep(10)
+
+    queue = MemorySaveQueue(save, concurrency=1, max_size=10, drain_timeout=0.01)
+    queue.submit(_session("s1"))
+    queue.submit(_session("s2", user_id="u2"))
+    await queue.drain()
+
+    assert queue.depth == 0
+    assert not queue.submit(_session("s3"))
+
+
+@pytest.mark.asyncio
+async def test_failed_save_does_not_stop_worker():
+    save = mock.AsyncMock(side_effect=[RuntimeError("boom"), None])
+
+    queue = MemorySaveQueue(save, concurrency=1, max_size=10, drain_timeout=5)
+    queue.submit(_session("s1"))
+    queue.submit(_session("s2", user_id="u2"))
+    await queue.drain()
+
+    assert save.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_queued_sessions_of_one_user_are_saved_together():
+    release = asyncio.Event()
+    batches = []
+
+    async def save(sessions, model):
+        await release.wait()
+        batches.append(([session.id for session in sessions], model))
+
+    queue = MemorySaveQueue(save, concurrency=1, max_size=10, drain_timeout=5, max_batch_size=2)
+    queue.submit(_session("busy", user_id="u0"))
+    await asyncio.sleep(0)
+    queue.submit(_session("a1"), model="m")
+    queue.submit(_session("b1", user_id="u2"), model="m")
+    queue.submit(_session("a2"), model="m")
+    queue.submit(_session("a3"), model="m")
+    queue.submit(_session("a4"), model="other")
+
+    release.set()
+    await queue.drain()
+    assert batches == [
+        (["busy"], None),
+        (["a1", "a2"], "m"),
+        (["b1"], "m"),
+        (["a3"], "m"),
+        (["a4"], "other"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sessions_with_equally_configured_models_are_saved_together():
+    release = asyncio.Event()
+    batches = []
+
+    async def save(sessions, model):
+        await release.wait()
+        batches.append([session.id for session in sessions])
+
+    def model(name: str) -> OpenAI:
+        # Every request builds its own model instance
+        return OpenAI(model=name, type="openai", base_url="http://llm.example/v1")
+
+    queue = MemorySaveQueue(save, concurrency=1, max_size=10, drain_timeout=5, max_batch_size=4)
+    queue.submit(_session("busy", user_id="u0"))
+    await asyncio.sleep(0)
+    queue.submit(_session("a1"), model=model("gpt-4o-mini"))
+    queue.submit(_session("a2"), model=model("gpt-4o-mini"))
+    queue.submit(_session("a3"), model=model("gpt-4o"))
+
+    release.set()
+    await queue.drain()
+    assert batches == [["busy"], ["a1", "a2"], ["a3"]]
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_saved_with_the_passthrough_key_of_their_request():
+    release = asyncio.Event()
+    batches = []
+
+    async def save(sessions, model):
+        await release.wait()
+        batches.append(([session.id for session in sessions], get_request_passthrough_key()))
+
+    queue = MemorySaveQueue(save, concurrency=1, max_size=10, drain_timeout=5, max_batch_size=4)
+
+    async def request(session_id: str, token: str, user_id: str = "u1"):
+        set_request_passthrough_key(token)
+        queue.submit(_session(session_id, user_id=user_id), model="m")
+
+    # The first request starts the worker, which must not keep its key
+    await asyncio.create_task(request("busy", "key-a", user_id="u0"))
+    await asyncio.sleep(0)
+    await asyncio.create_task(request("a1", "key-b"))
+    await asyncio.create_task(request("a2", "key-c"))
+    await asyncio.create_task(request("a3", "key-b"))
+    queue.submit(_session("a4"), model="m")
+
+    release.set()
+    await queue.drain()
+    assert batches == [(["busy"], "key-a"), (["a1", "a3"], "key-b"), (["a2"], "key-c"), (["a4"], None)]
+
+
+@pytest.mark.asyncio
+async def test_workers_do_not_inherit_the_submitting_request_context():
+    request_var = contextvars.ContextVar("request_var", default=None)
+    seen = []
+
+    async def save(sessions, model):
+        seen.append(request_var.get())
+
+    queue = MemorySaveQueue(save, concurrency=1, max_size=10, drain_timeout=5)
+
+    async def request():
+        request_var.set("request-1")
+        queue.submit(_session("s1"))
+
+    await asyncio.create_task(request())
+    await queue.drain()
+
+    assert seen == [None]
+
+
+@pytest.mark.asyncio
+async def test_memory_service_saves_through_queue_and_drains_on_close():
+    svc = KagentMemoryService(agent_name="test-agent", http_client=mock.AsyncMock())
+    svc._add_sessions_to_memory_background = mock.AsyncMock()
+    svc.save_queue._save = svc._add_sessions_to_memory_background
+    session = _session("s1")
+
+    await svc.add_session_to_memory(session, model="m")
+    await svc.aclose()
+
+    svc._add_sessions_to_memory_background.assert_awaited_once_with([session], "m")
+
+
+def test_get_memory_save_concurrency(monkeypatch):
+    monkeypatch.delenv("KAGENT_MEMORY_SAVE_CONCURRENCY", raising=False)
+    assert get_memory_save_concurrency() == 2
+
+    monkeypatch.setenv("KAGENT_MEMORY_SAVE_CONCURRENCY", "4")
+    assert get_memory_save_concurrency() == 4
+
+    monkeypatch.setenv("KAGENT_MEMORY_SAVE_CONCURRENCY", "many")
+    assert get_memory_save_concurrency() == 2
@@ -0,0 +1,244 @@
+"""Tests for batched memory search."""
+
+from types import SimpleNamespace
+from unittest import mock
+
+import httpx
+import pytest
+from a2a.types import AgentCapabilities, AgentCard
+from fastapi import FastAPI
+from google.genai import types
+
+from kagent.adk._a2a import KAgentApp
+from kagent.adk._embedding_cache import EmbeddingCache
+from kagent.adk._memory_service import KagentMemoryService, reciprocal_rank_fusion
+from kagent.adk.tools.prefetch_memory_tool import PrefetchMemoryTool
+from kagent.adk.types import AgentConfig, EmbeddingConfig, MemoryConfig, OpenAI
+
+
+def _response(status_code: int, body) -> httpx.Response:
+    return httpx.Response(status_code, json=body, request=httpx.Request("POST", "http://kagent"))
+
+
+def _service(post, **kwargs) -> KagentMemoryService:
+    client = mock.MagicMock(spec=httpx.AsyncClient)
+    client.post = mock.AsyncMock(side_effect=post)
+    svc = KagentMemoryService(
+        agent_name="test-agent",
+        http_client=client,
+        embedding_config=EmbeddingConfig(provider="openai", model="text-embedding-3-small"),
+        embedding_cache=EmbeddingCache(max_entries=0),
+        **kwargs,
+    )
+    svc._call_embedding_provider = mock.AsyncMock(
+        side_effect=lambda provider, model, texts, base, input_type=None: [
+            [0.1 * (i + 1)] * 768 for i in range(len(texts))
+        ]
+    )
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_search_memory_batch_embeds_and_searches_once():
+    async def post(url, json):
+        assert url == "/api/memories/search/batch"
+        assert len(json["vectors"]) == 2
+        assert json["per_query"] is True
+        return _response(200, [{"id": "m1", "content": "likes tea", "score": 0.9}])
+
+    svc = _service(post)
+
+    result = await svc.search_memory_batch(app_name="app", user_id="u1", queries=["tea?", "coffee?", "tea?"])
+
+    assert [m.id for m in result.memories] == ["m1"]
+    svc._call_embedding_provider.assert_awaited_once()
+    svc.client.post.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_search_memory_batch_splits_vectors_at_server_limit():
+    async def post(url, json):
+        if len(json["vectors"]) > 50:
+            return _response(400, {"error": "batch size exceeds maximum of 50"})
+        return _response(
+            200, [[{"id": f"m{len(json['vectors'])}", "content": "x", "score": 0.9}]] * len(json["vectors"])
+        )
+
+    svc = _service(post)
+
+    result = await svc.search_memory_batch(app_name="app", user_id="u1", queries=[f"q{i}" for i in range(120)])
+
+    assert [len(c.kwargs["json"]["vectors"]) for c in svc.client.post.await_args_list] == [50, 50, 20]
+    assert {m.id for m in result.memories} == {"m50", "m20"}
+
+
+@pytest.mark.asyncio
+async def test_search_memory_batch_falls_back_to_single_searches():
+    results = iter(
+        [
+            [{"id": "m1", "content": "likes tea", "score": 0.4}, {"id": "m2", "content": "uses vim", "score": 0.5}],
+            [{"id": "m1", "content": "likes tea", "score": 0.8}],
+        ]
+    )
+
+    async def post(url, json):
+        if url.endswith("/batch"):
+            return _response(404, {})
+        return _response(200, next(results))
+
+    svc = _service(post)
+
+    result = await svc.search_memory_batch(app_name="app", user_id="u1", queries=["a", "b"])
+
+    assert [m.id for m in result.memories] == ["m1", "m2"]
+    assert svc._batch_search_supported is False
+    assert [c.args[0] for c in svc.client.post.await_args_list] == [
+        "/api/memories/search/batch",
+        "/api/memories/search",
+        "/api/memories/search",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_memory_batch_fuses_ranks_and_keeps_scores():
+    async def post(url, json):
+        assert (json["limit"], json["min_score"]) == (2, 0.5)
+        return _response(
+            200,
+            [
+                [
+                    {"id": "m1", "content": "likes tea", "score": 0.95},
+                    {"id": "m2", "content": "uses vim", "score": 0.7},
+                ],
+                [
+                    {"id": "m3", "content": "likes coffee", "score": 0.9},
+                    {"id": "m2", "content": "uses vim", "score": 0.8},
+                ],
+            ],
+        )
+
+    svc = _service(post, search_limit=2, search_min_score=0.5)
+
+    result = await svc.search_memory_batch(app_name="app", user_id="u1", queries=["tea?", "editor?"])
+
+    assert [m.id for m in result.memories] == ["m2", "m1"]
+    assert result.memories[0].custom_metadata == {"score": 0.8, "rrf_score": pytest.approx(2 / 62)}
+    assert result.memories[1].custom_metadata["score"] == 0.95
+
+
+@pytest.mark.asyncio
+async def test_search_memory_keeps_score_and_uses_configured_limits():
+    async def post(url, json):
+        assert url == "/api/memories/search"
+        assert (json["limit"], json["min_score"]) == (3, 0.6)
+        return _response(200, [{"id": "m1", "content": "likes tea", "score": 0.9}])
+
+    svc = _service(post, search_limit=3, search_min_score=0.6)
+
+    result = await svc.search_memory(app_name="app", user_id="u1", query="tea?")
+
+    assert result.memories[0].custom_metadata == {"score": 0.9}
+
+
+@pytest.mark.asyncio
+async def test_searches_embed_queries_and_saves_embed_documents():
+    async def post(url, json):
+        return _response(200, [])
+
+    svc = _service(post)
+
+    await svc.search_memory(app_name="app", user_id="u1", query="tea?")
+    await svc.search_memory_batch(app_name="app", user_id="u1", queries=["coffee?", "water?"])
+    await svc.add_memory(app_name="app", user_id="u1", content="likes tea")
+
+    input_types = [c.kwargs["input_type"] for c in svc._call_embedding_provider.await_args_list]
+    assert input_types == ["search_query", "search_query", "search_document"]
+
+
+def test_reciprocal_rank_fusion_prefers_items_ranked_by_several_lists():
+    fused = reciprocal_rank_fusion([["a", "b"], ["b", "c"], ["d"]], key=lambda item: item)
+
+    assert [item for item, _ in fused] == ["b", "a", "d", "c"]
+    assert fused[0][1] == pytest.approx(1 / 61 + 1 / 62)
+
+
+@pytest.mark.asyncio
+async def test_prefetch_uses_batch_search():
+    svc = _service(None)
+    svc.search_memory_batch = mock.AsyncMock(
+        return_value=SimpleNamespace(
+            memories=[SimpleNamespace(id="m1", content=types.Content(parts=[types.Part(text="likes tea")]))]
+        )
+    )
+    text = "I would like to order something to drink today. Please remember what I usually prefer."
+    tool_context = SimpleNamespace(
+        user_content=types.Content(role="user", parts=[types.Part(text=text)]),
+        session=SimpleNamespace(events=[SimpleNamespace(author="user")]),
+        state={},
+        _invocation_context=SimpleNamespace(memory_service=svc, app_name="app", user_id="u1"),
+    )
+    llm_request = mock.MagicMock()
+
+    await PrefetchMemoryTool().process_llm_request(tool_context=tool_context, llm_request=llm_request)
+
+    svc.search_memory_batch.assert_awaited_once_with(
+        app_name="app",
+        user_id="u1",
+        queries=["I would like to order something to drink today.", "Please remember what I usually prefer."],
+    )
+    assert "likes tea" in llm_request.append_instructions.call_args.args[0][0]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_fuses_results_of_other_memory_services():
+    def memory(memory_id: str, text: str):
+        return SimpleNamespace(id=memory_id, content=types.Content(parts=[types.Part(text=text)]))
+
+    responses = {
+        "I would like to order something to drink today.": [memory("m1", "likes tea"), memory("m2", "likes coffee")],
+        "Please remember what I usually prefer.": [memory("m2", "likes coffee")],
+    }
+    tool_context = SimpleNamespace(
+        user_content=types.Content(role="user", parts=[types.Part(text=" ".join(responses))]),
+        session=SimpleNamespace(events=[SimpleNamespace(author="user")]),
+        state={},
+        search_memory=mock.AsyncMock(side_effect=lambda q: SimpleNamespace(memories=responses[q])),
+        _invocation_context=SimpleNamespace(memory_service=mock.MagicMock()),
+    )
+    llm_request = mock.MagicMock()
+
+    await PrefetchMemoryTool().process_llm_request(tool_context=tool_context, llm_request=llm_request)
+
+    assert "likes coffee\nlikes tea" in llm_request.append_instructions.call_args.args[0][0]
+
+
+def test_app_configures_memory_search_from_memory_config():
+    agent_config = AgentConfig(
+        model=OpenAI(model="gpt-4o", type="openai"),
+        description="test",
+        instruction="test",
+        memory=MemoryConfig(search_limit=3, search_min_score=0.5),
+    )
+    agent_card = AgentCard(
+        name="test-agent",
+        description="test",
+        url="http://localhost:8080",
+        version="0.1.0",
+        capabilities=AgentCapabilities(),
+        default_input_modes=["text"],
+        default_output_modes=["text"],
+        skills=[],
+    )
+    app = KAgentApp(
+        root_agent_factory=mock.MagicMock(),
+        agent_card=agent_card,
+        kagent_url="http://kagent",
+        app_name="test-agent",
+        agent_config=agent_config,
+    )
+
+    with mock.patch("kagent.adk._a2a.KagentMemoryService", wraps=KagentMemoryService) as memory_service:
+        assert isinstance(app.build(), FastAPI)
+
+    kwargs = memory_service.call_args.kwargs
+    assert (kwargs["search_limit"], kwargs["search_min_score"]) == (3, 0.5)
@@ -0,0 +1,106 @@
+"""Tests for summarizing sessions before they are saved to memory."""
+
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from google.adk.events import Event
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from kagent.adk._memory_service import KagentMemoryService
+from kagent.adk.types import AgentConfig, EmbeddingConfig
+
+
+def _session(session_id: str, text: str):
+    event = Event(
+        invocation_id="inv",
+        author="user",
+        content=types.Content(role="user", parts=[types.Part(text=text)]),
+        timestamp=1.0,
+    )
+    return SimpleNamespace(app_name="app", user_id="u1", id=session_id, events=[event], state={})
+
+
+def _model(*outputs: str):
+    model = mock.MagicMock(model="summarizer")
+    responses = iter(outputs)
+
+    async def generate(llm_request, stream=False):
+        yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text=next(responses))]))
+
+    model.generate_content_async = mock.MagicMock(side_effect=generate)
+    return model
+
+
+def _service() -> KagentMemoryService:
+    client = mock.AsyncMock()
+    client.post.return_value = mock.MagicMock(status_code=200)
+    svc = KagentMemoryService(
+        agent_name="test-agent",
+        http_client=client,
+        embedding_config=EmbeddingConfig(provider="openai", model="text-embedding-3-small"),
+    )
+    svc._generate_embedding_async = mock.AsyncMock(side_effect=lambda texts: [[0.1] * 768 for _ in texts])
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_summarized_in_one_call():
+    svc = _service()
+    model = _model(json.dumps([["likes tea"], ["uses vim", "works on kagent"]]))
+
+    await svc._add_sessions_to_memory_background([_session("s1", "tea"), _session("s2", "vim")], model)
+
+    model.generate_content_async.assert_called_once()
+    prompt = model.generate_content_async.call_args.args[0].contents[0].parts[0].text
+    assert "### Conversation 1\nuser: tea" in prompt
+    assert "### Conversation 2\nuser: vim" in prompt
+    items = svc.client.post.await_args.kwargs["json"]["items"]
+    assert [item["content"] for item in items] == ["likes tea", "uses vim", "works on kagent"]
+
+
+@pytest.mark.asyncio
+async def test_malformed_batch_summary_falls_back_to_separate_calls():
+    svc = _service()
+    model = _model(json.dumps(["only one list"]), json.dumps(["likes tea"]), json.dumps(["uses vim"]))
+
+    summaries = await svc._summarize_sessions_content_async(["user: tea", "user: vim"], model)
+
+    assert summaries == [["likes tea"], ["uses vim"]]
+    assert model.generate_content_async.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_summary_strips_markdown_fences():
+    svc = _service()
+    model = _model('```json\n["likes tea"]\n```')
+
+    assert await svc._summarize_session_content_async("user: tea", model) == ["likes tea"]
+
+
+@pytest.mark.asyncio
+async def test_auto_save_uses_configured_summarizer_model():
+    config = AgentConfig.model_validate(
+        {
+            "model": {"type": "openai", "model": "gpt-4"},
+            "description": "test agent",
+            "instruction": "test instruction",
+            "memory": {"summarizer_model": {"type": "openai", "model": "gpt-4o-mini"}},
+        }
+    )
+    agent = config.to_agent("test_agent")
+    memory_service = mock.AsyncMock()
+    callback_context = SimpleNamespace(
+        _invocation_context=SimpleNamespace(
+            session=SimpleNamespace(id="s1", events=[SimpleNamespace(author="user")] * 5),
+            memory_service=memory_service,
+        )
+    )
+
+    await agent.after_agent_callback[-1](callback_context)
+
+    model = memory_service.add_session_to_memory.await_args.kwargs["model"]
+    assert model is not agent.model
+    assert model.model == "gpt-4o-mini"
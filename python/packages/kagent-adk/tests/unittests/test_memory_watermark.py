@@ -0,0 +1,119 @@
+"""Tests for incremental session summarization into memory."""
+
+from unittest import mock
+
+import pytest
+from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from kagent.adk._agent_executor import A2aAgentExecutor
+from kagent.adk._memory_service import KagentMemoryService
+from kagent.adk.types import MEMORY_WATERMARK_STATE_KEY, EmbeddingConfig
+
+
+def _event(author: str, text: str, timestamp: float) -> Event:
+    return Event(
+        invocation_id="inv",
+        author=author,
+        content=types.Content(role="user" if author == "user" else "model", parts=[types.Part(text=text)]),
+        timestamp=timestamp,
+    )
+
+
+async def _setup(post_status: int = 200):
+    session_service = InMemorySessionService()
+    session = await session_service.create_session(app_name="app", user_id="u1", session_id="s1")
+    client = mock.AsyncMock()
+    client.post.return_value = mock.MagicMock(status_code=post_status, raise_for_status=mock.MagicMock())
+    if post_status >= 400:
+        client.post.return_value.raise_for_status.side_effect = RuntimeError("server error")
+    svc = KagentMemoryService(
+        agent_name="test-agent",
+        http_client=client,
+        embedding_config=EmbeddingConfig(provider="openai", model="text-embedding-3-small"),
+    )
+    svc._summarize_session_content_async = mock.AsyncMock(side_effect=lambda content, model=None: [content])
+    svc._generate_embedding_async = mock.AsyncMock(side_effect=lambda texts: [[0.1] * 768 for _ in texts])
+    return svc, session_service, session
+
+
+@pytest.mark.asyncio
+async def test_only_new_events_are_summarized():
+    svc, session_service, session = await _setup()
+    await session_service.append_event(session, _event("user", "first question", 1.0))
+    await session_service.append_event(session, _event("agent", "first answer", 2.0))
+
+    await svc._add_session_to_memory_background(session)
+    assert svc.watermark_state_delta(session) == {MEMORY_WATERMARK_STATE_KEY: 2.0}
+
+    await session_service.append_event(session, _event("user", "second question", 3.0))
+    await svc._add_session_to_memory_background(session)
+
+    summarized = [c.args[0] for c in svc._summarize_session_content_async.await_args_list]
+    assert summarized == ["user: first question\nagent: first answer", "user: second question"]
+
+
+@pytest.mark.asyncio
+async def test_background_save_does_not_write_to_session():
+    svc, session_service, session = await _setup()
+    await session_service.append_event(session, _event("user", "question", 1.0))
+
+    await svc._add_session_to_memory_background(session)
+
+    stored = await session_service.get_session(app_name="app", user_id="u1", session_id="s1")
+    assert [e.invocation_id for e in stored.events] == ["inv"]
+    assert MEMORY_WATERMARK_STATE_KEY not in stored.state
+    assert MEMORY_WATERMARK_STATE_KEY not in session.state
+
+
+@pytest.mark.asyncio
+async def test_watermark_is_persisted_on_next_turn():
+    svc, session_service, session = await _setup()
+    await session_service.append_event(session, _event("user", "question", 1.0))
+    await svc._add_session_to_memory_background(session)
+    runner = mock.MagicMock(session_service=session_service, memory_service=svc)
+    executor = A2aAgentExecutor(runner=lambda: runner)
+
+    await executor._update_header_state(runner, session, {}, state_delta=svc.watermark_state_delta(session))
+
+    stored = await session_service.get_session(app_name="app", user_id="u1", session_id="s1")
+    assert stored.state[MEMORY_WATERMARK_STATE_KEY] == 1.0
+    assert svc.watermark_state_delta(stored) == {}
+    # Persisted watermarks are no longer kept in-process
+    assert not svc._watermarks
+
+
+@pytest.mark.asyncio
+async def test_pending_watermarks_are_bounded():
+    svc, _, session = await _setup()
+
+    with mock.patch("kagent.adk._memory_service._MAX_PENDING_WATERMARKS", 2):
+        for session_id in ("s1", "s2", "s3"):
+            svc._advance_watermark(session.model_copy(update={"id": session_id}), 1.0)
+
+    assert [key[2] for key in svc._watermarks] == ["s2", "s3"]
+
+
+@pytest.mark.asyncio
+async def test_watermark_survives_stale_session_state():
+    svc, session_service, session = await _setup()
+    await session_service.append_event(session, _event("user", "question", 1.0))
+    stale = await session_service.get_session(app_name="app", user_id="u1", session_id="s1")
+
+    await svc._add_session_to_memory_background(session)
+    await svc._add_session_to_memory_background(stale)
+
+    svc._summarize_session_content_async.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_save_does_not_advance_watermark():
+    svc, session_service, session = await _setup(post_status=500)
+    await session_service.append_event(session, _event("user", "question", 1.0))
+
+    await svc._add_session_to_memory_background(session)
+    await svc._add_session_to_memory_background(session)
+
+    assert MEMORY_WATERMARK_STATE_KEY not in session.state
+    assert svc._summarize_session_content_async.await_count == 2
@@ -0,0 +1,271 @@
+"""Tests for the A2A executor runner pool."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from google.adk.agents import Agent
+from google.adk.artifacts import InMemoryArtifactService
+from google.adk.tools import BaseTool
+from google.adk.tools.mcp_tool import StreamableHTTPConnectionParams
+
+from kagent.adk._agent_executor import A2aAgentExecutor, A2aAgentExecutorConfig
+from kagent.adk._mcp_toolset import KAgentMcpToolset
+from kagent.adk._runner_pool import (
+    RunnerPool,
+    RunnerPoolConfig,
+    get_runner_pool_config,
+    reset_runner_request_state,
+    runner_mcp_sessions_healthy,
+)
+
+
+class _StatefulTool(BaseTool):
+    def __init__(self):
+        super().__init__(name="stateful", description="tool with per-request state")
+        self.resets = 0
+
+    def reset_request_state(self) -> None:
+        self.resets += 1
+
+
+def _make_runner(tools=None):
+    runner = MagicMock()
+    runner.agent = Agent(name="test_agent", model="gemini-2.0-flash", tools=tools or [])
+    runner.artifact_service = InMemoryArtifactService()
+    return runner
+
+
+def _make_pool(config: RunnerPoolConfig | None = None, health_check=None):
+    created: list = []
+    closed: list = []
+
+    async def factory():
+        runner = _make_runner()
+        created.append(runner)
+        return runner
+
+    async def close_runner(runner):
+        closed.append(runner)
+
+    pool = RunnerPool(
+        factory=factory,
+        close_runner=close_runner,
+        config=config or RunnerPoolConfig(),
+        health_check=health_check,
+    )
+    return pool, created, closed
+
+
+@pytest.mark.asyncio
+async def test_released_runner_is_reused():
+    pool, created, closed = _make_pool()
+
+    runner = await pool.acquire()
+    await pool.release(runner)
+    again = await pool.acquire()
+
+    assert again is runner
+    assert len(created) == 1
+    assert pool.reused == 1
+    assert closed == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_acquires_get_distinct_runners():
+    pool, created, _ = _make_pool()
+
+    first = await pool.acquire()
+    second = await pool.acquire()
+
+    assert first is not second
+    assert len(created) == 2
+    assert pool.in_use_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_request_runner_is_discarded():
+    pool, _, closed = _make_pool()
+
+    runner = await pool.acquire()
+    await pool.release(runner, reusable=False)
+
+    assert closed == [runner]
+    assert pool.idle_count == 0
+
+
+@pytest.mark.asyncio
+async def test_idle_runners_bounded_by_max_size():
+    pool, _, closed = _make_pool(RunnerPoolConfig(max_size=1))
+
+    first = await pool.acquire()
+    second = await pool.acquire()
+    await pool.release(first)
+    await pool.release(second)
+
+    assert pool.idle_count == 1
+    assert closed == [first]
+
+
+@pytest.mark.asyncio
+async def test_expired_runner_is_not_reused():
+    pool, created, closed = _make_pool(RunnerPoolConfig(idle_ttl_seconds=-1))
+
+    runner = await pool.acquire()
+    await pool.release(runner)
+    again = await pool.acquire()
+
+    assert again is not runner
+    assert runner in closed
+    assert len(created) == 2
+
+
+@pytest.mark.asyncio
+async def test_runner_recycled_after_max_uses():
+    pool, _, closed = _make_pool(RunnerPoolConfig(max_uses=2))
+
+    runner = await pool.acquire()
+    await pool.release(runner)
+    assert await pool.acquire() is runner
+    await pool.release(runner)
+
+    assert closed == [runner]
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_runner_is_replaced():
+    pool, created, closed = _make_pool(health_check=lambda runner: False)
+
+    runner = await pool.acquire()
+    await pool.release(runner)
+    again = await pool.acquire()
+
+    assert again is not runner
+    assert closed == [runner]
+    assert len(created) == 2
+
+
+def _add_mcp_session(toolset: KAgentMcpToolset, closed: bool):
+    session = MagicMock()
+    session._read_stream._closed = closed
+    session._write_stream._closed = False
+    toolset._mcp_session_manager._sessions["key"] = (session, MagicMock(), None)
+
+
+def test_runner_with_disconnected_mcp_session_is_unhealthy():
+    toolset = KAgentMcpToolset(
+        connection_params=StreamableHTTPConnectionParams(url="http://tools.example/mcp"), share_sessions=False
+    )
+    runner = _make_runner(tools=[toolset])
+
+    assert runner_mcp_sessions_healthy(runner)
+    _add_mcp_session(toolset, closed=False)
+    assert runner_mcp_sessions_healthy(runner)
+    _add_mcp_session(toolset, closed=True)
+    assert not runner_mcp_sessions_healthy(runner)
+
+
+def test_shared_mcp_sessions_do_not_make_runner_unhealthy():
+    toolset = KAgentMcpToolset(
+        connection_params=StreamableHTTPConnectionParams(url="http://tools.example/mcp"), share_sessions=True
+    )
+    _add_mcp_session(toolset, closed=True)
+
+    try:
+        assert runner_mcp_sessions_healthy(_make_runner(tools=[toolset]))
+    finally:
+        toolset._mcp_session_manager._sessions.clear()
+
+
+def test_executor_pool_checks_mcp_session_health():
+    executor = A2aAgentExecutor(
+        runner=lambda: None,
+        config=A2aAgentExecutorConfig(runner_pool=RunnerPoolConfig()),
+    )
+
+    assert executor._runner_pool._health_check is runner_mcp_sessions_healthy
+
+
+@pytest.mark.asyncio
+async def test_close_closes_idle_and_later_released_runners():
+    pool, _, closed = _make_pool()
+
+    idle = await pool.acquire()
+    busy = await pool.acquire()
+    await pool.release(idle)
+    await pool.close()
+    assert closed == [idle]
+
+    await pool.release(busy)
+    assert closed == [idle, busy]
+    with pytest.raises(RuntimeError):
+        await pool.acquire()
+
+
+def test_reset_runner_request_state_resets_tools_and_artifacts():
+    tool = _StatefulTool()
+    runner = _make_runner(tools=[tool])
+    runner.artifact_service.artifacts["app/u1/s1/file"] = []
+
+    reset_runner_request_state(runner)
+
+    assert tool.resets == 1
+    assert runner.artifact_service.artifacts == {}
+
+
+def test_get_runner_pool_config_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("KAGENT_RUNNER_POOL_SIZE", raising=False)
+    assert get_runner_pool_config() is None
+
+    monkeypatch.setenv("KAGENT_RUNNER_POOL_SIZE", "0")
+    assert get_runner_pool_config() is None
+
+
+def test_get_runner_pool_config_from_env(monkeypatch):
+    monkeypatch.setenv("KAGENT_RUNNER_POOL_SIZE", "8")
+    monkeypatch.setenv("KAGENT_RUNNER_POOL_IDLE_TTL_SECONDS", "60")
+    monkeypatch.setenv("KAGENT_RUNNER_POOL_MAX_USES", "100")
+
+    config = get_runner_pool_config()
+
+    assert config == RunnerPoolConfig(max_size=8, idle_ttl_seconds=60.0, max_uses=100)
+
+
+@pytest.mark.asyncio
+async def test_executor_without_pool_closes_runner_per_request():
+    executor = A2aAgentExecutor(runner=lambda: None)
+    runner = MagicMock()
+    closed = []
+
+    async def _safe_close(r):
+        closed.append(r)
+
+    executor._safe_close_runner = _safe_close
+    await executor._release_runner(runner, reusable=True)
+
+    assert closed == [runner]
+
+
+@pytest.mark.asyncio
+async def test_executor_with_pool_reuses_runner():
+    runners = []
+
+    def factory():
+        from google.adk.runners import Runner
+
+        runner = MagicMock(spec=Runner)
+        runner.agent = Agent(name="test_agent", model="gemini-2.0-flash")
+        runner.artifact_service = InMemoryArtifactService()
+        runners.append(runner)
+        return runner
+
+    executor = A2aAgentExecutor(
+        runner=factory,
+        config=A2aAgentExecutorConfig(runner_pool=RunnerPoolConfig()),
+    )
+
+    first = await executor._acquire_runner()
+    await executor._release_runner(first, reusable=True)
+    second = await executor._acquire_runner()
+
+    assert second is first
+    assert len(runners) == 1
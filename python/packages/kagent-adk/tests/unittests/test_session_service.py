@@ -1,12 +1,15 @@
 """Tests for KAgentSessionService."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
 from google.adk.events.event import Event, EventActions
+from google.adk.sessions import Session
+from google.adk.sessions.base_session_service import GetSessionConfig
 
-from kagent.adk._session_service import KAgentSessionService
+from kagent.adk._session_service import KAgentSessionService, _delta_fetch_after
 
 
 @pytest.fixture
@@ -164,3 +167,281 @@ async def test_get_session_multiple_state_deltas_applied_once(make_event, sessio
     assert session is not None
     assert session.state.get("key_a") == "value_a"
     assert session.state.get("key_b") == "value_b"
+
+
+def _stored(events: list[Event], start_second: int = 0) -> list[dict]:
+    """Stored event rows as returned by the API, with server-assigned created_at."""
+    return [
+        {"id": e.id, "data": e.model_dump_json(), "created_at": f"2025-01-01T00:00:{start_second + i:02d}.5+00:00"}
+        for i, e in enumerate(events)
+    ]
+
+
+def _sequenced_client(*pages: list[dict], status_codes: tuple[int, ...] = ()) -> MagicMock:
+    """Client whose successive GETs return the given event pages."""
+    responses = []
+    for i, page in enumerate(pages):
+        response = MagicMock(spec=httpx.Response)
+        response.status_code = status_codes[i] if i < len(status_codes) else 200
+        response.json.return_value = {"data": {"session": {"id": "s1", "user_id": "u1"}, "events": page}}
+        response.raise_for_status = MagicMock()
+        responses.append(response)
+    client = MagicMock(spec=httpx.AsyncClient)
+    client.get = AsyncMock(side_effect=responses)
+    post_response = MagicMock(spec=httpx.Response)
+    post_response.raise_for_status = MagicMock()
+    client.post = AsyncMock(return_value=post_response)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_session_fetches_only_new_events_when_cached(make_event):
+    """A cached session is refreshed with an `after` cursor and keeps earlier events and state."""
+    first = [make_event("user", state_delta={"a": 1}), make_event("assistant")]
+    later = [make_event("user", state_delta={"b": 2})]
+    client = _sequenced_client(_stored(first), _stored(later, start_second=2))
+    svc = KAgentSessionService(client, cache_size=8)
+
+    await svc.get_session(app_name="app", user_id="u1", session_id="s1")
+    session = await svc.get_session(app_name="app", user_id="u1", session_id="s1")
+
+    second_url = client.get.call_args_list[1].args[0]
+    # The cursor is moved back by CURSOR_OVERLAP_SECONDS
+    assert "&after=2024-12-31T23%3A59%3A56.500000%2B00%3A00" in second_url
+    assert [e.id for e in session.events] == [e.id for e in first + later]
+    assert session.state == {"a": 1, "b": 2}
+
+
+@pytest.mark.asyncio
+async def test_delta_fetch_keeps_events_committed_behind_the_cursor(make_event):
+    """Events fetched again in the overlap are skipped, late events with an older created_at are kept."""
+    first = [make_event("user"), make_event("assistant")]
+    late = make_event("tool", state_delta={"late": True})
+    # The overlap holds the cached events and one committed after them with a created_at between theirs
+    stored = _stored(first)
+    refetched = [
+        stored[0],
+        {"id": late.id, "data": late.model_dump_json(), "created_at": stored[0]["created_at"]},
+        stored[1],
+    ]
+    client = _sequenced_client(_stored(first), refetched)
+    svc = KAgentSessionService(client, cache_size=8)
+
+    await svc.get_session(app_name="app", user_id="u1", session_id="s1")
+    session = await svc.get_session(app_name="app", user_id="u1", session_id="s1")
+
+    assert [e.id for e in session.events] == [first[0].id, first[1].id, late.id]
+    assert session.state == {"late": True}
+
+
+def test_delta_fetch_after_parses_server_timestamps():
+    assert _delta_fetch_after("2025-01-01T00:00:10Z") == "2025-01-01T00:00:05+00:00"
+    assert _delta_fetch_after("2025-01-01T00:00:10.123456789Z") == "2025-01-01T00:00:05.123456+00:00"
+    assert _delta_fetch_after("2025-01-01T02:00:10.5+02:00") == "2025-01-01T02:00:05.500000+02:00"
+    assert _delta_fetch_after("yesterday") is None
+
+
+@pytest.mark.asyncio
+async def test_appended_events_are_not_duplicated_by_delta_fetch(make_event):
+    """Events appended by this process are cached and skipped when the server returns them again."""
+    stored = [make_event("user")]
+    appended = make_event("assistant", state_delta={"k": "v"})
+    client = _sequenced_client(_stored(stored), _stored([appended], start_second=1))
+    svc = KAgentSessionService(client, cache_size=8)
+
+    session = await svc.get_session(app_name="app", user_id="u1", session_id="s1")
+    await svc.append_event(session, appended)
+    reloaded = await svc.get_session(app_name="app", user_id="u1", session_id="s1")
+
+    assert [e.id for e in reloaded.events] == [stored[0].id, appended.id]
+    assert reloaded.state == {"k": "v"}
+
+
+@pytest.mark.asyncio
+async def test_cached_session_state_is_copied(make_event):
+    """Mutating a returned session's state does not leak into the cache."""
+    client = _sequenced_client(_stored([make_event("user", state_delta={"a": 1})]), [])
+    svc = KAgentSessionService(client, cache_size=8)
+
+    session = await svc.get_session(app_name="app", user_id="u1", session_id="s1")
+    session.state["a"] = 99
+    reloaded = await svc.get_session(app_name="app", user_id="u1", session_id="s1")
+
+    assert reloaded.state == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_deleted_session_is_evicted_from_cache(make_event):
+    """A 404 on refresh drops the cached session."""
+    client = _sequenced_client(_stored([make_event("user")]), [], _stored([]), status_codes=(200, 404, 200))
+    svc = KAgentSessionService(client, cache_size=8)
+
+    await svc.get_session(app_name="app", user_id="u1", session_id="s1")
+    assert await svc.get_session(app_name="app", user_id="u1", session_id="s1") is None
+
+    await svc.get_session(app_name="app", user_id="u1", session_id="s1")
+    assert "&after=" not in client.get.call_args_list[2].args[0]
+
+
+@pytest.mark.asyncio
+async def test_get_session_num_recent_events_without_cache_uses_limit(make_event):
+    """A limited load of an uncached session passes the limit to the API and does not prime the cache."""
+    client = _sequenced_client(_stored([make_event("user")]), _stored([make_event("user")]))
+    svc = KAgentSessionService(client, cache_size=8)
+
+    await svc.get_session(app_name="app", user_id="u1", session_id="s1", config=GetSessionConfig(num_recent_events=5))
+    await svc.get_session(app_name="app", user_id="u1", session_id="s1")
+
+    assert "&limit=5" in client.get.call_args_list[0].args[0]
+    assert "&after=" not in client.get.call_args_list[1].args[0]
+
+
+@pytest.mark.asyncio
+async def test_get_session_after_timestamp_filters_events(make_event):
+    """after_timestamp keeps only events at or after the timestamp."""
+    old, new = make_event("user"), make_event("assistant")
+    old.timestamp, new.timestamp = 100.0, 200.0
+    svc = KAgentSessionService(_sequenced_client(_stored([old, new])), cache_size=8)
+
+    session = await svc.get_session(
+        app_name="app", user_id="u1", session_id="s1", config=GetSessionConfig(after_timestamp=150.0)
+    )
+
+    assert [e.id for e in session.events] == [new.id]
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_always_fetches_full_history(make_event):
+    """With a cache size of 0 every load fetches the full history."""
+    events = _stored([make_event("user")])
+    client = _sequenced_client(events, events)
+    svc = KAgentSessionService(client, cache_size=0)
+
+    await svc.get_session(app_name="app", user_id="u1", session_id="s1")
+    session = await svc.get_session(app_name="app", user_id="u1", session_id="s1")
+
+    assert "&after=" not in client.get.call_args_list[1].args[0]
+    assert len(session.events) == 1
+
+
+def _post_client(*status_codes: int) -> MagicMock:
+    """Client whose successive POSTs return the given status codes (then 201)."""
+    responses = []
+    for status_code in status_codes:
+        response = MagicMock(spec=httpx.Response)
+        response.status_code = status_code
+        if status_code >= 400:
+            response.raise_for_status = MagicMock(
+                side_effect=httpx.HTTPStatusError("error", request=MagicMock(), response=response)
+            )
+        else:
+            response.raise_for_status = MagicMock()
+        responses.append(response)
+    default = MagicMock(spec=httpx.Response)
+    default.status_code = 201
+    default.raise_for_status = MagicMock()
+
+    client = MagicMock(spec=httpx.AsyncClient)
+    client.post = AsyncMock(side_effect=lambda *args, **kwargs: responses.pop(0) if responses else default)
+    return client
+
+
+def _session() -> Session:
+    return Session(id="s1", user_id="u1", app_name="app")
+
+
+@pytest.mark.asyncio
+async def test_appended_events_are_flushed_in_one_batch(make_event):
+    """Events appended during a turn are persisted by a single batch request at the barrier."""
+    client = _post_client()
+    svc = KAgentSessionService(client, cache_size=8, batch_events=True, flush_interval_seconds=60)
+    session = _session()
+    events = [make_event("user"), make_event("assistant"), make_event("tool")]
+
+    for event in events:
+        await svc.append_event(session, event)
+    assert client.post.await_count == 0
+    assert [e.id for e in session.events] == [e.id for e in events]
+
+    await svc.flush_session_events(session)
+
+    client.post.assert_awaited_once()
+    assert client.post.call_args.args[0] == "/api/sessions/s1/events/batch?user_id=u1"
+    assert [e["id"] for e in client.post.call_args.kwargs["json"]["events"]] == [e.id for e in events]
+
+
+@pytest.mark.asyncio
+async def test_buffered_events_flushed_after_interval(make_event):
+    """Buffered events are written in the background without an explicit barrier."""
+    client = _post_client()
+    svc = KAgentSessionService(client, cache_size=8, batch_events=True, flush_interval_seconds=0)
+
+    await svc.append_event(_session(), make_event("user"))
+    await asyncio.sleep(0.01)
+
+    assert client.post.call_args.args[0] == "/api/sessions/s1/events?user_id=u1"
+
+
+@pytest.mark.asyncio
+async def test_get_session_flushes_pending_events_first(make_event, session_response):
+    """Loading a session persists its buffered events before reading."""
+    event = make_event("user")
+    client = _post_client()
+    order = []
+    client.post.side_effect = lambda *args, **kwargs: order.append("post") or MagicMock(status_code=201)
+    get_response = MagicMock(spec=httpx.Response, status_code=200)
+    get_response.json.return_value = session_response([event])
+    client.get = AsyncMock(side_effect=lambda *args, **kwargs: order.append("get") or get_response)
+    svc = KAgentSessionService(client, cache_size=8, batch_events=True, flush_interval_seconds=60)
+
+    await svc.append_event(_session(), event)
+    await svc.get_session(app_name="app", user_id="u1", session_id="s1")
+
+    assert order == ["post", "get"]
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_events_for_retry(make_event):
+    """A failed batch stays buffered and is retried as a whole at the next barrier."""
+    client = _post_client(500)
+    svc = KAgentSessionService(client, cache_size=8, batch_events=True, flush_interval_seconds=60)
+    session = _session()
+    await svc.append_event(session, make_event("user"))
+    await svc.append_event(session, make_event("assistant"))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await svc.flush_session_events(session)
+    await svc.flush_session_events(session)
+
+    assert client.post.await_count == 2
+    assert len(client.post.call_args.kwargs["json"]["events"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_single_event_endpoint(make_event):
+    """Servers without the batch endpoint get one request per event."""
+    client = _post_client(404)
+    svc = KAgentSessionService(client, cache_size=8, batch_events=True, flush_interval_seconds=60)
+    session = _session()
+    for author in ("user", "assistant", "tool"):
+        await svc.append_event(session, make_event(author))
+
+    await svc.flush_session_events(session)
+    await svc.append_event(session, make_event("user"))
+    await svc.append_event(session, make_event("assistant"))
+    await svc.flush_session_events(session)
+
+    urls = [call.args[0] for call in client.post.call_args_list]
+    assert urls[0] == "/api/sessions/s1/events/batch?user_id=u1"
+    assert urls[1:] == ["/api/sessions/s1/events?user_id=u1"] * 5
+
+
+@pytest.mark.asyncio
+async def test_batching_disabled_posts_each_event(make_event):
+    """Without batching each appended event is persisted before append_event returns."""
+    client = _post_client()
+    svc = KAgentSessionService(client, cache_size=8, batch_events=False)
+
+    await svc.append_event(_session(), make_event("user"))
+
+    client.post.assert_awaited_once()
@@ -1,13 +1,84 @@
 import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
 import httpx
 from a2a.server.tasks import TaskStore
-from a2a.types import Message, Task
+from a2a.types import Artifact, Message, Task, TaskState
 from pydantic import BaseModel
 from typing_extensions import override
 
 from kagent.core.a2a import read_metadata_value
 
+logger = logging.getLogger(__name__)
+
+TASK_SAVE_DEBOUNCE_ENV_VAR = "KAGENT_TASK_SAVE_DEBOUNCE_SECONDS"
+DEFAULT_TASK_SAVE_DEBOUNCE_SECONDS = 0.25
+TASK_CACHE_SIZE_ENV_VAR = "KAGENT_TASK_CACHE_SIZE"
+DEFAULT_TASK_CACHE_SIZE = 256
+TASK_CACHE_TTL_ENV_VAR = "KAGENT_TASK_CACHE_TTL_SECONDS"
+# Other replicas may update a task at any time and the task store protocol has
+# no invalidation, so a cached task is only trusted for this long unless this
+# process still has a save of it pending.
+DEFAULT_TASK_CACHE_TTL_SECONDS = 1.0
+
+# Saves of tasks in these states may be delayed and coalesced with later saves.
+# Any other state (terminal, input or auth required) is persisted immediately.
+_DEBOUNCED_STATES = frozenset({TaskState.submitted, TaskState.working})
+_TERMINAL_STATES = frozenset({TaskState.completed, TaskState.canceled, TaskState.failed, TaskState.rejected})
+# Save bookkeeping kept for persisted tasks that have not reached a terminal
+# state. Beyond this, the least recently saved ones are evicted when a save is
+# flushed, and their next save uploads the full task.
+_MAX_IDLE_SAVE_STATES = 1024
+
+
+def get_task_save_debounce_seconds() -> float:
+    """Get the delay used to coalesce task saves from KAGENT_TASK_SAVE_DEBOUNCE_SECONDS.
+
+    A value of 0 persists every save immediately.
+    """
+    value = os.getenv(TASK_SAVE_DEBOUNCE_ENV_VAR)
+    if not value:
+        return DEFAULT_TASK_SAVE_DEBOUNCE_SECONDS
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        logger.warning(
+            f"Invalid {TASK_SAVE_DEBOUNCE_ENV_VAR} value: {value}, using default {DEFAULT_TASK_SAVE_DEBOUNCE_SECONDS}"
+        )
+        return DEFAULT_TASK_SAVE_DEBOUNCE_SECONDS
+
+
+def get_task_cache_size() -> int:
+    """Number of tasks cached in-process by the task store (KAGENT_TASK_CACHE_SIZE, 0 disables)."""
+    value = os.getenv(TASK_CACHE_SIZE_ENV_VAR)
+    if not value:
+        return DEFAULT_TASK_CACHE_SIZE
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Invalid {TASK_CACHE_SIZE_ENV_VAR} value: {value}, using default {DEFAULT_TASK_CACHE_SIZE}")
+        return DEFAULT_TASK_CACHE_SIZE
+
+
+def get_task_cache_ttl_seconds() -> float:
+    """Get how long a cached task is served without a pending save from KAGENT_TASK_CACHE_TTL_SECONDS."""
+    value = os.getenv(TASK_CACHE_TTL_ENV_VAR)
+    if not value:
+        return DEFAULT_TASK_CACHE_TTL_SECONDS
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        logger.warning(
+            f"Invalid {TASK_CACHE_TTL_ENV_VAR} value: {value}, using default {DEFAULT_TASK_CACHE_TTL_SECONDS}"
+        )
+        return DEFAULT_TASK_CACHE_TTL_SECONDS
+
 
 class KAgentTaskResponse(BaseModel):
     """Wrapper for KAgent controller API responses.
@@ -22,20 +93,138 @@ class KAgentTaskResponse(BaseModel):
     message: str | None = None
 
 
+# (history length, last message id, artifacts) of a task at the time it is uploaded.
+# The task keeps being updated while an upload is in flight, so this is taken up front.
+_PersistedSnapshot = tuple[int, Optional[str], dict[str, tuple[Artifact, int]]]
+
+
+def _snapshot(task: Task) -> _PersistedSnapshot:
+    history = task.history or []
+    return (
+        len(history),
+        history[-1].message_id if history else None,
+        {artifact.artifact_id: (artifact, len(artifact.parts)) for artifact in task.artifacts or []},
+    )
+
+
+@dataclass
+class _TaskSaveState:
+    """Save bookkeeping of one task: the pending save and what is already persisted."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Latest task passed to save() that is not persisted yet
+    pending: Optional[Task] = None
+    flush_task: Optional[asyncio.Task] = None
+    persisted: bool = False
+    history_length: int = 0
+    last_message_id: Optional[str] = None
+    # artifact id -> (artifact object, number of parts) as last persisted; a2a
+    # appends streamed chunks to the parts of the existing artifact object
+    artifacts: dict[str, tuple[Artifact, int]] = field(default_factory=dict)
+
+    def history_delta(self, task: Task) -> Optional[list[Message]]:
+        """History entries added since the last save, or None if the persisted prefix changed."""
+        history = task.history or []
+        if len(history) < self.history_length:
+            return None
+        if self.history_length and history[self.history_length - 1].message_id != self.last_message_id:
+            return None
+        return history[self.history_length :]
+
+    def artifacts_delta(self, task: Task) -> Optional[list[Artifact]]:
+        """Artifacts added or changed since the last save, or None if one was removed."""
+        artifacts = task.artifacts or []
+        if not set(self.artifacts) <= {artifact.artifact_id for artifact in artifacts}:
+            return None
+        changed = []
+        for artifact in artifacts:
+            persisted = self.artifacts.get(artifact.artifact_id)
+            if persisted is None or persisted[0] is not artifact or persisted[1] != len(artifact.parts):
+                changed.append(artifact)
+        return changed
+
+    def mark_persisted(self, snapshot: _PersistedSnapshot) -> None:
+        self.persisted = True
+        self.history_length, self.last_message_id, self.artifacts = snapshot
+
+    def is_idle(self) -> bool:
+        """Whether no save of the task is pending, in flight or scheduled."""
+        return self.pending is None and not self.lock.locked() and (self.flush_task is None or self.flush_task.done())
+
+
 class KAgentTaskStore(TaskStore):
     """
     A task store that persists A2A tasks to KAgent via REST API.
+
+    Saves of running tasks are coalesced: a save is delayed by
+    ``save_debounce_seconds`` and only the latest state of the task is
+    persisted. Tasks reaching any other state, such as a terminal or an
+    input-required state, are persisted before ``save`` returns. Once a task
+    has been stored, later saves only upload the history entries and
+    artifacts that changed since, falling back to uploading the full task
+    when the server cannot apply the delta.
+
+    Recently saved or loaded tasks are kept in a bounded in-process LRU cache
+    that ``get`` reads through. A cached task is served while this store has
+    a save of it pending, and otherwise only for ``cache_ttl_seconds`` after it
+    was cached, since another replica may have updated it since. Like
+    ``InMemoryTaskStore``, cached task objects are returned as is rather than
+    copied.
     """
 
-    def __init__(self, client: httpx.AsyncClient):
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        save_debounce_seconds: Optional[float] = None,
+        cache_size: Optional[int] = None,
+        max_idle_saves: int = _MAX_IDLE_SAVE_STATES,
+        cache_ttl_seconds: Optional[float] = None,
+    ):
         """Initialize the task store.
 
         Args:
             client: HTTP client configured with KAgent base URL
+            save_debounce_seconds: Delay used to coalesce saves of running tasks.
+                Defaults to KAGENT_TASK_SAVE_DEBOUNCE_SECONDS; 0 saves immediately.
+            cache_size: Maximum number of cached tasks. Defaults to
+                KAGENT_TASK_CACHE_SIZE; 0 disables the cache.
+            max_idle_saves: Maximum number of unfinished tasks whose save bookkeeping
+                is kept for delta uploads.
+            cache_ttl_seconds: How long a cached task without a pending save is served.
+                Defaults to KAGENT_TASK_CACHE_TTL_SECONDS.
         """
         self.client = client
         # Event-based sync: track pending save operations
         self._save_events: dict[str, asyncio.Event] = {}
+        self._save_debounce_seconds = (
+            get_task_save_debounce_seconds() if save_debounce_seconds is None else save_debounce_seconds
+        )
+        # Ordered from least to most recently flushed
+        self._saves: dict[str, _TaskSaveState] = {}
+        self._max_idle_saves = max_idle_saves
+        # Cleared if the server predates delta uploads
+        self._delta_supported = True
+        self._cache_size = get_task_cache_size() if cache_size is None else cache_size
+        self._cache_ttl_seconds = get_task_cache_ttl_seconds() if cache_ttl_seconds is None else cache_ttl_seconds
+        # task id -> (task, time.monotonic() when cached)
+        self._cache: OrderedDict[str, tuple[Task, float]] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def lifespan(self):
+        """Returns an async context manager that persists pending saves on shutdown."""
+
+        @asynccontextmanager
+        async def _lifespan(app: Any):
+            try:
+                yield
+            finally:
+                try:
+                    await self.flush()
+                except Exception as e:
+                    logger.error("Failed to persist pending task saves on shutdown: %s", e)
+
+        return _lifespan
 
     def _is_partial_event(self, item: Message) -> bool:
         """Check if a history item is a partial ADK streaming event."""
@@ -50,9 +239,9 @@ class KAgentTaskStore(TaskStore):
     async def save(self, task: Task, context=None) -> None:
         """Save a task to KAgent.
 
-        Skips saving if the current event is a partial streaming chunk.
-        The adk_partial flag is set on event.metadata by AgentExecutor and
-        gets copied to task.metadata by TaskManager.
+        Partial streaming events are removed from the task history first.
+        While the task is submitted or working, the save may be coalesced with
+        later saves of the same task and persisted in the background.
 
         Args:
             task: The task to save
@@ -61,16 +250,119 @@ class KAgentTaskStore(TaskStore):
         Raises:
             httpx.HTTPStatusError: If the API request fails
         """
-        # Clean any partial events from history before saving
+        state = self._saves.setdefault(task.id, _TaskSaveState())
+
+        # Clean any partial events from history before saving; entries that were
+        # already persisted have been cleaned before
         history = task.history or []
-        task.history = self._clean_partial_events(history)
+        start = state.history_length if state.history_delta(task) is not None else 0
+        if any(self._is_partial_event(item) for item in history[start:]):
+            task.history = history[:start] + self._clean_partial_events(history[start:])
+
+        state.pending = task
+        self._cache_task(task)
+        if (
+            self._save_debounce_seconds <= 0
+            or task.status.state not in _DEBOUNCED_STATES
+            or task.id in self._save_events
+        ):
+            await self._flush_save(task.id)
+            return
+        if state.flush_task is None or state.flush_task.done():
+            state.flush_task = asyncio.create_task(self._flush_later(task.id))
+
+    async def flush(self) -> None:
+        """Persist the pending save of every task."""
+        errors = []
+        for task_id in list(self._saves):
+            try:
+                await self._flush_save(task_id)
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            raise errors[0]
+
+    async def _flush_later(self, task_id: str) -> None:
+        state = self._saves.get(task_id)
+        # Saves made while an upload is in flight are picked up by the next round
+        while state is not None and state.pending is not None:
+            await asyncio.sleep(self._save_debounce_seconds)
+            try:
+                await self._flush_save(task_id)
+            except Exception as e:
+                # The save stays pending; the next save or flush retries and surfaces the error
+                logger.warning("Failed to save task %s: %s", task_id, e)
+                return
+
+    async def _flush_save(self, task_id: str) -> None:
+        state = self._saves.get(task_id)
+        if state is None:
+            return
+        async with state.lock:
+            task = state.pending
+            if task is None:
+                return
+            state.pending = None
+            try:
+                await self._upload(task, state)
+            except BaseException:
+                if state.pending is None:
+                    state.pending = task
+                raise
+            if state.pending is None and self._saves.get(task_id) is state:
+                # Tasks that never reach a terminal state, e.g. abandoned while
+                # input is required, must not keep their bookkeeping forever
+                del self._saves[task_id]
+                if task.status.state not in _TERMINAL_STATES:
+                    self._evict_idle_saves()
+                    self._saves[task_id] = state
 
+        # Signal that save completed (event-based sync)
+        if task_id in self._save_events:
+            self._save_events[task_id].set()
+
+    def _evict_idle_saves(self) -> None:
+        """Drop the bookkeeping of the least recently saved idle tasks beyond the limit."""
+        excess = len(self._saves) + 1 - self._max_idle_saves
+        for task_id, state in list(self._saves.items()):
+            if excess <= 0:
+                break
+            if state.is_idle():
+                del self._saves[task_id]
+                excess -= 1
+
+    async def _upload(self, task: Task, state: _TaskSaveState) -> None:
+        snapshot = _snapshot(task)
+        if self._delta_supported and state.persisted and await self._upload_delta(task, state):
+            state.mark_persisted(snapshot)
+            return
+        snapshot = _snapshot(task)
         response = await self.client.post("/api/tasks", json=task.model_dump(mode="json"))
         response.raise_for_status()
+        state.mark_persisted(snapshot)
 
-        # Signal that save completed (event-based sync)
-        if task.id in self._save_events:
-            self._save_events[task.id].set()
+    async def _upload_delta(self, task: Task, state: _TaskSaveState) -> bool:
+        """Upload only what changed since the last save. Returns False if a full upload is needed."""
+        history = state.history_delta(task)
+        artifacts = state.artifacts_delta(task)
+        if history is None or artifacts is None:
+            return False
+        data = task.model_dump(mode="json", exclude={"history", "artifacts"})
+        data["history"] = [message.model_dump(mode="json") for message in history]
+        data["artifacts"] = [artifact.model_dump(mode="json") for artifact in artifacts]
+        response = await self.client.patch(
+            f"/api/tasks/{task.id}",
+            json={"task": data, "historyLength": state.history_length},
+        )
+        if response.status_code == 405:
+            logger.info("Task delta updates not supported by the server, saving full tasks")
+            self._delta_supported = False
+            return False
+        if response.status_code in (404, 409):
+            # The stored task is missing or differs from what this store last saved
+            return False
+        response.raise_for_status()
+        return True
 
     @override
     async def get(self, task_id: str, context=None) -> Task | None:
@@ -86,6 +378,15 @@ class KAgentTaskStore(TaskStore):
         Raises:
             httpx.HTTPStatusError: If the API request fails (except 404)
         """
+        task = self._cached_task(task_id)
+        if task is not None:
+            self.cache_hits += 1
+            return task
+        self.cache_misses += 1
+
+        # Make sure a coalesced save is visible to the read
+        await self._flush_save(task_id)
+
         response = await self.client.get(f"/api/tasks/{task_id}")
         if response.status_code == 404:
             return None
@@ -93,6 +394,8 @@ class KAgentTaskStore(TaskStore):
 
         # Unwrap the StandardResponse envelope from the Go controller
         wrapped = KAgentTaskResponse.model_validate(response.json())
+        if wrapped.data is not None:
+            self._cache_task(wrapped.data)
         return wrapped.data
 
     @override
@@ -106,9 +409,34 @@ class KAgentTaskStore(TaskStore):
         Raises:
             httpx.HTTPStatusError: If the API request fails
         """
+        self._cache.pop(task_id, None)
+        state = self._saves.pop(task_id, None)
+        if state is not None and state.flush_task is not None:
+            state.flush_task.cancel()
         response = await self.client.delete(f"/api/tasks/{task_id}")
         response.raise_for_status()
 
+    def _cached_task(self, task_id: str) -> Optional[Task]:
+        entry = self._cache.get(task_id)
+        if entry is None:
+            return None
+        task, cached_at = entry
+        state = self._saves.get(task_id)
+        if (state is None or state.is_idle()) and time.monotonic() - cached_at >= self._cache_ttl_seconds:
+            # Nothing of this process is left to persist, so the stored task may be newer
+            del self._cache[task_id]
+            return None
+        self._cache.move_to_end(task_id)
+        return task
+
+    def _cache_task(self, task: Task) -> None:
+        if self._cache_size <= 0:
+            return
+        self._cache[task.id] = (task, time.monotonic())
+        self._cache.move_to_end(task.id)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
     async def wait_for_save(self, task_id: str, timeout: float = 5.0) -> None:
         """Wait for a task to be saved (event-based sync).
 
@@ -126,6 +454,11 @@ class KAgentTaskStore(TaskStore):
         event = asyncio.Event()
         self._save_events[task_id] = event
         try:
+            state = self._saves.get(task_id)
+            if state is not None and state.pending is not None:
+                # A coalesced save is pending; persist it now rather than after the delay
+                await asyncio.wait_for(self._flush_save(task_id), timeout=timeout)
+                return
             await asyncio.wait_for(event.wait(), timeout=timeout)
         finally:
             # Clean up the event
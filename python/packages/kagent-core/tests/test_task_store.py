@@ -0,0 +1,279 @@
+"""Tests for KAgentTaskStore save coalescing, delta uploads and caching."""
+
+import json
+
+import httpx
+import pytest
+from a2a.types import Artifact, Message, Part, Role, Task, TaskState, TaskStatus, TextPart
+
+from kagent.core.a2a import KAgentTaskStore
+from kagent.core.a2a._task_store import (
+    get_task_cache_size,
+    get_task_cache_ttl_seconds,
+    get_task_save_debounce_seconds,
+)
+
+
+class _Server:
+    """Records task store requests and answers them with configurable status codes."""
+
+    def __init__(self, patch_status: int = 200):
+        self.requests: list[tuple[str, str, dict]] = []
+        self.patch_status = patch_status
+        self.tasks: dict[str, dict] = {}
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content) if request.content else {}
+        self.requests.append((request.method, request.url.path, body))
+        if request.method == "PATCH":
+            return httpx.Response(self.patch_status, json={"error": False})
+        if request.method == "GET":
+            task_id = request.url.path.rsplit("/", 1)[-1]
+            if task_id not in self.tasks:
+                return httpx.Response(404)
+            return httpx.Response(200, json={"error": False, "data": self.tasks[task_id]})
+        return httpx.Response(200, json={"error": False})
+
+    def calls(self) -> list[tuple[str, str]]:
+        return [(method, path) for method, path, _ in self.requests]
+
+
+def _store(server: _Server, save_debounce_seconds: float = 60, cache_size: int = 0, **kwargs) -> KAgentTaskStore:
+    client = httpx.AsyncClient(base_url="http://kagent", transport=httpx.MockTransport(server.handler))
+    return KAgentTaskStore(client, save_debounce_seconds=save_debounce_seconds, cache_size=cache_size, **kwargs)
+
+
+def _message(message_id: str, partial: bool = False) -> Message:
+    return Message(
+        message_id=message_id,
+        role=Role.agent,
+        parts=[Part(root=TextPart(text=message_id))],
+        metadata={"kagent_adk_partial": True} if partial else None,
+    )
+
+
+def _task(state: TaskState = TaskState.working, history=None) -> Task:
+    return Task(id="t1", context_id="c1", status=TaskStatus(state=state), history=history or [])
+
+
+@pytest.mark.asyncio
+async def test_running_task_saves_are_coalesced():
+    server = _Server()
+    store = _store(server)
+    task = _task(history=[_message("m1")])
+
+    await store.save(task)
+    task.history.append(_message("m2"))
+    await store.save(task)
+    assert server.requests == []
+
+    await store.flush()
+
+    assert server.calls() == [("POST", "/api/tasks")]
+    assert [m["messageId"] for m in server.requests[0][2]["history"]] == ["m1", "m2"]
+
+
+@pytest.mark.asyncio
+async def test_terminal_state_is_persisted_before_save_returns():
+    server = _Server()
+    store = _store(server)
+    task = _task()
+    await store.save(task)
+
+    task.status = TaskStatus(state=TaskState.completed)
+    await store.save(task)
+
+    assert server.calls() == [("POST", "/api/tasks")]
+    assert server.requests[0][2]["status"]["state"] == "completed"
+    assert store._saves == {}
+
+
+@pytest.mark.asyncio
+async def test_later_saves_upload_only_the_delta():
+    server = _Server()
+    store = _store(server, save_debounce_seconds=0)
+    artifact = Artifact(artifact_id="a1", parts=[Part(root=TextPart(text="one"))])
+    task = _task(history=[_message("m1")])
+    task.artifacts = [artifact, Artifact(artifact_id="a2", parts=[Part(root=TextPart(text="two"))])]
+    await store.save(task)
+
+    task.history.append(_message("m2"))
+    artifact.parts.append(Part(root=TextPart(text="more")))
+    await store.save(task)
+
+    assert server.calls() == [("POST", "/api/tasks"), ("PATCH", "/api/tasks/t1")]
+    body = server.requests[1][2]
+    assert body["historyLength"] == 1
+    assert [m["messageId"] for m in body["task"]["history"]] == ["m2"]
+    assert [a["artifactId"] for a in body["task"]["artifacts"]] == ["a1"]
+    assert body["task"]["status"]["state"] == "working"
+
+
+@pytest.mark.asyncio
+async def test_unfinished_tasks_are_evicted_on_flush():
+    server = _Server()
+    store = _store(server, save_debounce_seconds=0, max_idle_saves=2)
+
+    for task_id in ["t1", "t2", "t3"]:
+        task = _task(state=TaskState.input_required)
+        task.id = task_id
+        await store.save(task)
+
+    assert list(store._saves) == ["t2", "t3"]
+
+    task = _task(state=TaskState.input_required, history=[_message("m1")])
+    await store.save(task)
+
+    # The evicted task's bookkeeping is gone, so it is uploaded in full again
+    assert server.calls()[-1] == ("POST", "/api/tasks")
+    assert list(store._saves) == ["t3", "t1"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("patch_status", [404, 405, 409])
+async def test_rejected_delta_falls_back_to_full_upload(patch_status):
+    server = _Server(patch_status=patch_status)
+    store = _store(server, save_debounce_seconds=0)
+    task = _task(history=[_message("m1")])
+    await store.save(task)
+
+    task.history.append(_message("m2"))
+    await store.save(task)
+
+    assert server.calls() == [("POST", "/api/tasks"), ("PATCH", "/api/tasks/t1"), ("POST", "/api/tasks")]
+    assert len(server.requests[2][2]["history"]) == 2
+    assert store._delta_supported is (patch_status != 405)
+
+
+@pytest.mark.asyncio
+async def test_partial_events_are_not_persisted():
+    server = _Server()
+    store = _store(server, save_debounce_seconds=0)
+    task = _task(history=[_message("m1"), _message("p1", partial=True)])
+
+    await store.save(task)
+
+    assert [m.message_id for m in task.history] == ["m1"]
+    assert [m["messageId"] for m in server.requests[0][2]["history"]] == ["m1"]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_save_persists_pending_save():
+    server = _Server()
+    store = _store(server)
+    await store.save(_task())
+
+    await store.wait_for_save("t1", timeout=1)
+
+    assert server.calls() == [("POST", "/api/tasks")]
+
+
+@pytest.mark.asyncio
+async def test_get_persists_pending_save_first():
+    server = _Server()
+    store = _store(server)
+    await store.save(_task())
+
+    assert await store.get("t1") is None
+
+    assert server.calls() == [("POST", "/api/tasks"), ("GET", "/api/tasks/t1")]
+
+
+@pytest.mark.asyncio
+async def test_get_reads_through_cache():
+    server = _Server()
+    server.tasks["t1"] = _task(history=[_message("m1")]).model_dump(mode="json")
+    store = _store(server, cache_size=8)
+
+    first = await store.get("t1")
+    second = await store.get("t1")
+
+    assert first is second
+    assert [m.message_id for m in first.history] == ["m1"]
+    assert server.calls() == [("GET", "/api/tasks/t1")]
+    assert (store.cache_hits, store.cache_misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_saved_task_is_served_from_cache_until_deleted():
+    server = _Server()
+    store = _store(server, save_debounce_seconds=0, cache_size=8)
+    task = _task(TaskState.completed)
+    await store.save(task)
+
+    assert await store.get("t1") is task
+    await store.delete("t1")
+    assert await store.get("t1") is None
+
+    assert server.calls() == [("POST", "/api/tasks"), ("DELETE", "/api/tasks/t1"), ("GET", "/api/tasks/t1")]
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used_task():
+    server = _Server()
+    store = _store(server, save_debounce_seconds=0, cache_size=2)
+    for task_id in ("t1", "t2"):
+        await store.save(Task(id=task_id, context_id="c1", status=TaskStatus(state=TaskState.completed)))
+    await store.get("t1")
+    await store.save(Task(id="t3", context_id="c1", status=TaskStatus(state=TaskState.completed)))
+
+    assert list(store._cache) == ["t1", "t3"]
+
+
+@pytest.mark.asyncio
+async def test_cached_task_expires_once_nothing_is_pending():
+    server = _Server()
+    store = _store(server, save_debounce_seconds=0, cache_size=8, cache_ttl_seconds=0)
+    await store.save(_task(TaskState.completed))
+    # Another replica updates the task
+    server.tasks["t1"] = _task(TaskState.completed, history=[_message("m1")]).model_dump(mode="json")
+
+    task = await store.get("t1")
+
+    assert [m.message_id for m in task.history] == ["m1"]
+    assert server.calls() == [("POST", "/api/tasks"), ("GET", "/api/tasks/t1")]
+
+
+@pytest.mark.asyncio
+async def test_cached_task_with_pending_save_does_not_expire():
+    server = _Server()
+    store = _store(server, cache_size=8, cache_ttl_seconds=0)
+    task = _task()
+    await store.save(task)
+
+    assert await store.get("t1") is task
+    assert server.calls() == []
+    await store.flush()
+
+
+def test_get_task_cache_size(monkeypatch):
+    monkeypatch.delenv("KAGENT_TASK_CACHE_SIZE", raising=False)
+    assert get_task_cache_size() == 256
+
+    monkeypatch.setenv("KAGENT_TASK_CACHE_SIZE", "0")
+    assert get_task_cache_size() == 0
+
+    monkeypatch.setenv("KAGENT_TASK_CACHE_SIZE", "many")
+    assert get_task_cache_size() == 256
+
+
+def test_get_task_cache_ttl_seconds(monkeypatch):
+    monkeypatch.delenv("KAGENT_TASK_CACHE_TTL_SECONDS", raising=False)
+    assert get_task_cache_ttl_seconds() == 1.0
+
+    monkeypatch.setenv("KAGENT_TASK_CACHE_TTL_SECONDS", "30")
+    assert get_task_cache_ttl_seconds() == 30.0
+
+    monkeypatch.setenv("KAGENT_TASK_CACHE_TTL_SECONDS", "soon")
+    assert get_task_cache_ttl_seconds() == 1.0
+
+
+def test_get_task_save_debounce_seconds(monkeypatch):
+    monkeypatch.delenv("KAGENT_TASK_SAVE_DEBOUNCE_SECONDS", raising=False)
+    assert get_task_save_debounce_seconds() == 0.25
+
+    monkeypatch.setenv("KAGENT_TASK_SAVE_DEBOUNCE_SECONDS", "0")
+    assert get_task_save_debounce_seconds() == 0.0
+
+    monkeypatch.setenv("KAGENT_TASK_SAVE_DEBOUNCE_SECONDS", "later")
+    assert get_task_save_debounce_seconds() == 0.25
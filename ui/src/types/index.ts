@@ -317,6 +317,7 @@ export interface ContextSummarizerConfig {
 
 export interface MemorySpec {
   modelConfig: string;
+  summarizerModelConfig?: string;
   ttlDays?: number;
 }
 